@@ -0,0 +1,345 @@
+import logging
+import threading
+import time
+
+from binance.websocket.events import Balance, Position
+
+# order statuses after which an order is no longer open
+FINAL_ORDER_STATUSES = ("FILLED", "CANCELED", "EXPIRED", "EXPIRED_IN_MATCH", "REJECTED")
+
+# tolerance of the amount comparisons of the reconciliation
+_EPSILON = 1e-9
+
+
+def _data(response):
+    # unwrap the responses of clients created with show_limit_usage or show_header
+    if isinstance(response, dict) and (
+        "limit_usage" in response or "header" in response
+    ):
+        return response["data"]
+    return response
+
+
+def _balance_from_rest(item):
+    return Balance(
+        {
+            "a": item["asset"],
+            "wb": item["walletBalance"],
+            "cw": item.get("crossWalletBalance", item["walletBalance"]),
+        }
+    )
+
+
+def _margin_type(item):
+    if "marginType" in item:
+        return item["marginType"]
+    # positionRisk v3 has no margin type, only isolated positions have an isolated margin
+    isolated = float(item.get("isolatedMargin") or 0) or float(
+        item.get("isolatedWallet") or 0
+    )
+    return "isolated" if isolated or item.get("isolated") else "cross"
+
+
+def _position_from_rest(item):
+    return Position(
+        {
+            "s": item["symbol"],
+            "pa": item["positionAmt"],
+            "ep": item.get("entryPrice", 0),
+            "cr": 0,
+            "up": item.get("unRealizedProfit", item.get("unrealizedProfit", 0)),
+            "mt": _margin_type(item),
+            "iw": item.get("isolatedWallet", 0),
+            "ps": item.get("positionSide", "BOTH"),
+        }
+    )
+
+
+class Order(object):
+    """An open order, from ``get_orders()`` or an ``OrderTradeUpdate`` event"""
+
+    __slots__ = (
+        "symbol",
+        "order_id",
+        "client_order_id",
+        "side",
+        "order_type",
+        "price",
+        "stop_price",
+        "quantity",
+        "filled_quantity",
+        "status",
+        "position_side",
+        "reduce_only",
+        "update_time",
+    )
+
+    @classmethod
+    def from_rest(cls, item):
+        order = cls()
+        order.symbol = item["symbol"]
+        order.order_id = item["orderId"]
+        order.client_order_id = item["clientOrderId"]
+        order.side = item["side"]
+        order.order_type = item["type"]
+        order.price = float(item["price"])
+        order.stop_price = float(item.get("stopPrice", 0))
+        order.quantity = float(item["origQty"])
+        order.filled_quantity = float(item["executedQty"])
+        order.status = item["status"]
+        order.position_side = item.get("positionSide", "BOTH")
+        order.reduce_only = item.get("reduceOnly", False)
+        order.update_time = item.get("updateTime")
+        return order
+
+    @classmethod
+    def from_event(cls, event):
+        order = cls()
+        order.symbol = event.symbol
+        order.order_id = event.order_id
+        order.client_order_id = event.client_order_id
+        order.side = event.side
+        order.order_type = event.order_type
+        order.price = event.price
+        order.stop_price = event.stop_price
+        order.quantity = event.quantity
+        order.filled_quantity = event.filled_quantity
+        order.status = event.status
+        order.position_side = event.position_side
+        order.reduce_only = event.reduce_only
+        order.update_time = event.transaction_time
+        return order
+
+    def __repr__(self):
+        return "Order({}, {}, {} {}@{}, {})".format(
+            self.symbol,
+            self.client_order_id,
+            self.side,
+            self.quantity,
+            self.price,
+            self.status,
+        )
+
+
+class AccountState(object):
+    """Local copy of the balances, positions and open orders of an account
+
+    Seeded once from ``account()``, ``get_position_risk()`` and ``get_orders()``, then kept up
+    to date by the ``ACCOUNT_UPDATE`` and ``ORDER_TRADE_UPDATE`` events of a
+    ``UserDataStream``, so that lookups are dict reads instead of signed requests. Every
+    ``reconcile_interval`` seconds the state is checked against the REST endpoints: the
+    differences are reported to ``on_divergence`` and the REST values kept. When seeding and
+    reconciling, entries updated by an event while the REST requests were in flight keep the
+    value of the event.
+
+    Args:
+        client (UMFutures or CMFutures): a client with an API key and secret
+    Keyword Args:
+        user_data_stream (UserDataStream, optional): the stream applied to the state. Call ``reconcile()`` from its ``on_reconnect`` to catch up with missed events
+        reconcile_interval (int, optional): seconds between two reconciliations in a daemon thread, None to disable them. By default, it's 300
+        on_divergence (callable, optional): called with the kind ("balance", "position" or "order"), the key, the local and the REST value of each difference
+    """
+
+    def __init__(
+        self,
+        client,
+        user_data_stream=None,
+        reconcile_interval=300,
+        on_divergence=None,
+        logger=None,
+    ):
+        if not logger:
+            logger = logging.getLogger(__name__)
+        self.logger = logger
+        self.client = client
+        self.on_divergence = on_divergence
+        self.balances = {}
+        # (symbol, position side) -> Position
+        self.positions = {}
+        # client order id -> Order
+        self.orders = {}
+        # start times of the REST fetches in flight, and the event times of the entries
+        # updated since the oldest of them
+        self._fetches = []
+        self._updated = {}
+        self._lock = threading.Lock()
+        self._stop = None
+
+        if user_data_stream is not None:
+            user_data_stream.add_listener(self.apply)
+        self.reload()
+        if reconcile_interval:
+            self._stop = threading.Event()
+            threading.Thread(
+                target=self._reconcile_loop,
+                args=(self._stop, reconcile_interval),
+                daemon=True,
+            ).start()
+
+    def stop(self):
+        if self._stop is not None:
+            self._stop.set()
+            self._stop = None
+
+    def balance(self, asset):
+        """wallet balance of ``asset``"""
+
+        balance = self.balances.get(asset)
+        return balance.wallet_balance if balance else 0.0
+
+    def position(self, symbol, position_side="BOTH"):
+        return self.positions.get((symbol, position_side))
+
+    def position_amount(self, symbol, position_side="BOTH"):
+        """signed position amount, negative when short"""
+
+        position = self.positions.get((symbol, position_side))
+        return position.position_amount if position else 0.0
+
+    def open_orders(self, symbol=None):
+        orders = list(self.orders.values())
+        if symbol is None:
+            return orders
+        return [order for order in orders if order.symbol == symbol]
+
+    def get_order(self, client_order_id):
+        return self.orders.get(client_order_id)
+
+    def reload(self):
+        """replace the state with the REST values, but for the entries updated by an event meanwhile"""
+
+        self._refresh(None)
+
+    def apply(self, event):
+        """apply an ``AccountUpdate`` or ``OrderTradeUpdate`` event, other events are ignored"""
+
+        event_type = getattr(event, "event_type", None)
+        with self._lock:
+            # only needed to merge the fetches in flight
+            updated = self._updated if self._fetches else {}
+            now = time.monotonic()
+            if event_type == "ACCOUNT_UPDATE":
+                for balance in event.balances:
+                    self.balances[balance.asset] = balance
+                    updated[("balance", balance.asset)] = now
+                for position in event.positions:
+                    key = (position.symbol, position.position_side)
+                    if position.position_amount == 0:
+                        self.positions.pop(key, None)
+                    else:
+                        self.positions[key] = position
+                    updated[("position", key)] = now
+            elif event_type == "ORDER_TRADE_UPDATE":
+                if event.status in FINAL_ORDER_STATUSES:
+                    self.orders.pop(event.client_order_id, None)
+                else:
+                    self.orders[event.client_order_id] = Order.from_event(event)
+                updated[("order", event.client_order_id)] = now
+
+    def reconcile(self):
+        """compare the state with the REST values, report the differences and fix them"""
+
+        divergences = []
+        self._refresh(divergences)
+        # reported once the lock is released, the callback may read the state
+        if self.on_divergence:
+            for divergence in divergences:
+                self.on_divergence(*divergence)
+
+    def _refresh(self, divergences):
+        with self._lock:
+            started = time.monotonic()
+            self._fetches.append(started)
+        try:
+            balances, positions, orders = self._fetch()
+        except Exception:
+            with self._lock:
+                self._end_fetch(started)
+            raise
+        with self._lock:
+            self.balances = self._merge(
+                "balance",
+                self.balances,
+                balances,
+                started,
+                divergences,
+                lambda b: b.wallet_balance,
+            )
+            self.positions = self._merge(
+                "position",
+                self.positions,
+                positions,
+                started,
+                divergences,
+                lambda p: p.position_amount,
+            )
+            self.orders = self._merge(
+                "order",
+                self.orders,
+                orders,
+                started,
+                divergences,
+                lambda o: (o.status, o.filled_quantity),
+            )
+            self._end_fetch(started)
+
+    def _end_fetch(self, started):
+        self._fetches.remove(started)
+        if not self._fetches:
+            self._updated = {}
+            return
+        oldest = min(self._fetches)
+        self._updated = {
+            key: updated for key, updated in self._updated.items() if updated >= oldest
+        }
+
+    def _merge(self, kind, local, remote, started, divergences, value):
+        merged = {}
+        for key in set(local) | set(remote):
+            if self._updated.get((kind, key), 0) >= started:
+                # changed by an event during the requests, newer than the REST value
+                if key in local:
+                    merged[key] = local[key]
+                continue
+            local_value = value(local[key]) if key in local else None
+            remote_value = value(remote[key]) if key in remote else None
+            if key in remote:
+                merged[key] = remote[key]
+            if divergences is not None and not self._same(local_value, remote_value):
+                self.logger.warning(
+                    "Account state diverged, {} {}: local {}, REST {}".format(
+                        kind, key, local_value, remote_value
+                    )
+                )
+                divergences.append((kind, key, local_value, remote_value))
+        return merged
+
+    @staticmethod
+    def _same(local_value, remote_value):
+        if isinstance(local_value, float) or isinstance(remote_value, float):
+            return abs((local_value or 0.0) - (remote_value or 0.0)) <= _EPSILON
+        return local_value == remote_value
+
+    def _fetch(self):
+        account = _data(self.client.account())
+        balances = {}
+        for item in account["assets"]:
+            balance = _balance_from_rest(item)
+            balances[balance.asset] = balance
+        positions = {}
+        for item in _data(self.client.get_position_risk()):
+            position = _position_from_rest(item)
+            if position.position_amount != 0:
+                positions[(position.symbol, position.position_side)] = position
+        orders = {}
+        for item in _data(self.client.get_orders()):
+            order = Order.from_rest(item)
+            orders[order.client_order_id] = order
+        return balances, positions, orders
+
+    def _reconcile_loop(self, stop, interval):
+        while not stop.wait(interval):
+            try:
+                self.reconcile()
+            except Exception as e:
+                self.logger.warning("Failed to reconcile account state: {}".format(e))
@@ -1,14 +1,31 @@
 import json
 import logging
+import socket
+import threading
+import time
 from json import JSONDecodeError
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from .__version__ import __version__
 from binance.error import ClientError, ServerError
 from binance.lib.utils import get_timestamp
+from binance.lib.utils import json_loads as default_json_loads
 from binance.lib.utils import cleanNoneValue
 from binance.lib.utils import encoded_string
 from binance.lib.utils import check_required_parameter
-from binance.lib.authentication import hmac_hashing, rsa_signature
+from binance.lib.utils import new_client_order_id
+from binance.lib.authentication import hmac_signature, new_hmac
+from binance.lib.authentication import load_private_key, private_key_signature
+
+# endpoints returning every symbol when called without one, with the number of per-symbol
+# calls from which the all-symbols call costs no more request weight
+ALL_SYMBOLS_ENDPOINTS = {
+    ("binance.um_futures.market", "mark_price"): 2,
+    ("binance.um_futures.market", "ticker_price"): 2,
+    ("binance.um_futures.market", "book_ticker"): 3,
+    ("binance.um_futures.market", "ticker_24hr_price_change"): 40,
+}
 
 
 class API(object):
@@ -20,6 +37,15 @@ class API(object):
         proxies (obj, optional): Dictionary mapping protocol to the URL of the proxy. e.g. {'https': 'http://1.2.3.4:8080'}
         show_limit_usage (bool, optional): whether return limit usage(requests and/or orders). By default, it's False
         show_header (bool, optional): whether return the whole response header. By default, it's False
+        rate_limiter (RateLimiter, optional): client side weight/order limiter, see ``binance.lib.rate_limiter``. By default, requests are not throttled
+        retry_policy (RetryPolicy, optional): retry policy for failed requests, see ``binance.lib.retry``. By default, errors are raised immediately
+        pool_connections (int, optional): the number of hosts to keep connection pools for. By default, it's 10
+        pool_maxsize (int, optional): the max number of connections kept open per host, set it to at least the number of threads sharing the client. By default, it's 10
+        socket_options (list, optional): socket options of the connections, as (level, option, value). By default, TCP_NODELAY and SO_KEEPALIVE are enabled
+        cache (ResponseCache, optional): cache of GET responses with a TTL per endpoint, see ``binance.lib.cache``. By default, nothing is cached
+        json_loads (callable, optional): the JSON decoder of the responses, called with bytes. By default, orjson or ujson if installed, else the json module
+        raw_response (bool, optional): whether return the raw response body as bytes, for callers decoding it themselves. By default, it's False
+        time_sync_interval (int, optional): calibrate the offset to the server clock used to sign requests, then re-sync it every that many seconds in the background. By default, the local clock is used as is
     """
 
     def __init__(
@@ -33,6 +59,15 @@ class API(object):
         show_header=False,
         private_key=None,
         private_key_passphrase=None,
+        rate_limiter=None,
+        retry_policy=None,
+        pool_connections=10,
+        pool_maxsize=10,
+        socket_options=None,
+        cache=None,
+        json_loads=None,
+        raw_response=False,
+        time_sync_interval=None,
     ):
         self.key = key
         self.secret = secret
@@ -42,7 +77,26 @@ class API(object):
         self.proxies = None
         self.private_key = private_key
         self.private_key_pass = private_key_passphrase
+        # parsed key objects, along with the key they were built from
+        self._signing_key = (None, None)
+        self._keyed_hmac = (None, None)
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.cache = cache
+        self.json_loads = json_loads or default_json_loads
+        self.raw_response = raw_response
+        self.time_offset = 0
+        self.time_sync_interval = None
+        self._time_sync_stop = None
+        self.pool_maxsize = pool_maxsize
         self.session = requests.Session()
+        adapter = SocketOptionsAdapter(
+            socket_options=socket_options,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self.session.headers.update(
             {
                 "Content-Type": "application/json;charset=utf-8",
@@ -63,10 +117,18 @@ class API(object):
         if type(proxies) is dict:
             self.proxies = proxies
 
+        if time_sync_interval:
+            self.start_time_sync(time_sync_interval)
+
         return
 
     def query(self, url_path, payload=None):
-        return self.send_request("GET", url_path, payload=payload)
+        return self._cached(
+            "GET",
+            url_path,
+            payload,
+            lambda: self.send_request("GET", url_path, payload=payload),
+        )
 
     def limit_request(self, http_method, url_path, payload=None):
         """limit request is for those endpoints require API key in the header"""
@@ -75,12 +137,15 @@ class API(object):
         return self.send_request(http_method, url_path, payload=payload)
 
     def sign_request(self, http_method, url_path, payload=None, special=False):
-        if payload is None:
-            payload = {}
-        payload["timestamp"] = get_timestamp()
-        query_string = self._prepare_params(payload, special)
-        payload["signature"] = self._get_sign(query_string)
-        return self.send_request(http_method, url_path, payload, special)
+        payload = self._with_client_order_id(http_method, url_path, payload)
+        return self._cached(
+            http_method,
+            url_path,
+            payload,
+            lambda: self.send_request(
+                http_method, url_path, self._sign_payload(payload, special), special
+            ),
+        )
 
     def limited_encoded_sign_request(self, http_method, url_path, payload=None):
         """This is used for some endpoints has special symbol in the url.
@@ -91,20 +156,139 @@ class API(object):
 
         so we have to append those parameters in the url
         """
-        if payload is None:
-            payload = {}
-        payload["timestamp"] = get_timestamp()
-        query_string = self._prepare_params(payload)
-        url_path = (
-            url_path + "?" + query_string + "&signature=" + self._get_sign(query_string)
-        )
+        url_path = self._encoded_sign_url(url_path, payload)
         return self.send_request(http_method, url_path)
 
+    def warmup(self, connections=1):
+        """Open ``connections`` keep-alive connections to base_url ahead of time
+
+        Each connection sends a ``ping()``, so the TLS handshake is not paid by the next
+        requests. Call it at startup, and after idle periods long enough for the server to
+        close the idle connections.
+        """
+
+        connections = min(connections, self.pool_maxsize)
+        with ThreadPoolExecutor(max_workers=connections) as executor:
+            list(executor.map(lambda _: self.ping(), range(connections)))
+
+    def map(self, method, calls, max_concurrency=8):
+        """Call the endpoint ``method`` once per kwargs dict of ``calls``, concurrently
+
+        e.g. client.map(client.klines, [{"symbol": s, "interval": "1h"} for s in symbols])
+
+        The calls run on ``max_concurrency`` threads, throttled by the ``rate_limiter`` if
+        any; keep ``pool_maxsize`` at least as large. Returns one entry per call, in order:
+        its response or its exception. Per-symbol calls of ``mark_price``, ``ticker_price``,
+        ``book_ticker`` and ``ticker_24hr_price_change`` are served by one all-symbols call
+        when that costs no more weight.
+        """
+
+        calls = list(calls)
+        if self._all_symbols_threshold(method, calls) <= len(calls):
+            try:
+                response = method()
+            except Exception as e:
+                return [e] * len(calls)
+            return self._by_symbol(response, calls)
+
+        def call(kwargs):
+            try:
+                return method(**kwargs)
+            except Exception as e:
+                return e
+
+        if not calls:
+            return []
+        with ThreadPoolExecutor(
+            max_workers=min(max_concurrency, len(calls))
+        ) as executor:
+            return list(executor.map(call, calls))
+
+    def sync_time(self, samples=3):
+        """Calibrate ``time_offset``, the server clock minus the local clock in ms
+
+        The server time is assumed to be read at the midpoint of the round trip of the
+        ``time()`` endpoint; the sample with the shortest round trip is kept.
+        """
+
+        best = None
+        for _ in range(samples):
+            sent = time.time() * 1000
+            response = self.time()
+            received = time.time() * 1000
+            best = self._pick_time_sample(best, response, sent, received)
+        self.time_offset = best[1]
+        logging.debug("server time offset: {}ms".format(self.time_offset))
+        return self.time_offset
+
+    def start_time_sync(self, interval):
+        """sync the server time now, then every ``interval`` seconds in a daemon thread"""
+
+        self.stop_time_sync()
+        self.time_sync_interval = interval
+        self.sync_time()
+        self._time_sync_stop = threading.Event()
+        threading.Thread(
+            target=self._time_sync_loop, args=(self._time_sync_stop,), daemon=True
+        ).start()
+
+    def stop_time_sync(self):
+        if self._time_sync_stop is not None:
+            self._time_sync_stop.set()
+            self._time_sync_stop = None
+
+    def _time_sync_loop(self, stop):
+        while not stop.wait(self.time_sync_interval):
+            try:
+                self.sync_time()
+            except Exception as e:
+                logging.warning("Failed to sync server time: {}".format(e))
+
+    def _pick_time_sample(self, best, response, sent, received):
+        if isinstance(response, dict) and "serverTime" not in response:
+            response = response["data"]
+        if isinstance(response, bytes):
+            response = self.json_loads(response)
+        round_trip = received - sent
+        offset = int(round(response["serverTime"] - (sent + received) / 2))
+        if best is None or round_trip < best[0]:
+            return round_trip, offset
+        return best
+
+    def _get_timestamp(self):
+        return get_timestamp() + self.time_offset
+
     def send_request(self, http_method, url_path, payload=None, special=False):
         if payload is None:
             payload = {}
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            try:
+                return self._send_request_once(http_method, url_path, payload, special)
+            except Exception as error:
+                delay = self._get_retry_delay(http_method, error, attempt, started)
+                if self._should_resolve_order(
+                    http_method, url_path, payload, error, attempt
+                ):
+                    order = self._resolve_order(url_path, payload, error)
+                    if order is not None:
+                        return order
+                    delay = self._get_order_retry_delay(error, attempt, started)
+                if delay is None:
+                    raise
+                logging.debug(
+                    "retrying {} {} in {:.3f}s: {!r}".format(
+                        http_method, url_path, delay, error
+                    )
+                )
+            time.sleep(delay)
+            attempt += 1
+            payload = self._refresh_signature(payload, special)
+
+    def _send_request_once(self, http_method, url_path, payload, special=False):
         url = self.base_url + url_path
-        logging.debug("url: " + url)
+        logging.debug("url: %s", url)
         params = cleanNoneValue(
             {
                 "url": url,
@@ -113,30 +297,49 @@ class API(object):
                 "proxies": self.proxies,
             }
         )
+        delay = self._acquire_rate_limit(http_method, url_path, payload)
+        if delay > 0:
+            time.sleep(delay)
         response = self._dispatch_request(http_method)(**params)
-        logging.debug("raw response from server:" + response.text)
-        self._handle_exception(response)
+        return self._parse_response(
+            response.status_code, response.content, response.headers
+        )
 
-        try:
-            data = response.json()
-        except ValueError:
-            data = response.text
+    def _parse_response(self, status_code, content, headers):
+        if logging.root.isEnabledFor(logging.DEBUG):
+            logging.debug(
+                "raw response from server:" + content.decode("utf-8", "replace")
+            )
+        self._update_rate_limit(status_code, headers)
+        if status_code >= 400:
+            self._check_status(status_code, content.decode("utf-8", "replace"), headers)
+
+        if self.raw_response:
+            data = content
+        else:
+            try:
+                data = self.json_loads(content)
+            except ValueError:
+                data = content.decode("utf-8", "replace")
+        return self._format_result(data, headers)
+
+    def _format_result(self, data, headers):
         result = {}
 
         if self.show_limit_usage:
             limit_usage = {}
-            for key in response.headers.keys():
+            for key in headers.keys():
                 key = key.lower()
                 if (
                     key.startswith("x-mbx-used-weight")
                     or key.startswith("x-mbx-order-count")
                     or key.startswith("x-sapi-used")
                 ):
-                    limit_usage[key] = response.headers[key]
+                    limit_usage[key] = headers[key]
             result["limit_usage"] = limit_usage
 
         if self.show_header:
-            result["header"] = response.headers
+            result["header"] = headers
 
         if len(result) != 0:
             result["data"] = data
@@ -144,13 +347,151 @@ class API(object):
 
         return data
 
+    def _cached(self, http_method, url_path, payload, load):
+        if self.cache is None or http_method != "GET":
+            return load()
+        return self.cache.get_or_load(url_path, payload, load)
+
+    def _acquire_rate_limit(self, http_method, url_path, payload):
+        if self.rate_limiter is None:
+            return 0
+        return self.rate_limiter.acquire(http_method, url_path, payload)
+
+    def _update_rate_limit(self, status_code, headers):
+        if self.rate_limiter is not None:
+            self.rate_limiter.update(status_code, headers)
+
     def _prepare_params(self, params, special=False):
         return encoded_string(cleanNoneValue(params), special)
 
+    def _sign_payload(self, payload, special=False):
+        if payload is None:
+            payload = {}
+        payload["timestamp"] = self._get_timestamp()
+        query_string = self._prepare_params(payload, special)
+        payload["signature"] = self._get_sign(query_string)
+        return payload
+
+    def _refresh_signature(self, payload, special=False):
+        """sign a retried request again, with a new timestamp"""
+
+        if "signature" not in payload:
+            return payload
+        return self._sign_payload(
+            {k: v for k, v in payload.items() if k != "signature"}, special
+        )
+
+    def _get_retry_delay(self, http_method, error, attempt, started):
+        if self.retry_policy is None:
+            return None
+        return self.retry_policy.get_delay(
+            http_method, error, attempt, time.monotonic() - started
+        )
+
+    def _all_symbols_threshold(self, method, calls):
+        """the number of calls from which ``map`` makes one all-symbols call instead"""
+
+        function = getattr(method, "__func__", method)
+        threshold = ALL_SYMBOLS_ENDPOINTS.get(
+            (getattr(function, "__module__", None), getattr(function, "__name__", None))
+        )
+        if (
+            threshold is None
+            or self.raw_response
+            or self.show_limit_usage
+            or self.show_header
+            or not all(list(kwargs) == ["symbol"] for kwargs in calls)
+        ):
+            return float("inf")
+        return threshold
+
+    def _by_symbol(self, response, calls):
+        items = {item["symbol"]: item for item in response}
+        return [
+            items.get(kwargs["symbol"])
+            or ClientError(400, -1121, "Invalid symbol.", None)
+            for kwargs in calls
+        ]
+
+    def _with_client_order_id(self, http_method, url_path, payload):
+        """give order placements a client order id, to look them up when their outcome is unknown"""
+
+        if (
+            self.retry_policy is None
+            or not self.retry_policy.is_order_placement(http_method, url_path)
+            or not payload
+            or payload.get("newClientOrderId")
+        ):
+            return payload
+        return {**payload, "newClientOrderId": new_client_order_id()}
+
+    def _should_resolve_order(self, http_method, url_path, payload, error, attempt):
+        return (
+            self.retry_policy is not None
+            and self.retry_policy.is_order_placement(http_method, url_path)
+            and "newClientOrderId" in payload
+            and self.retry_policy.should_resolve_order(error, attempt)
+        )
+
+    def _order_lookup_payload(self, payload):
+        return self._sign_payload(
+            {
+                "symbol": payload["symbol"],
+                "origClientOrderId": payload["newClientOrderId"],
+                "recvWindow": payload.get("recvWindow"),
+            }
+        )
+
+    def _resolve_order(self, url_path, payload, error):
+        """the order placed by the failed request, None if it doesn't exist"""
+
+        try:
+            return self.send_request(
+                "GET", url_path, self._order_lookup_payload(payload)
+            )
+        except Exception as lookup_error:
+            if not self.retry_policy.is_unknown_order(lookup_error):
+                raise error
+            return None
+
+    def _get_order_retry_delay(self, error, attempt, started):
+        """the order was not placed: sending it again with the same id can't place it twice"""
+
+        if isinstance(error, ClientError):
+            # the placed order of a duplicate id error was not found, give up
+            return None
+        return self.retry_policy.get_delay(
+            "POST", error, attempt, time.monotonic() - started, idempotent=True
+        )
+
+    def _encoded_sign_url(self, url_path, payload):
+        if payload is None:
+            payload = {}
+        payload["timestamp"] = self._get_timestamp()
+        query_string = self._prepare_params(payload)
+        return (
+            url_path + "?" + query_string + "&signature=" + self._get_sign(query_string)
+        )
+
     def _get_sign(self, payload):
         if self.private_key:
-            return rsa_signature(self.private_key, payload, self.private_key_pass)
-        return hmac_hashing(self.secret, payload)
+            return private_key_signature(self._get_signing_key(), payload)
+        return hmac_signature(self._get_keyed_hmac(), payload)
+
+    def _get_signing_key(self):
+        """the private key is parsed (and decrypted) once, not on every request"""
+
+        if self._signing_key[0] is not self.private_key:
+            self._signing_key = (
+                self.private_key,
+                load_private_key(self.private_key, self.private_key_pass),
+            )
+        return self._signing_key[1]
+
+    def _get_keyed_hmac(self):
+        if self._keyed_hmac[0] is not self.secret:
+            self._keyed_hmac = (self.secret, new_hmac(self.secret))
+        return self._keyed_hmac[1]
 
     def _dispatch_request(self, http_method):
         return {
@@ -160,14 +501,36 @@ class API(object):
             "POST": self.session.post,
         }.get(http_method, self.session.get)
 
-    def _handle_exception(self, response):
-        status_code = response.status_code
+    def _check_status(self, status_code, text, headers):
         if status_code < 400:
             return
         if 400 <= status_code < 500:
             try:
-                err = json.loads(response.text)
+                err = json.loads(text)
             except JSONDecodeError:
-                raise ClientError(status_code, None, response.text, response.headers)
-            raise ClientError(status_code, err["code"], err["msg"], response.headers)
-        raise ServerError(status_code, response.text)
+                raise ClientError(status_code, None, text, headers)
+            raise ClientError(status_code, err["code"], err["msg"], headers)
+        raise ServerError(status_code, text)
+
+
+class SocketOptionsAdapter(HTTPAdapter):
+    """HTTPAdapter opening its connections with the given socket options"""
+
+    default_socket_options = [
+        (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    ]
+
+    def __init__(self, socket_options=None, **kwargs):
+        self.socket_options = (
+            self.default_socket_options if socket_options is None else socket_options
+        )
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = self.socket_options
+        super().init_poolmanager(*args, **kwargs)
+
+    def proxy_manager_for(self, *args, **kwargs):
+        kwargs["socket_options"] = self.socket_options
+        return super().proxy_manager_for(*args, **kwargs)
@@ -0,0 +1,244 @@
+import asyncio
+import logging
+import time
+
+from binance.api import API
+from binance.lib.utils import check_required_parameter
+
+try:
+    import aiohttp
+    from yarl import URL
+except ImportError:  # pragma: no cover
+    aiohttp = None
+
+
+class AsyncAPI(API):
+    """asyncio API base class
+
+    Same interface as ``API``, but ``query``, ``limit_request``, ``sign_request``,
+    ``limited_encoded_sign_request`` and ``send_request`` are coroutines. All requests
+    share one ``aiohttp.ClientSession`` whose keep-alive connection pool is created lazily
+    on the running event loop. Requires the optional ``aiohttp`` dependency.
+
+    Keyword Args:
+        base_url (str, optional): the API base url, useful to switch to testnet, etc. By default it's https://api.binance.com
+        timeout (int, optional): the time waiting for server response, number of seconds.
+        proxies (obj, optional): Dictionary mapping protocol to the URL of the proxy. e.g. {'https': 'http://1.2.3.4:8080'}
+        show_limit_usage (bool, optional): whether return limit usage(requests and/or orders). By default, it's False
+        show_header (bool, optional): whether return the whole response header. By default, it's False
+        pool_maxsize (int, optional): the max number of connections kept open to base_url. By default, it's 100
+    """
+
+    def __init__(self, key=None, secret=None, pool_maxsize=100, **kwargs):
+        if aiohttp is None:
+            raise ImportError(
+                "aiohttp is required for the asyncio clients, install it with `pip install aiohttp`"
+            )
+        self._time_sync_task = None
+        self._time_synced = None
+        super().__init__(key, secret, pool_maxsize=pool_maxsize, **kwargs)
+        # requests drops headers set to None, aiohttp refuses them
+        self.headers = {k: v for k, v in self.session.headers.items() if v is not None}
+        self.session.close()
+        self.session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    async def close(self):
+        self.stop_time_sync()
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+        self.session = None
+
+    async def query(self, url_path, payload=None):
+        return await self._cached(
+            "GET",
+            url_path,
+            payload,
+            lambda: self.send_request("GET", url_path, payload=payload),
+        )
+
+    async def limit_request(self, http_method, url_path, payload=None):
+        """limit request is for those endpoints require API key in the header"""
+
+        check_required_parameter(self.key, "apiKey")
+        return await self.send_request(http_method, url_path, payload=payload)
+
+    async def sign_request(self, http_method, url_path, payload=None, special=False):
+        payload = self._with_client_order_id(http_method, url_path, payload)
+        return await self._cached(
+            http_method,
+            url_path,
+            payload,
+            lambda: self._send_signed_request(http_method, url_path, payload, special),
+        )
+
+    async def _send_signed_request(self, http_method, url_path, payload, special):
+        await self._ensure_time_sync()
+        payload = self._sign_payload(payload, special)
+        return await self.send_request(http_method, url_path, payload, special)
+
+    async def _cached(self, http_method, url_path, payload, load):
+        if self.cache is None or http_method != "GET":
+            return await load()
+        return await self.cache.async_get_or_load(url_path, payload, load)
+
+    async def limited_encoded_sign_request(self, http_method, url_path, payload=None):
+        """See ``API.limited_encoded_sign_request``"""
+
+        await self._ensure_time_sync()
+        url_path = self._encoded_sign_url(url_path, payload)
+        return await self.send_request(http_method, url_path)
+
+    async def warmup(self, connections=1):
+        """See ``API.warmup``"""
+
+        connections = min(connections, self.pool_maxsize)
+        await asyncio.gather(*[self.ping() for _ in range(connections)])
+
+    async def map(self, method, calls, max_concurrency=8):
+        """See ``API.map``, the calls run concurrently on the event loop"""
+
+        calls = list(calls)
+        if self._all_symbols_threshold(method, calls) <= len(calls):
+            try:
+                response = await method()
+            except Exception as e:
+                return [e] * len(calls)
+            return self._by_symbol(response, calls)
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def call(kwargs):
+            async with semaphore:
+                return await method(**kwargs)
+
+        return await asyncio.gather(
+            *[call(kwargs) for kwargs in calls], return_exceptions=True
+        )
+
+    async def sync_time(self, samples=3):
+        """See ``API.sync_time``"""
+
+        best = None
+        for _ in range(samples):
+            sent = time.time() * 1000
+            response = await self.time()
+            received = time.time() * 1000
+            best = self._pick_time_sample(best, response, sent, received)
+        self.time_offset = best[1]
+        logging.debug("server time offset: {}ms".format(self.time_offset))
+        return self.time_offset
+
+    def start_time_sync(self, interval):
+        """Sync the server time every ``interval`` seconds in a task of the running loop.
+
+        The task is started by the next signed request, which waits for the first sync.
+        """
+
+        self.stop_time_sync()
+        self.time_sync_interval = interval
+
+    def stop_time_sync(self):
+        if self._time_sync_task is not None:
+            self._time_sync_task.cancel()
+            self._time_sync_task = None
+        self.time_sync_interval = None
+
+    async def _ensure_time_sync(self):
+        if not self.time_sync_interval:
+            return
+        if self._time_sync_task is None:
+            self._time_synced = asyncio.Event()
+            self._time_sync_task = asyncio.ensure_future(self._async_time_sync_loop())
+        await self._time_synced.wait()
+
+    async def _async_time_sync_loop(self):
+        while True:
+            try:
+                await self.sync_time()
+            except Exception as e:
+                logging.warning("Failed to sync server time: {}".format(e))
+            self._time_synced.set()
+            await asyncio.sleep(self.time_sync_interval)
+
+    async def send_request(self, http_method, url_path, payload=None, special=False):
+        if payload is None:
+            payload = {}
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            try:
+                return await self._send_request_once(
+                    http_method, url_path, payload, special
+                )
+            except Exception as error:
+                delay = self._get_retry_delay(http_method, error, attempt, started)
+                if self._should_resolve_order(
+                    http_method, url_path, payload, error, attempt
+                ):
+                    order = await self._resolve_order(url_path, payload, error)
+                    if order is not None:
+                        return order
+                    delay = self._get_order_retry_delay(error, attempt, started)
+                if delay is None:
+                    raise
+                logging.debug(
+                    "retrying {} {} in {:.3f}s: {!r}".format(
+                        http_method, url_path, delay, error
+                    )
+                )
+            await asyncio.sleep(delay)
+            attempt += 1
+            payload = self._refresh_signature(payload, special)
+
+    async def _resolve_order(self, url_path, payload, error):
+        """the order placed by the failed request, None if it doesn't exist"""
+
+        try:
+            return await self.send_request(
+                "GET", url_path, self._order_lookup_payload(payload)
+            )
+        except Exception as lookup_error:
+            if not self.retry_policy.is_unknown_order(lookup_error):
+                raise error
+            return None
+
+    async def _send_request_once(self, http_method, url_path, payload, special=False):
+        url = self.base_url + url_path
+        query_string = self._prepare_params(payload, special)
+        if query_string:
+            url = url + "?" + query_string
+        logging.debug("url: %s", url)
+
+        if http_method not in ("GET", "DELETE", "PUT", "POST"):
+            http_method = "GET"
+        delay = self._acquire_rate_limit(http_method, url_path, payload)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        # the query string is already encoded and signed, it must be sent as is
+        async with self._get_session().request(
+            http_method, URL(url, encoded=True), proxy=self._get_proxy()
+        ) as response:
+            content = await response.read()
+        return self._parse_response(response.status, content, response.headers)
+
+    def _get_session(self):
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                headers=self.headers,
+                connector=aiohttp.TCPConnector(
+                    limit=self.pool_maxsize, limit_per_host=self.pool_maxsize
+                ),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+        return self.session
+
+    def _get_proxy(self):
+        if not self.proxies:
+            return None
+        return self.proxies.get("https") or self.proxies.get("http")
@@ -0,0 +1,135 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from binance.error import ClientError, ParameterArgumentError
+
+# max orders of new_batch_order and ids of cancel_batch_order per request
+BATCH_ORDER_LIMIT = 5
+BATCH_CANCEL_LIMIT = 10
+
+
+def split_chunks(items, size):
+    chunks = []
+    for start in range(0, len(items), size):
+        end = start + size
+        chunks.append(items[start:end])
+    return chunks
+
+
+def _item_result(item):
+    # failed items of a batch response are {"code": ..., "msg": ...} entries
+    if isinstance(item, dict) and "code" in item and "msg" in item:
+        return ClientError(None, item["code"], item["msg"], None)
+    return item
+
+
+def _chunk_results(chunk, response):
+    """the results of the items of one chunk: the response items, or the request error"""
+
+    if isinstance(response, Exception):
+        # cancel chunks are (order ids, client order ids) pairs
+        items = chunk if isinstance(chunk, list) else chunk[0] or chunk[1]
+        return [response] * len(items)
+    if isinstance(response, dict):
+        response = response["data"]
+    return [_item_result(item) for item in response]
+
+
+def _cancel_chunks(order_ids, client_order_ids):
+    if (order_ids is None) == (client_order_ids is None):
+        raise ParameterArgumentError(
+            "either order_ids or client_order_ids must be sent"
+        )
+    if order_ids is not None:
+        return [(chunk, None) for chunk in split_chunks(order_ids, BATCH_CANCEL_LIMIT)]
+    return [
+        (None, chunk) for chunk in split_chunks(client_order_ids, BATCH_CANCEL_LIMIT)
+    ]
+
+
+def _dispatch(call, chunks, max_workers):
+    def send(chunk):
+        try:
+            return call(chunk)
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(chunks)))) as e:
+        responses = list(e.map(send, chunks))
+    return [
+        result
+        for chunk, response in zip(chunks, responses)
+        for result in _chunk_results(chunk, response)
+    ]
+
+
+async def _async_dispatch(call, chunks, max_concurrency):
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def send(chunk):
+        async with semaphore:
+            return await call(chunk)
+
+    responses = await asyncio.gather(
+        *[send(chunk) for chunk in chunks], return_exceptions=True
+    )
+    return [
+        result
+        for chunk, response in zip(chunks, responses)
+        for result in _chunk_results(chunk, response)
+    ]
+
+
+def place_orders(client, orders, max_workers=4):
+    """Place any number of orders with ``new_batch_order``, in concurrent batches of 5
+
+    ``orders`` are the order parameters of ``new_batch_order``. The batches are sent by
+    ``max_workers`` threads, throttled by the client's ``rate_limiter`` if any, which counts
+    each order against the order rate limits. Returns one entry per order, in the order of
+    ``orders``: the order response, or the exception of that order (``ClientError`` with a
+    None status code when the exchange rejected the order alone, the error of the whole
+    request otherwise).
+
+    e.g. place_orders(client, [{"symbol": "BTCUSDT", "side": "BUY", "type": "LIMIT", ...}, ...])
+    """
+
+    return _dispatch(
+        client.new_batch_order,
+        split_chunks(list(orders), BATCH_ORDER_LIMIT),
+        max_workers,
+    )
+
+
+def cancel_orders(client, symbol, order_ids=None, client_order_ids=None, max_workers=4):
+    """Cancel any number of orders of ``symbol`` with ``cancel_batch_order``, in concurrent
+    batches of 10, by order id or client order id. Returns one entry per id, see
+    ``place_orders``
+    """
+
+    return _dispatch(
+        lambda ids: client.cancel_batch_order(symbol, *ids),
+        _cancel_chunks(order_ids, client_order_ids),
+        max_workers,
+    )
+
+
+async def async_place_orders(client, orders, max_concurrency=4):
+    """Same as ``place_orders``, with an asyncio client"""
+
+    return await _async_dispatch(
+        client.new_batch_order,
+        split_chunks(list(orders), BATCH_ORDER_LIMIT),
+        max_concurrency,
+    )
+
+
+async def async_cancel_orders(
+    client, symbol, order_ids=None, client_order_ids=None, max_concurrency=4
+):
+    """Same as ``cancel_orders``, with an asyncio client"""
+
+    return await _async_dispatch(
+        lambda ids: client.cancel_batch_order(symbol, *ids),
+        _cancel_chunks(order_ids, client_order_ids),
+        max_concurrency,
+    )
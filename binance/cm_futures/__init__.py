@@ -1,4 +1,5 @@
 from binance.api import API
+from binance.async_api import AsyncAPI
 
 
 class CMFutures(API):
@@ -68,3 +69,17 @@ class CMFutures(API):
     from binance.cm_futures.data_stream import new_listen_key
     from binance.cm_futures.data_stream import renew_listen_key
     from binance.cm_futures.data_stream import close_listen_key
+
+
+class AsyncCMFutures(AsyncAPI):
+    def __init__(self, key=None, secret=None, **kwargs):
+        if "base_url" not in kwargs:
+            kwargs["base_url"] = "https://dapi.binance.com"
+        super().__init__(key, secret, **kwargs)
+
+
+# The endpoint functions only build the request and return what query/sign_request
+# return, so on the asyncio client they hand back the coroutine to await.
+for _name, _endpoint in list(vars(CMFutures).items()):
+    if not _name.startswith("_"):
+        setattr(AsyncCMFutures, _name, _endpoint)
@@ -50,3 +50,14 @@ class ParameterArgumentError(Error):
 
     def __str__(self):
         return self.error_message
+
+
+class RateLimitError(Error):
+    def __init__(self, retry_after):
+        # seconds to wait before the request fits in the client side rate limit
+        self.retry_after = retry_after
+
+    def __str__(self):
+        return "client side rate limit reached, retry after %.3f seconds" % (
+            self.retry_after
+        )
@@ -0,0 +1,146 @@
+import array
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from binance.error import ParameterArgumentError
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+KLINE_COLUMNS = (
+    ("open_time", "int"),
+    ("open", "float"),
+    ("high", "float"),
+    ("low", "float"),
+    ("close", "float"),
+    ("volume", "float"),
+    ("close_time", "int"),
+    ("quote_volume", "float"),
+    ("trades", "int"),
+    ("taker_buy_volume", "float"),
+    ("taker_buy_quote_volume", "float"),
+)
+
+_UNIT_MILLISECONDS = {
+    "m": 60 * 1000,
+    "h": 60 * 60 * 1000,
+    "d": 24 * 60 * 60 * 1000,
+    "w": 7 * 24 * 60 * 60 * 1000,
+    # months vary in length; the shortest keeps a page from holding more than `limit` klines
+    "M": 28 * 24 * 60 * 60 * 1000,
+}
+
+# weight 5 per 1000 klines, while 1500 klines cost 10
+DEFAULT_PAGE_LIMIT = 1000
+
+
+def interval_to_milliseconds(interval):
+    try:
+        return int(interval[:-1]) * _UNIT_MILLISECONDS[interval[-1]]
+    except (KeyError, ValueError):
+        raise ParameterArgumentError("invalid kline interval: {}".format(interval))
+
+
+def split_pages(start_time, end_time, interval, limit=DEFAULT_PAGE_LIMIT):
+    """split [start_time, end_time) into (startTime, endTime) pages of at most ``limit`` klines"""
+
+    if end_time <= start_time:
+        raise ParameterArgumentError("end_time must be greater than start_time")
+    span = interval_to_milliseconds(interval) * limit
+    return [
+        (page_start, min(page_start + span, end_time) - 1)
+        for page_start in range(start_time, end_time, span)
+    ]
+
+
+def klines_to_columns(klines):
+    """convert kline rows (lists of strings) to a dict of typed arrays, one per column
+
+    The arrays are numpy arrays (int64/float64) when numpy is installed, ``array.array``
+    otherwise.
+    """
+
+    columns = {}
+    for i, (name, kind) in enumerate(KLINE_COLUMNS):
+        values = [row[i] for row in klines]
+        if numpy is not None:
+            columns[name] = numpy.array(
+                values, dtype=numpy.int64 if kind == "int" else numpy.float64
+            )
+        elif kind == "int":
+            columns[name] = array.array("q", [int(v) for v in values])
+        else:
+            columns[name] = array.array("d", [float(v) for v in values])
+    return columns
+
+
+def _merge_pages(pages, start_time, end_time):
+    # pages may overlap on their bounds, keep one kline per open time
+    klines = {}
+    for page in pages:
+        if isinstance(page, dict):
+            page = page["data"]
+        for row in page:
+            if start_time <= row[0] < end_time:
+                klines[row[0]] = row
+    return [klines[open_time] for open_time in sorted(klines)]
+
+
+def backfill_klines(
+    endpoint,
+    *args,
+    start_time,
+    end_time,
+    limit=DEFAULT_PAGE_LIMIT,
+    max_workers=8,
+    **kwargs
+):
+    """Fetch all the klines of [start_time, end_time) in concurrent pages
+
+    ``endpoint`` is one of the kline endpoints of a client (``klines``, ``continuous_klines``,
+    ``index_price_klines``, ``mark_price_klines`` or ``blvt_kline``), called with ``args``,
+    the interval being the last one. Pages are fetched by ``max_workers`` threads, throttled by
+    the client's ``rate_limiter`` if any; keep the client's ``pool_maxsize`` at least as large.
+    The pages are stitched in time order without duplicates and returned as columns, see
+    ``klines_to_columns``.
+
+    e.g. backfill_klines(client.klines, "BTCUSDT", "1m", start_time=1704067200000, end_time=1735689600000)
+    """
+
+    pages = split_pages(start_time, end_time, args[-1], limit)
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(pages))) as executor:
+        results = list(
+            executor.map(
+                lambda page: endpoint(
+                    *args, startTime=page[0], endTime=page[1], limit=limit, **kwargs
+                ),
+                pages,
+            )
+        )
+    return klines_to_columns(_merge_pages(results, start_time, end_time))
+
+
+async def async_backfill_klines(
+    endpoint,
+    *args,
+    start_time,
+    end_time,
+    limit=DEFAULT_PAGE_LIMIT,
+    max_concurrency=8,
+    **kwargs
+):
+    """Same as ``backfill_klines``, with an endpoint of an asyncio client"""
+
+    pages = split_pages(start_time, end_time, args[-1], limit)
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def fetch(page):
+        async with semaphore:
+            return await endpoint(
+                *args, startTime=page[0], endTime=page[1], limit=limit, **kwargs
+            )
+
+    results = await asyncio.gather(*[fetch(page) for page in pages])
+    return klines_to_columns(_merge_pages(results, start_time, end_time))
@@ -1,9 +1,9 @@
 import hmac
 import hashlib
 from base64 import b64encode
-from Crypto.PublicKey import RSA
+from Crypto.PublicKey import ECC, RSA
 from Crypto.Hash import SHA256
-from Crypto.Signature import pkcs1_15
+from Crypto.Signature import eddsa, pkcs1_15
 
 
 def hmac_hashing(secret, payload):
@@ -11,8 +11,46 @@ def hmac_hashing(secret, payload):
     return m.hexdigest()
 
 
+def new_hmac(secret):
+    """HMAC-SHA256 object keyed with the secret, to be copied by ``hmac_signature``"""
+
+    return hmac.new(secret.encode("utf-8"), digestmod=hashlib.sha256)
+
+
+def hmac_signature(keyed_hmac, payload):
+    m = keyed_hmac.copy()
+    m.update(payload.encode("utf-8"))
+    return m.hexdigest()
+
+
+def load_private_key(private_key, private_key_pass=None):
+    """import a PEM/DER RSA or Ed25519 private key, keys already imported are returned as is"""
+
+    if isinstance(private_key, (RSA.RsaKey, ECC.EccKey)):
+        return private_key
+    try:
+        return RSA.import_key(private_key, passphrase=private_key_pass)
+    except ValueError:
+        return ECC.import_key(private_key, passphrase=private_key_pass)
+
+
 def rsa_signature(private_key, payload, private_key_pass=None):
-    private_key = RSA.import_key(private_key, passphrase=private_key_pass)
+    private_key = load_private_key(private_key, private_key_pass)
     h = SHA256.new(payload.encode("utf-8"))
     signature = pkcs1_15.new(private_key).sign(h)
     return b64encode(signature)
+
+
+def ed25519_signature(private_key, payload, private_key_pass=None):
+    private_key = load_private_key(private_key, private_key_pass)
+    signature = eddsa.new(private_key, "rfc8032").sign(payload.encode("utf-8"))
+    return b64encode(signature)
+
+
+def private_key_signature(private_key, payload, private_key_pass=None):
+    """sign with RSA or Ed25519, depending on the type of the private key"""
+
+    private_key = load_private_key(private_key, private_key_pass)
+    if isinstance(private_key, RSA.RsaKey):
+        return rsa_signature(private_key, payload)
+    return ed25519_signature(private_key, payload)
@@ -0,0 +1,140 @@
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from urllib.parse import urlencode
+
+# parameters which change on every signed request without changing the response
+_VOLATILE_PARAMS = ("timestamp", "signature", "recvWindow")
+
+# suggested TTL in seconds of the endpoints hit repeatedly by many components
+DEFAULT_TTL = {
+    "/fapi/v1/exchangeInfo": 300,
+    "/fapi/v1/fundingInfo": 300,
+    "/fapi/v1/indexInfo": 60,
+    "/fapi/v1/leverageBracket": 60,
+    "/fapi/v2/ticker/price": 1,
+    "/dapi/v1/exchangeInfo": 300,
+    "/dapi/v1/leverageBracket": 60,
+    "/dapi/v2/leverageBracket": 60,
+    "/dapi/v1/ticker/price": 1,
+}
+
+
+class ResponseCache(object):
+    """Size bounded LRU cache of GET responses, with a TTL per endpoint
+
+    Responses are keyed by path and parameters (sorted, without timestamp, signature and
+    recvWindow). Concurrent identical requests are coalesced: the first one is sent, the
+    others wait for its response. Cached responses are shared between callers and must not
+    be modified.
+
+    Keyword Args:
+        ttl (dict, optional): seconds to keep the responses of each url path. Paths missing here are not cached. By default, it's ``DEFAULT_TTL``
+        maxsize (int, optional): the max number of responses kept. By default, it's 256
+    """
+
+    def __init__(self, ttl=None, maxsize=256):
+        self.ttl = DEFAULT_TTL if ttl is None else ttl
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._pending = {}
+        self._async_pending = {}
+        self._lock = threading.Lock()
+
+    def key(self, url_path, payload=None):
+        params = sorted(
+            (k, v)
+            for k, v in (payload or {}).items()
+            if v is not None and k not in _VOLATILE_PARAMS
+        )
+        return url_path + "?" + urlencode(params, True)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def _lookup(self, key, now):
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        if entry[0] <= now:
+            del self._entries[key]
+            return False, None
+        self._entries.move_to_end(key)
+        return True, entry[1]
+
+    def _store(self, key, ttl, value):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def get_or_load(self, url_path, payload, load):
+        """return the cached response, or call ``load()`` once for all concurrent callers"""
+
+        ttl = self.ttl.get(url_path)
+        if not ttl:
+            return load()
+        key = self.key(url_path, payload)
+        with self._lock:
+            hit, value = self._lookup(key, time.monotonic())
+            if hit:
+                return value
+            pending = self._pending.get(key)
+            if pending is None:
+                self._pending[key] = owned = Future()
+        if pending is not None:
+            return pending.result()
+
+        try:
+            value = load()
+        except BaseException as e:
+            owned.set_exception(e)
+            raise
+        else:
+            self._store(key, ttl, value)
+            owned.set_result(value)
+            return value
+        finally:
+            with self._lock:
+                del self._pending[key]
+
+    async def async_get_or_load(self, url_path, payload, load):
+        """same as ``get_or_load``, ``load()`` returning an awaitable"""
+
+        ttl = self.ttl.get(url_path)
+        if not ttl:
+            return await load()
+        key = self.key(url_path, payload)
+        with self._lock:
+            hit, value = self._lookup(key, time.monotonic())
+            if hit:
+                return value
+            pending = self._async_pending.get(key)
+            if pending is None:
+                self._async_pending[key] = owned = (
+                    asyncio.get_running_loop().create_future()
+                )
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        try:
+            value = await load()
+        except asyncio.CancelledError:
+            owned.cancel()
+            raise
+        except Exception as e:
+            owned.set_exception(e)
+            # nobody else may be waiting, do not log "exception was never retrieved"
+            owned.exception()
+            raise
+        else:
+            self._store(key, ttl, value)
+            owned.set_result(value)
+            return value
+        finally:
+            with self._lock:
+                del self._async_pending[key]
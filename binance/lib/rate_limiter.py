@@ -0,0 +1,265 @@
+import threading
+import time
+
+from binance.error import RateLimitError
+
+
+def _klines_weight(params):
+    limit = int(params.get("limit", 500))
+    if limit < 100:
+        return 1
+    if limit < 500:
+        return 2
+    if limit <= 1000:
+        return 5
+    return 10
+
+
+def _depth_weight(params):
+    limit = int(params.get("limit", 500))
+    if limit <= 50:
+        return 2
+    if limit <= 100:
+        return 5
+    if limit <= 500:
+        return 10
+    return 20
+
+
+def _symbol_weight(with_symbol, without_symbol):
+    return lambda params: with_symbol if params.get("symbol") else without_symbol
+
+
+def _pair_weight(with_pair, without_pair):
+    return lambda params: (
+        with_pair if params.get("symbol") or params.get("pair") else without_pair
+    )
+
+
+# IP request weight per endpoint, as documented by Binance, by (method, path) where the
+# methods of a path differ. Endpoints missing here cost 1.
+ENDPOINT_WEIGHTS = {
+    "/fapi/v1/depth": _depth_weight,
+    "/fapi/v1/trades": 5,
+    "/fapi/v1/historicalTrades": 20,
+    "/fapi/v1/aggTrades": 20,
+    "/fapi/v1/klines": _klines_weight,
+    "/fapi/v1/continuousKlines": _klines_weight,
+    "/fapi/v1/indexPriceKlines": _klines_weight,
+    "/fapi/v1/markPriceKlines": _klines_weight,
+    "/fapi/v1/lvtKlines": _klines_weight,
+    "/fapi/v1/ticker/24hr": _symbol_weight(1, 40),
+    "/fapi/v2/ticker/price": _symbol_weight(1, 2),
+    "/fapi/v1/ticker/bookTicker": _symbol_weight(2, 5),
+    ("POST", "/fapi/v1/order"): 0,
+    "/fapi/v1/batchOrders": 5,
+    "/fapi/v1/openOrders": _symbol_weight(1, 40),
+    "/fapi/v1/allOrders": 5,
+    "/fapi/v3/balance": 5,
+    "/fapi/v3/account": 5,
+    "/fapi/v3/positionRisk": 5,
+    "/fapi/v1/userTrades": 5,
+    "/fapi/v1/income": 30,
+    "/fapi/v1/forceOrders": _symbol_weight(20, 50),
+    "/fapi/v1/adlQuantile": 5,
+    "/fapi/v1/commissionRate": 20,
+    "/fapi/v1/accountConfig": 5,
+    "/fapi/v1/symbolConfig": 5,
+    "/fapi/v1/income/asyn": 1000,
+    "/fapi/v1/income/asyn/id": 10,
+    "/fapi/v1/order/asyn": 1000,
+    "/fapi/v1/order/asyn/id": 10,
+    "/fapi/v1/trade/asyn": 1000,
+    "/fapi/v1/trade/asyn/id": 10,
+    "/fapi/v1/convert/getQuote": 50,
+    "/fapi/v1/convert/acceptQuote": 200,
+    "/dapi/v1/depth": _depth_weight,
+    "/dapi/v1/trades": 5,
+    "/dapi/v1/historicalTrades": 20,
+    "/dapi/v1/aggTrades": 20,
+    "/dapi/v1/klines": _klines_weight,
+    "/dapi/v1/continuousKlines": _klines_weight,
+    "/dapi/v1/indexPriceKlines": _klines_weight,
+    "/dapi/v1/markPriceKlines": _klines_weight,
+    "/dapi/v1/ticker/24hr": _pair_weight(1, 40),
+    "/dapi/v1/ticker/price": _pair_weight(1, 2),
+    "/dapi/v1/ticker/bookTicker": _pair_weight(2, 5),
+    "/dapi/v1/openInterest": 1,
+    "/dapi/v1/order": 1,
+    "/dapi/v1/batchOrders": 5,
+    "/dapi/v1/openOrders": _pair_weight(1, 40),
+    "/dapi/v1/allOrders": 20,
+    "/dapi/v1/balance": 1,
+    "/dapi/v1/account": 5,
+    "/dapi/v1/positionRisk": 1,
+    "/dapi/v1/userTrades": 20,
+    "/dapi/v1/income": 20,
+    "/dapi/v1/forceOrders": _symbol_weight(20, 50),
+    "/dapi/v1/adlQuantile": 5,
+    "/dapi/v1/commissionRate": 20,
+}
+
+# endpoints (method, path) counted against the account order rate limits
+ORDER_ENDPOINTS = {
+    ("POST", "/fapi/v1/order"),
+    ("PUT", "/fapi/v1/order"),
+    ("POST", "/fapi/v1/batchOrders"),
+    ("PUT", "/fapi/v1/batchOrders"),
+    ("POST", "/dapi/v1/order"),
+    ("PUT", "/dapi/v1/order"),
+    ("POST", "/dapi/v1/batchOrders"),
+    ("PUT", "/dapi/v1/batchOrders"),
+}
+
+_INTERVAL_SECONDS = {"S": 1, "M": 60, "H": 3600, "D": 86400}
+
+
+class TokenBucket(object):
+    """Token bucket holding ``capacity`` tokens, refilled over ``period`` seconds.
+
+    Tokens are reserved up front and may go negative, the caller then waits for the
+    returned delay. That lets blocking and asyncio callers share one bucket.
+    """
+
+    def __init__(self, capacity, period):
+        self.capacity = capacity
+        self.rate = capacity / period
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def delay(self, tokens, now):
+        self._refill(now)
+        if self.tokens >= tokens:
+            return 0
+        return (tokens - self.tokens) / self.rate
+
+    def consume(self, tokens, now):
+        self._refill(now)
+        self.tokens -= tokens
+
+    def sync(self, used, now):
+        """align the bucket with the usage reported by the server"""
+        self._refill(now)
+        self.tokens = min(self.tokens, self.capacity - used)
+
+
+class RateLimiter(object):
+    """Client side limiter for the IP request weight and the account order count
+
+    Each request reserves its weight from a static per-endpoint table before being sent, and
+    waits until enough budget is available. The buckets are then corrected with the
+    ``X-MBX-USED-WEIGHT-*`` and ``X-MBX-ORDER-COUNT-*`` response headers, so usage from other
+    processes sharing the IP or account is accounted for too. A 418/429 response pauses all
+    requests for the ``Retry-After`` period.
+
+    Keyword Args:
+        weight_limit (int, optional): request weight allowed per minute. By default, it's 2400
+        order_limit_10s (int, optional): orders allowed per 10 seconds. By default, it's 300
+        order_limit_1m (int, optional): orders allowed per minute. By default, it's 1200
+        endpoint_weights (dict, optional): overrides of the request weight table, path or (method, path) -> weight or callable(params)
+        max_delay (float, optional): longest wait accepted before raising ``RateLimitError``. By default, requests always wait
+    """
+
+    def __init__(
+        self,
+        weight_limit=2400,
+        order_limit_10s=300,
+        order_limit_1m=1200,
+        endpoint_weights=None,
+        max_delay=None,
+    ):
+        self.weights = dict(ENDPOINT_WEIGHTS)
+        if endpoint_weights:
+            self.weights.update(endpoint_weights)
+        self.max_delay = max_delay
+        self._lock = threading.Lock()
+        self._blocked_until = 0
+        self._weight_buckets = {"x-mbx-used-weight-1m": TokenBucket(weight_limit, 60)}
+        self._order_buckets = {}
+        if order_limit_10s:
+            self._order_buckets["x-mbx-order-count-10s"] = TokenBucket(
+                order_limit_10s, 10
+            )
+        if order_limit_1m:
+            self._order_buckets["x-mbx-order-count-1m"] = TokenBucket(
+                order_limit_1m, 60
+            )
+
+    @classmethod
+    def from_exchange_info(cls, exchange_info, **kwargs):
+        """build a limiter from the ``rateLimits`` returned by ``exchange_info()``"""
+
+        limits = {}
+        for rate_limit in exchange_info.get("rateLimits", []):
+            seconds = (
+                _INTERVAL_SECONDS.get(rate_limit["interval"][0], 60)
+                * rate_limit["intervalNum"]
+            )
+            limits[(rate_limit["rateLimitType"], seconds)] = rate_limit["limit"]
+        kwargs.setdefault("weight_limit", limits.get(("REQUEST_WEIGHT", 60), 2400))
+        kwargs.setdefault("order_limit_10s", limits.get(("ORDERS", 10)))
+        kwargs.setdefault("order_limit_1m", limits.get(("ORDERS", 60)))
+        return cls(**kwargs)
+
+    def weight(self, url_path, payload=None, http_method=None):
+        url_path = url_path.split("?", 1)[0]
+        weight = self.weights.get((http_method, url_path))
+        if weight is None:
+            weight = self.weights.get(url_path, 1)
+        if callable(weight):
+            return weight(payload or {})
+        return weight
+
+    def order_count(self, http_method, url_path, payload=None):
+        if (http_method, url_path.split("?", 1)[0]) not in ORDER_ENDPOINTS:
+            return 0
+        orders = (payload or {}).get("batchOrders")
+        if isinstance(orders, list):
+            return len(orders)
+        return 1
+
+    def acquire(self, http_method, url_path, payload=None):
+        """reserve the budget of a request and return the seconds to wait before sending it
+
+        Raises ``RateLimitError`` (without reserving anything) if the wait exceeds ``max_delay``.
+        """
+
+        weight = self.weight(url_path, payload, http_method)
+        orders = self.order_count(http_method, url_path, payload)
+        with self._lock:
+            now = time.monotonic()
+            delay = max(0, self._blocked_until - now)
+            for bucket in self._weight_buckets.values():
+                delay = max(delay, bucket.delay(weight, now))
+            if orders:
+                for bucket in self._order_buckets.values():
+                    delay = max(delay, bucket.delay(orders, now))
+            if self.max_delay is not None and delay > self.max_delay:
+                raise RateLimitError(delay)
+            for bucket in self._weight_buckets.values():
+                bucket.consume(weight, now)
+            if orders:
+                for bucket in self._order_buckets.values():
+                    bucket.consume(orders, now)
+        return delay
+
+    def update(self, status_code, headers):
+        """feed the response status and headers back into the limiter"""
+
+        with self._lock:
+            now = time.monotonic()
+            for key, value in headers.items():
+                key = key.lower()
+                bucket = self._weight_buckets.get(key) or self._order_buckets.get(key)
+                if bucket is not None:
+                    bucket.sync(int(value), now)
+            if status_code in (418, 429):
+                retry_after = headers.get("Retry-After")
+                self._blocked_until = max(
+                    self._blocked_until,
+                    now + (float(retry_after) if retry_after else 1),
+                )
@@ -0,0 +1,158 @@
+import asyncio
+import random
+
+import requests
+from urllib3.exceptions import NewConnectionError
+
+from binance.error import ClientError, ServerError
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None
+
+
+# the request has certainly not been processed by the server
+_REJECTED_STATUS = (418, 429)
+_TIMESTAMP_ERROR_CODES = (-1021,)
+_CONNECT_ERRORS = (requests.exceptions.ConnectTimeout,)
+
+# the request may or may not have been processed by the server
+_TRANSIENT_STATUS = (500, 502, 503, 504)
+_TRANSIENT_ERRORS = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+    asyncio.TimeoutError,
+)
+if aiohttp is not None:
+    _CONNECT_ERRORS += (aiohttp.ClientConnectorError,)
+    _TRANSIENT_ERRORS += (aiohttp.ClientConnectionError,)
+
+# order placements, looked up by client order id when their outcome is unknown
+_ORDER_PATHS = ("/fapi/v1/order", "/dapi/v1/order")
+# -2013 the order does not exist, -4116 the client order id is already used
+_UNKNOWN_ORDER_CODES = (-2013,)
+_DUPLICATE_ORDER_CODES = (-4116,)
+
+
+def _not_sent(error):
+    """whether the connection could not be opened (refused, timed out, name not resolved)"""
+
+    if isinstance(error, _CONNECT_ERRORS):
+        return True
+    if isinstance(error, requests.exceptions.ConnectionError) and error.args:
+        # requests wraps urllib3's NewConnectionError in a MaxRetryError
+        reason = getattr(error.args[0], "reason", error.args[0])
+        return isinstance(reason, NewConnectionError)
+    return False
+
+
+def _unknown_outcome(error):
+    """whether the request may or may not have been processed"""
+
+    if isinstance(error, ServerError):
+        return error.status_code in _TRANSIENT_STATUS
+    return isinstance(error, _TRANSIENT_ERRORS)
+
+
+def _retry_after(error):
+    """the seconds to wait sent with a 429/418, 0 if none"""
+
+    if isinstance(error, ClientError) and error.status_code in _REJECTED_STATUS:
+        retry_after = error.header.get("Retry-After") if error.header else None
+        if retry_after:
+            return float(retry_after)
+    return 0
+
+
+class RetryPolicy(object):
+    """Retry policy for failed requests, see ``API.send_request``
+
+    Errors proving that the request was rejected before being processed (429/418, -1021
+    timestamp outside recvWindow, connection refused) are retried for any method. Errors
+    leaving the outcome unknown (5xx, connection reset, read timeout) are only retried for
+    ``idempotent_methods``, since resending an order could place it twice. Signed requests are
+    signed again with a fresh timestamp before each retry.
+
+    With ``resolve_orders``, order placements (``new_order``) without ``newClientOrderId`` get a
+    generated one. When their outcome is unknown, the order is looked up by that id with
+    ``query_order``: it is returned if it exists, otherwise the order is sent again with the
+    same id, so that it can't be placed twice.
+
+    Keyword Args:
+        max_retries (int, optional): the max number of retries per call. By default, it's 3
+        backoff_factor (float, optional): the first backoff in seconds, doubled on each retry, with full jitter. By default, it's 0.1
+        max_backoff (float, optional): the cap of the exponential backoff, in seconds. By default, it's 5
+        total_timeout (float, optional): the latency budget of a call including all retries, in seconds. No retry is attempted if it would exceed the budget. By default, it's 30
+        idempotent_methods (tuple, optional): the http methods safe to resend when the outcome is unknown. By default, it's ("GET",)
+        resolve_orders (bool, optional): whether to resolve the unknown outcome of order placements by client order id. By default, it's True
+    """
+
+    def __init__(
+        self,
+        max_retries=3,
+        backoff_factor=0.1,
+        max_backoff=5,
+        total_timeout=30,
+        idempotent_methods=("GET",),
+        resolve_orders=True,
+    ):
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.total_timeout = total_timeout
+        self.idempotent_methods = idempotent_methods
+        self.resolve_orders = resolve_orders
+
+    def backoff(self, attempt):
+        return random.uniform(
+            0, min(self.max_backoff, self.backoff_factor * (2**attempt))
+        )
+
+    def is_order_placement(self, http_method, url_path):
+        return (
+            self.resolve_orders
+            and http_method == "POST"
+            and url_path.split("?", 1)[0] in _ORDER_PATHS
+        )
+
+    def should_resolve_order(self, error, attempt):
+        """whether the outcome of an order placement failing with ``error`` must be looked up"""
+
+        if isinstance(error, ClientError):
+            # a retry colliding with the id of the first attempt, which was placed after all
+            return attempt > 0 and error.error_code in _DUPLICATE_ORDER_CODES
+        return not _not_sent(error) and _unknown_outcome(error)
+
+    @staticmethod
+    def is_unknown_order(error):
+        return (
+            isinstance(error, ClientError) and error.error_code in _UNKNOWN_ORDER_CODES
+        )
+
+    def get_delay(self, http_method, error, attempt, elapsed, idempotent=False):
+        """return the seconds to wait before retrying, or None if the error must be raised
+
+        ``idempotent`` tells that the request is safe to resend whatever its method.
+        """
+
+        if attempt >= self.max_retries:
+            return None
+        if not self._retryable(http_method, error, idempotent):
+            return None
+        delay = max(self.backoff(attempt), _retry_after(error))
+        if self.total_timeout is not None and elapsed + delay > self.total_timeout:
+            return None
+        return delay
+
+    def _retryable(self, http_method, error, idempotent):
+        if isinstance(error, ClientError):
+            return (
+                error.status_code in _REJECTED_STATUS
+                or error.error_code in _TIMESTAMP_ERROR_CODES
+            )
+        if _not_sent(error):
+            return True
+        if _unknown_outcome(error):
+            return idempotent or http_method in self.idempotent_methods
+        return False
@@ -1,4 +1,6 @@
+import base64
 import json
+import os
 import time
 
 from urllib.parse import urlencode, urlparse
@@ -8,6 +10,25 @@ from binance.error import (
     ParameterTypeError,
 )
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # pragma: no cover
+    ujson = None
+
+# the fastest JSON decoder available: orjson, ujson, then the standard library.
+# All of them accept bytes and raise a ValueError subclass on invalid input.
+if orjson is not None:
+    json_loads = orjson.loads
+elif ujson is not None:
+    json_loads = ujson.loads
+else:
+    json_loads = json.loads
+
 
 def cleanNoneValue(d) -> dict:
     out = {}
@@ -48,6 +69,12 @@ def get_timestamp():
     return int(time.time() * 1000)
 
 
+def new_client_order_id(prefix=""):
+    """a unique client order id: ``prefix`` followed by 16 url-safe characters (96 random bits)"""
+
+    return prefix + base64.urlsafe_b64encode(os.urandom(12)).decode()
+
+
 def encoded_string(query, special=False):
     if special:
         return urlencode(query).replace("%40", "@").replace("%27", "%22")
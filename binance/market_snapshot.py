@@ -0,0 +1,195 @@
+import array
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from binance.error import ParameterArgumentError
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+# all-symbols endpoint -> (column, response field) read from each of its items
+SNAPSHOT_COLUMNS = {
+    "mark_price": (
+        ("mark_price", "markPrice"),
+        ("index_price", "indexPrice"),
+        ("funding_rate", "lastFundingRate"),
+        ("next_funding_time", "nextFundingTime"),
+    ),
+    "ticker_price": (("price", "price"),),
+    "book_ticker": (
+        ("bid_price", "bidPrice"),
+        ("bid_quantity", "bidQty"),
+        ("ask_price", "askPrice"),
+        ("ask_quantity", "askQty"),
+    ),
+    "ticker_24hr_price_change": (
+        ("price_change_percent", "priceChangePercent"),
+        ("high_price", "highPrice"),
+        ("low_price", "lowPrice"),
+        ("volume", "volume"),
+        ("quote_volume", "quoteVolume"),
+    ),
+}
+
+_NAN = float("nan")
+
+
+def _float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        # missing field, or empty string (e.g. the funding rate of delivery contracts)
+        return _NAN
+
+
+def _column(values):
+    if numpy is not None:
+        return numpy.array(values, dtype=numpy.float64)
+    return array.array("d", values)
+
+
+class MarketSnapshot(object):
+    """Prices of every symbol, from one request per all-symbols endpoint
+
+    ``mark_price()``, ``ticker_price()``, ``book_ticker()`` and ``ticker_24hr_price_change()``
+    are called without symbol, concurrently, and their fields are stored as float columns
+    (numpy arrays when numpy is installed, ``array.array`` otherwise) with one row per symbol,
+    see ``SNAPSHOT_COLUMNS``. Per-symbol reads are served from memory. Fields missing for a
+    symbol are NaN.
+
+    Args:
+        client (UMFutures or CMFutures): the client used to load (and refresh) the snapshot. Asyncio clients can't be used here, see ``from_responses``
+    Keyword Args:
+        endpoints (tuple, optional): the endpoints loaded, the 24hr ticker weighing 40. By default, all of ``SNAPSHOT_COLUMNS``
+        refresh_interval (float, optional): reload the snapshot every that many seconds in a daemon thread. By default, it's loaded once
+    """
+
+    def __init__(
+        self, client=None, endpoints=tuple(SNAPSHOT_COLUMNS), refresh_interval=None
+    ):
+        for endpoint in endpoints:
+            if endpoint not in SNAPSHOT_COLUMNS:
+                raise ParameterArgumentError(
+                    "unknown snapshot endpoint: {}".format(endpoint)
+                )
+        self.client = client
+        self.endpoints = tuple(endpoints)
+        # (symbols, symbol -> row, column -> values, load time), replaced at once
+        self._state = ((), {}, {}, None)
+        self._stop = None
+        if client is not None:
+            self.refresh()
+        if refresh_interval:
+            self._stop = threading.Event()
+            threading.Thread(
+                target=self._refresh_loop,
+                args=(self._stop, refresh_interval),
+                daemon=True,
+            ).start()
+
+    @classmethod
+    def from_responses(cls, responses):
+        """build a snapshot from a dict of endpoint -> all-symbols response, e.g. awaited from an asyncio client"""
+
+        snapshot = cls(endpoints=tuple(responses))
+        snapshot.load(responses)
+        return snapshot
+
+    def refresh(self):
+        with ThreadPoolExecutor(max_workers=len(self.endpoints)) as executor:
+            responses = list(
+                executor.map(
+                    lambda endpoint: getattr(self.client, endpoint)(), self.endpoints
+                )
+            )
+        self.load(dict(zip(self.endpoints, responses)))
+
+    def load(self, responses):
+        items = {}
+        for endpoint, response in responses.items():
+            if isinstance(response, dict):
+                response = response["data"]
+            items[endpoint] = response
+        symbols = sorted(
+            {item["symbol"] for response in items.values() for item in response}
+        )
+        rows = {symbol: row for row, symbol in enumerate(symbols)}
+        columns = {}
+        for endpoint, response in items.items():
+            fields = SNAPSHOT_COLUMNS[endpoint]
+            values = {column: [_NAN] * len(symbols) for column, _ in fields}
+            for item in response:
+                row = rows[item["symbol"]]
+                for column, field in fields:
+                    values[column][row] = _float(item.get(field))
+            for column, column_values in values.items():
+                columns[column] = _column(column_values)
+        self._state = (symbols, rows, columns, time.time())
+
+    def stop(self):
+        if self._stop is not None:
+            self._stop.set()
+            self._stop = None
+
+    def _refresh_loop(self, stop, interval):
+        while not stop.wait(interval):
+            try:
+                self.refresh()
+            except Exception as e:
+                logging.warning("Failed to refresh market snapshot: {}".format(e))
+
+    @property
+    def symbols(self):
+        return self._state[0]
+
+    @property
+    def columns(self):
+        """column name -> values, in the order of ``symbols``"""
+
+        return self._state[2]
+
+    @property
+    def updated_at(self):
+        """the time the snapshot was loaded, in seconds since the epoch"""
+
+        return self._state[3]
+
+    def __contains__(self, symbol):
+        return symbol in self._state[1]
+
+    def __iter__(self):
+        return iter(self._state[0])
+
+    def __len__(self):
+        return len(self._state[0])
+
+    def get(self, symbol, column, default=None):
+        """the ``column`` value of ``symbol``, ``default`` if the symbol is unknown"""
+
+        _, rows, columns, _ = self._state
+        row = rows.get(symbol)
+        if row is None:
+            return default
+        return float(columns[column][row])
+
+    def row(self, symbol):
+        """all the values of ``symbol``, as a dict"""
+
+        _, rows, columns, _ = self._state
+        row = rows[symbol]
+        return {column: float(values[row]) for column, values in columns.items()}
+
+    def mark_price(self, symbol):
+        return self.get(symbol, "mark_price")
+
+    def price(self, symbol):
+        return self.get(symbol, "price")
+
+    def bid_ask(self, symbol):
+        """(bid price, ask price) of the book ticker"""
+
+        return self.get(symbol, "bid_price"), self.get(symbol, "ask_price")
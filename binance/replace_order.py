@@ -0,0 +1,176 @@
+from binance.error import ClientError, ParameterArgumentError
+
+# new order parameters that modify_order can apply to a LIMIT order
+_MODIFIABLE_PARAMS = (
+    "side",
+    "type",
+    "quantity",
+    "price",
+    "timeInForce",
+    "recvWindow",
+)
+# -2013 the order does not exist (filled, cancelled or expired)
+_UNKNOWN_ORDER_CODES = (-2013,)
+
+
+class ReplaceResult(object):
+    """Outcome of ``replace_order``
+
+    ``modified`` tells whether ``modify_order`` was used, ``order`` being the modified order
+    or ``order_error`` the reason it wasn't. Otherwise ``order`` is the new order and
+    ``cancelled`` the cancellation of the old one. A failed step leaves its response None and
+    its exception in ``order_error`` or ``cancel_error``. The old order is only cancelled once
+    the new one is placed: when ``order_error`` is set, the old order is still open, and when
+    ``cancel_error`` is set, both orders may be open.
+    """
+
+    __slots__ = ("modified", "order", "cancelled", "order_error", "cancel_error")
+
+    def __init__(
+        self,
+        modified,
+        order=None,
+        cancelled=None,
+        order_error=None,
+        cancel_error=None,
+    ):
+        self.modified = modified
+        self.order = order
+        self.cancelled = cancelled
+        self.order_error = order_error
+        self.cancel_error = cancel_error
+
+    @property
+    def ok(self):
+        return self.order_error is None and self.cancel_error is None
+
+    def __repr__(self):
+        return (
+            "ReplaceResult(modified={}, order={}, cancelled={}, "
+            "order_error={!r}, cancel_error={!r})"
+        ).format(
+            self.modified,
+            self.order,
+            self.cancelled,
+            self.order_error,
+            self.cancel_error,
+        )
+
+
+def _check_ids(orderId, origClientOrderId):
+    if orderId is None and origClientOrderId is None:
+        raise ParameterArgumentError("either orderId or origClientOrderId must be sent")
+
+
+def _can_modify(new_order):
+    return (
+        new_order.get("type") == "LIMIT"
+        and "quantity" in new_order
+        and "price" in new_order
+        and all(name in _MODIFIABLE_PARAMS for name in new_order)
+    )
+
+
+def _modify_params(new_order):
+    return {
+        name: value
+        for name, value in new_order.items()
+        if name not in ("type", "timeInForce")
+    }
+
+
+def _fall_back(error):
+    """whether a failed modification can be replaced by a new order and a cancellation"""
+
+    # the order being gone or an unknown outcome must not lead to a second order
+    return (
+        isinstance(error, ClientError) and error.error_code not in _UNKNOWN_ORDER_CODES
+    )
+
+
+def _result(placed, cancelled=None):
+    if isinstance(placed, Exception):
+        return ReplaceResult(False, order_error=placed)
+    return ReplaceResult(
+        False,
+        order=placed,
+        cancelled=None if isinstance(cancelled, Exception) else cancelled,
+        cancel_error=cancelled if isinstance(cancelled, Exception) else None,
+    )
+
+
+def replace_order(client, symbol, new_order, orderId=None, origClientOrderId=None):
+    """Replace an open order of ``symbol`` by ``new_order``
+
+    ``new_order`` holds the ``new_order`` parameters of the replacement. A LIMIT replacement
+    only changing the side, quantity or price is done in place with ``modify_order``, in one
+    round trip, which keeps the other parameters of the order. Otherwise, or if the
+    modification is refused (e.g. the old order isn't a LIMIT order), the new order is placed
+    and the old one cancelled once the new one is acknowledged, so that the position is never
+    left without an order in between. If the new order fails, the old one is kept.
+    Returns a ``ReplaceResult``.
+
+    e.g. replace_order(client, "BTCUSDT", {"side": "SELL", "type": "STOP_MARKET", "stopPrice": 59000, "quantity": 0.01, "reduceOnly": "true"}, orderId=12345)
+    """
+
+    _check_ids(orderId, origClientOrderId)
+    if _can_modify(new_order):
+        try:
+            return ReplaceResult(
+                True,
+                order=client.modify_order(
+                    symbol,
+                    orderId=orderId,
+                    origClientOrderId=origClientOrderId,
+                    **_modify_params(new_order)
+                ),
+            )
+        except Exception as e:
+            if not _fall_back(e):
+                return ReplaceResult(True, order_error=e)
+
+    try:
+        placed = client.new_order(symbol=symbol, **new_order)
+    except Exception as e:
+        return _result(e)
+    try:
+        cancelled = client.cancel_order(
+            symbol, orderId=orderId, origClientOrderId=origClientOrderId
+        )
+    except Exception as e:
+        cancelled = e
+    return _result(placed, cancelled)
+
+
+async def async_replace_order(
+    client, symbol, new_order, orderId=None, origClientOrderId=None
+):
+    """Same as ``replace_order``, with an asyncio client"""
+
+    _check_ids(orderId, origClientOrderId)
+    if _can_modify(new_order):
+        try:
+            return ReplaceResult(
+                True,
+                order=await client.modify_order(
+                    symbol,
+                    orderId=orderId,
+                    origClientOrderId=origClientOrderId,
+                    **_modify_params(new_order)
+                ),
+            )
+        except Exception as e:
+            if not _fall_back(e):
+                return ReplaceResult(True, order_error=e)
+
+    try:
+        placed = await client.new_order(symbol=symbol, **new_order)
+    except Exception as e:
+        return _result(e)
+    try:
+        cancelled = await client.cancel_order(
+            symbol, orderId=orderId, origClientOrderId=origClientOrderId
+        )
+    except Exception as e:
+        cancelled = e
+    return _result(placed, cancelled)
@@ -0,0 +1,286 @@
+import logging
+import math
+import threading
+from decimal import Decimal
+
+from binance.error import ParameterArgumentError
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+# tolerance of the float divisions by tick/step size, e.g. 0.3 / 0.1 = 2.9999999999999996
+_EPSILON = 1e-9
+
+
+def _decimals(value):
+    """number of decimals of a filter value, e.g. "0.00100000" -> 3"""
+
+    exponent = Decimal(value).normalize().as_tuple().exponent
+    return max(0, -exponent)
+
+
+def _round_to(value, increment, decimals, rounding):
+    if rounding == "down":
+        steps = math.floor(value / increment + _EPSILON)
+    elif rounding == "up":
+        steps = math.ceil(value / increment - _EPSILON)
+    else:
+        steps = round(value / increment)
+    return round(steps * increment, decimals)
+
+
+def _round_array(values, increment, decimals, rounding):
+    if numpy is not None and isinstance(values, numpy.ndarray):
+        if rounding == "down":
+            steps = numpy.floor(values / increment + _EPSILON)
+        elif rounding == "up":
+            steps = numpy.ceil(values / increment - _EPSILON)
+        else:
+            steps = numpy.round(values / increment)
+        return numpy.round(steps * increment, decimals)
+    if isinstance(values, (list, tuple)):
+        return [_round_to(float(v), increment, decimals, rounding) for v in values]
+    return _round_to(float(values), increment, decimals, rounding)
+
+
+class SymbolFilters(object):
+    """Trading rules of one symbol, parsed from its ``exchange_info()`` entry"""
+
+    __slots__ = (
+        "symbol",
+        "pair",
+        "contract_type",
+        "status",
+        "base_asset",
+        "quote_asset",
+        "min_price",
+        "max_price",
+        "tick_size",
+        "price_decimals",
+        "min_qty",
+        "max_qty",
+        "step_size",
+        "qty_decimals",
+        "market_min_qty",
+        "market_max_qty",
+        "market_step_size",
+        "min_notional",
+        "multiplier_up",
+        "multiplier_down",
+    )
+
+    def __init__(self, info):
+        self.symbol = info["symbol"]
+        self.pair = info.get("pair")
+        self.contract_type = info.get("contractType")
+        self.status = info.get("status") or info.get("contractStatus")
+        self.base_asset = info.get("baseAsset")
+        self.quote_asset = info.get("quoteAsset")
+        self.min_price = self.max_price = 0.0
+        self.tick_size = 10 ** -info.get("pricePrecision", 8)
+        self.price_decimals = info.get("pricePrecision", 8)
+        self.min_qty = self.max_qty = 0.0
+        self.step_size = 10 ** -info.get("quantityPrecision", 8)
+        self.qty_decimals = info.get("quantityPrecision", 8)
+        self.market_min_qty = self.market_max_qty = self.market_step_size = None
+        self.min_notional = 0.0
+        self.multiplier_up = self.multiplier_down = None
+
+        for f in info.get("filters", []):
+            filter_type = f.get("filterType")
+            if filter_type == "PRICE_FILTER":
+                self.min_price = float(f["minPrice"])
+                self.max_price = float(f["maxPrice"])
+                self.tick_size = float(f["tickSize"])
+                self.price_decimals = _decimals(f["tickSize"])
+            elif filter_type == "LOT_SIZE":
+                self.min_qty = float(f["minQty"])
+                self.max_qty = float(f["maxQty"])
+                self.step_size = float(f["stepSize"])
+                self.qty_decimals = _decimals(f["stepSize"])
+            elif filter_type == "MARKET_LOT_SIZE":
+                self.market_min_qty = float(f["minQty"])
+                self.market_max_qty = float(f["maxQty"])
+                self.market_step_size = float(f["stepSize"])
+            elif filter_type == "MIN_NOTIONAL":
+                self.min_notional = float(f.get("notional", f.get("minNotional", 0)))
+            elif filter_type == "PERCENT_PRICE":
+                self.multiplier_up = float(f["multiplierUp"])
+                self.multiplier_down = float(f["multiplierDown"])
+
+    def __repr__(self):
+        return "SymbolFilters({})".format(self.symbol)
+
+    def round_price(self, price, rounding="nearest"):
+        """round price(s) to the tick size; ``rounding`` is "nearest", "down" or "up".
+        Accepts a number, a list or a numpy array."""
+
+        return _round_array(price, self.tick_size, self.price_decimals, rounding)
+
+    def round_qty(self, qty, rounding="down"):
+        """round quantity(ies) to the step size, down by default so it never exceeds the
+        available amount. Accepts a number, a list or a numpy array."""
+
+        return _round_array(qty, self.step_size, self.qty_decimals, rounding)
+
+    def validate_order(self, quantity, price=None, order_type="LIMIT", mark_price=None):
+        """check an order against the filters before sending it
+
+        Raises ``ParameterArgumentError`` describing the first violated filter, the errors
+        Binance would otherwise answer with (e.g. -1111 precision, -4164 min notional).
+        ``mark_price`` enables the PERCENT_PRICE check.
+        """
+
+        quantity = float(quantity)
+        if order_type == "MARKET" and self.market_step_size is not None:
+            min_qty, max_qty, step = (
+                self.market_min_qty,
+                self.market_max_qty,
+                self.market_step_size,
+            )
+        else:
+            min_qty, max_qty, step = self.min_qty, self.max_qty, self.step_size
+
+        if quantity < min_qty or (max_qty and quantity > max_qty):
+            raise ParameterArgumentError(
+                "{} quantity {} is outside LOT_SIZE [{}, {}]".format(
+                    self.symbol, quantity, min_qty, max_qty
+                )
+            )
+        if abs(quantity / step - round(quantity / step)) > _EPSILON * 1000:
+            raise ParameterArgumentError(
+                "{} quantity {} is not a multiple of the step size {}".format(
+                    self.symbol, quantity, step
+                )
+            )
+        if price is None:
+            return
+
+        price = float(price)
+        if price < self.min_price or (self.max_price and price > self.max_price):
+            raise ParameterArgumentError(
+                "{} price {} is outside PRICE_FILTER [{}, {}]".format(
+                    self.symbol, price, self.min_price, self.max_price
+                )
+            )
+        ticks = price / self.tick_size
+        if abs(ticks - round(ticks)) > _EPSILON * 1000:
+            raise ParameterArgumentError(
+                "{} price {} is not a multiple of the tick size {}".format(
+                    self.symbol, price, self.tick_size
+                )
+            )
+        if self.min_notional and price * quantity < self.min_notional:
+            raise ParameterArgumentError(
+                "{} order notional {} is below MIN_NOTIONAL {}".format(
+                    self.symbol, price * quantity, self.min_notional
+                )
+            )
+        if mark_price is not None and self.multiplier_up is not None:
+            mark_price = float(mark_price)
+            if not (
+                mark_price * self.multiplier_down
+                <= price
+                <= mark_price * self.multiplier_up
+            ):
+                raise ParameterArgumentError(
+                    "{} price {} is outside PERCENT_PRICE of mark price {}".format(
+                        self.symbol, price, mark_price
+                    )
+                )
+
+
+class SymbolRegistry(object):
+    """Symbols of ``UMFutures.exchange_info()`` / ``CMFutures.exchange_info()``, indexed by name and pair
+
+    The filters of every symbol are parsed once into ``SymbolFilters``; lookups are dict reads.
+
+    Args:
+        client (UMFutures or CMFutures): the client used to load (and refresh) the exchange info. Asyncio clients can't be used here, see ``from_exchange_info``
+    Keyword Args:
+        refresh_interval (int, optional): reload the exchange info every that many seconds in a daemon thread. By default, it's loaded once
+    """
+
+    def __init__(self, client=None, refresh_interval=None):
+        self.client = client
+        self._symbols = {}
+        self._pairs = {}
+        self._stop = None
+        if client is not None:
+            self.refresh()
+        if refresh_interval:
+            self._stop = threading.Event()
+            threading.Thread(
+                target=self._refresh_loop,
+                args=(self._stop, refresh_interval),
+                daemon=True,
+            ).start()
+
+    @classmethod
+    def from_exchange_info(cls, exchange_info):
+        """build a registry from an ``exchange_info()`` response, e.g. awaited from an asyncio client"""
+
+        registry = cls()
+        registry.load(exchange_info)
+        return registry
+
+    def refresh(self):
+        self.load(self.client.exchange_info())
+
+    def load(self, exchange_info):
+        if "symbols" not in exchange_info and "data" in exchange_info:
+            exchange_info = exchange_info["data"]
+        symbols = {}
+        pairs = {}
+        for info in exchange_info["symbols"]:
+            filters = SymbolFilters(info)
+            symbols[filters.symbol] = filters
+            if filters.pair:
+                pairs.setdefault(filters.pair, []).append(filters)
+        # replace the indexes at once, readers never see a partial update
+        self._symbols, self._pairs = symbols, pairs
+
+    def stop(self):
+        if self._stop is not None:
+            self._stop.set()
+            self._stop = None
+
+    def _refresh_loop(self, stop, interval):
+        while not stop.wait(interval):
+            try:
+                self.refresh()
+            except Exception as e:
+                logging.warning("Failed to refresh exchange info: {}".format(e))
+
+    def __getitem__(self, symbol):
+        return self._symbols[symbol]
+
+    def __contains__(self, symbol):
+        return symbol in self._symbols
+
+    def __iter__(self):
+        return iter(self._symbols)
+
+    def __len__(self):
+        return len(self._symbols)
+
+    def get(self, symbol, default=None):
+        return self._symbols.get(symbol, default)
+
+    def by_pair(self, pair):
+        """all the symbols (perpetual and delivery contracts) of a pair"""
+
+        return list(self._pairs.get(pair, ()))
+
+    def round_price(self, symbol, price, rounding="nearest"):
+        return self._symbols[symbol].round_price(price, rounding)
+
+    def round_qty(self, symbol, qty, rounding="down"):
+        return self._symbols[symbol].round_qty(qty, rounding)
+
+    def validate_order(
+        self, symbol, quantity, price=None, order_type="LIMIT", mark_price=None
+    ):
+        self._symbols[symbol].validate_order(quantity, price, order_type, mark_price)
@@ -0,0 +1,191 @@
+import asyncio
+import inspect
+import logging
+import random
+
+from binance.lib.utils import get_timestamp
+from binance.websocket.events import parse_event
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None
+
+
+class _StreamNames(object):
+    """stands in for a websocket client to collect the stream names built by its methods"""
+
+    def __init__(self):
+        self.names = []
+
+    def send_message_to_server(self, message, action=None, id=None, **kwargs):
+        if isinstance(message, str):
+            self.names.append(message)
+        else:
+            self.names.extend(message)
+
+
+class AsyncWebsocketClient(object):
+    """asyncio websocket client, reading streams with ``async for``
+
+    Each ``stream()`` call opens one combined stream connection on the running event loop;
+    all of them share one ``aiohttp.ClientSession``, so hundreds of connections need no thread.
+    Messages are yielded as received (text), the ``{"stream": ..., "data": ...}`` envelope of
+    combined streams included. A lost connection is reopened with jittered exponential backoff.
+    The stream methods of ``stream_client_class`` (``agg_trade``, ``diff_book_depth``, ...)
+    return the stream names here instead of subscribing. Requires the optional ``aiohttp``
+    dependency.
+
+    Keyword Args:
+        on_reconnect (callable, optional): called (or awaited) with the client and the disconnection and reconnection timestamps (ms)
+        reconnect (bool, optional): whether to reopen lost connections. By default, it's True
+        reconnect_backoff (float, optional): the first backoff in seconds, doubled on each failed attempt, with full jitter. By default, it's 1
+        max_reconnect_backoff (float, optional): the cap of the backoff, in seconds. By default, it's 60
+        proxies (obj, optional): Dictionary mapping protocol to the URL of the proxy. e.g. {'http': 'http://1.2.3.4:8080'}
+        parse_events (bool, optional): whether to yield parsed events, see ``binance.websocket.events.parse_event``. By default, it's False
+    """
+
+    # the threaded client whose stream name builders are reused
+    stream_client_class = None
+
+    def __init__(
+        self,
+        stream_url,
+        on_reconnect=None,
+        reconnect=True,
+        reconnect_backoff=1,
+        max_reconnect_backoff=60,
+        logger=None,
+        proxies=None,
+        parse_events=False,
+    ):
+        if aiohttp is None:
+            raise ImportError(
+                "aiohttp is required for the asyncio clients, install it with `pip install aiohttp`"
+            )
+        if not logger:
+            logger = logging.getLogger(__name__)
+        self.logger = logger
+        self.stream_url = stream_url
+        self.on_reconnect = on_reconnect
+        self.reconnect = reconnect
+        self.reconnect_backoff = reconnect_backoff
+        self.max_reconnect_backoff = max_reconnect_backoff
+        self.proxies = proxies
+        self.parse_events = parse_events
+        self.session = None
+        self._closed = False
+
+    def __getattr__(self, name):
+        method = getattr(self.stream_client_class, name, None)
+        if name.startswith("_") or not callable(method):
+            raise AttributeError(name)
+
+        def build(*args, **kwargs):
+            names = _StreamNames()
+            method(names, *args, **kwargs)
+            return names.names[0] if len(names.names) == 1 else names.names
+
+        return build
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    async def close(self):
+        self._closed = True
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+        self.session = None
+
+    async def stream(self, *streams):
+        """yield the messages of ``streams``, e.g. stream("btcusdt@aggTrade", client.book_ticker("ethusdt"))"""
+
+        url = self._combined_url(streams)
+        attempt = 0
+        disconnected_at = None
+        while not self._closed:
+            try:
+                ws = await self._get_session().ws_connect(url, proxy=self._get_proxy())
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if not self.reconnect or disconnected_at is None:
+                    raise
+                self.logger.error("Failed to reconnect: {}".format(e))
+                attempt += 1
+                await asyncio.sleep(self._backoff(attempt))
+                continue
+
+            if disconnected_at is not None:
+                await self._notify_reconnect(disconnected_at)
+            attempt = 0
+            try:
+                async for data in self._messages(ws):
+                    yield data
+            finally:
+                await ws.close()
+
+            if not self.reconnect or self._closed:
+                return
+            self.logger.error("Lost websocket connection")
+            disconnected_at = get_timestamp()
+            await asyncio.sleep(self._backoff(attempt))
+
+    async def _messages(self, ws):
+        """the data of the messages of ``ws``, until its connection is lost"""
+
+        async for message in ws:
+            if message.type == aiohttp.WSMsgType.ERROR:
+                self.logger.error("Websocket exception: {}".format(ws.exception()))
+                return
+            if message.type not in (aiohttp.WSMsgType.TEXT, aiohttp.WSMsgType.BINARY):
+                continue
+            if not self.parse_events:
+                yield message.data
+                continue
+            try:
+                event = parse_event(message.data)
+            except (ValueError, KeyError, TypeError) as e:
+                self.logger.error(
+                    "Failed to parse message {!r}: {}".format(message.data, e)
+                )
+                continue
+            yield event
+
+    def _combined_url(self, streams):
+        names = []
+        for stream in streams:
+            if isinstance(stream, str):
+                names.append(stream)
+            else:
+                names.extend(stream)
+        return "{}/stream?streams={}".format(self.stream_url, "/".join(names))
+
+    def _backoff(self, attempt):
+        return random.uniform(
+            0, min(self.max_reconnect_backoff, self.reconnect_backoff * (2**attempt))
+        )
+
+    async def _notify_reconnect(self, disconnected_at):
+        if not self.on_reconnect:
+            return
+        try:
+            result = self.on_reconnect(self, disconnected_at, get_timestamp())
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            self.logger.error("Error from callback {}: {}".format(self.on_reconnect, e))
+
+    def _get_session(self):
+        if self.session is None or self.session.closed:
+            # no cap on the number of connections, one per stream() call
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=0)
+            )
+        return self.session
+
+    def _get_proxy(self):
+        if not self.proxies:
+            return None
+        return self.proxies.get("http") or self.proxies.get("https")
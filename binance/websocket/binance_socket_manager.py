@@ -1,6 +1,8 @@
 from typing import Optional
 
+import json
 import logging
+import random
 import threading
 from websocket import (
     ABNF,
@@ -8,7 +10,11 @@ from websocket import (
     WebSocketException,
     WebSocketConnectionClosedException,
 )
-from binance.lib.utils import parse_proxies
+from binance.lib.utils import get_timestamp, parse_proxies
+from binance.websocket.events import parse_event
+
+# streams per SUBSCRIBE message when replaying the subscriptions after a reconnect
+_RESUBSCRIBE_CHUNK = 200
 
 
 class BinanceSocketManager(threading.Thread):
@@ -23,6 +29,12 @@ class BinanceSocketManager(threading.Thread):
         on_pong=None,
         logger=None,
         proxies: Optional[dict] = None,
+        on_reconnect=None,
+        reconnect=True,
+        reconnect_backoff=1,
+        max_reconnect_backoff=60,
+        message_queue=None,
+        parse_events=False,
     ):
         threading.Thread.__init__(self)
         if not logger:
@@ -36,6 +48,16 @@ class BinanceSocketManager(threading.Thread):
         self.on_pong = on_pong
         self.on_error = on_error
         self.proxies = proxies
+        self.on_reconnect = on_reconnect
+        self.reconnect = reconnect
+        self.reconnect_backoff = reconnect_backoff
+        self.max_reconnect_backoff = max_reconnect_backoff
+        self.message_queue = message_queue
+        self.parse_events = parse_events
+        # ordered set of the subscribed streams, replayed after a reconnect
+        self.subscriptions = {}
+        self._lock = threading.RLock()
+        self._closing = threading.Event()
 
         self._proxy_params = parse_proxies(proxies) if proxies else {}
 
@@ -52,57 +74,164 @@ class BinanceSocketManager(threading.Thread):
         self._callback(self.on_open)
 
     def run(self):
-        self.read_data()
+        if self.message_queue is None:
+            self.read_data()
+            return
+        self.message_queue.start(self._handle_message)
+        try:
+            self.read_data()
+        finally:
+            self.message_queue.stop(self._handle_message)
 
     def send_message(self, message):
+        if self.reconnect and not self.ws.connected:
+            self.logger.warning("Websocket disconnected, message not sent: %s", message)
+            return
         self.logger.debug("Sending message to Binance WebSocket Server: %s", message)
         self.ws.send(message)
 
+    def send_subscription(self, method, streams, id):
+        """send a SUBSCRIBE/UNSUBSCRIBE message and keep track of the active streams"""
+
+        with self._lock:
+            if method == "SUBSCRIBE":
+                self.subscriptions.update(dict.fromkeys(streams))
+            else:
+                for stream in streams:
+                    self.subscriptions.pop(stream, None)
+            self.send_message(
+                json.dumps({"method": method, "params": streams, "id": id})
+            )
+
     def ping(self):
         self.ws.ping()
 
     def read_data(self):
-        data = ""
+        while self._read_frames() and self._reconnect():
+            pass
+
+    def _read_frames(self):
+        """read until the connection is lost, return True if it should be reconnected"""
+
         while True:
             try:
                 op_code, frame = self.ws.recv_data_frame(True)
-            except WebSocketException as e:
-                if isinstance(e, WebSocketConnectionClosedException):
-                    self.logger.error("Lost websocket connection")
-                else:
-                    self.logger.error("Websocket exception: {}".format(e))
-                self._handle_exception(e)
-                break
             except Exception as e:
-                self.logger.error("Exception in read_data: {}".format(e))
-                self._handle_exception(e)
-                break
+                return self._on_read_error(e)
 
             if op_code == ABNF.OPCODE_CLOSE:
                 self.logger.warning(
                     "CLOSE frame received, closing websocket connection"
                 )
                 self._callback(self.on_close)
-                break
-            elif op_code == ABNF.OPCODE_PING:
-                self._callback(self.on_ping, frame.data)
-                self.ws.pong("")
-                self.logger.debug("Received Ping; PONG frame sent back")
-            elif op_code == ABNF.OPCODE_PONG:
-                self.logger.debug("Received PONG frame")
-                self._callback(self.on_pong)
+                return self.reconnect and not self._closing.is_set()
+            self._on_frame(op_code, frame)
+
+    def _on_read_error(self, e):
+        if self._closing.is_set():
+            return False
+        if isinstance(e, WebSocketConnectionClosedException):
+            self.logger.error("Lost websocket connection")
+        elif isinstance(e, WebSocketException):
+            self.logger.error("Websocket exception: {}".format(e))
+        else:
+            self.logger.error("Exception in read_data: {}".format(e))
+        return self._lost(e)
+
+    def _on_frame(self, op_code, frame):
+        if op_code == ABNF.OPCODE_PING:
+            self._callback(self.on_ping, frame.data)
+            self.ws.pong("")
+            self.logger.debug("Received Ping; PONG frame sent back")
+        elif op_code == ABNF.OPCODE_PONG:
+            self.logger.debug("Received PONG frame")
+            self._callback(self.on_pong)
+        else:
+            data = frame.data
+            if op_code == ABNF.OPCODE_TEXT and not self.parse_events:
+                data = data.decode("utf-8")
+            if self.message_queue is None:
+                self._handle_message(data)
             else:
-                data = frame.data
-                if op_code == ABNF.OPCODE_TEXT:
-                    data = data.decode("utf-8")
-                self._callback(self.on_message, data)
+                self.message_queue.put(self._handle_message, data)
+
+    def _lost(self, e):
+        if not self.reconnect:
+            self._handle_exception(e)
+            return False
+        if self.on_error:
+            self.on_error(self, e)
+        return True
+
+    def _reconnect(self):
+        """reconnect with jittered exponential backoff and replay the subscriptions
+
+        ``on_reconnect`` is then called with the disconnection and reconnection timestamps
+        (ms), the window in which messages were missed.
+        """
+
+        disconnected_at = get_timestamp()
+        self._close_socket()
+        attempt = 0
+        while True:
+            delay = random.uniform(
+                0,
+                min(self.max_reconnect_backoff, self.reconnect_backoff * (2**attempt)),
+            )
+            if self._closing.wait(delay):
+                return False
+            self.logger.warning(
+                "Reconnecting to {}, attempt {}".format(self.stream_url, attempt + 1)
+            )
+            try:
+                with self._lock:
+                    self.create_ws_connection()
+                    self._resubscribe()
+            except Exception as e:
+                self.logger.error("Failed to reconnect: {}".format(e))
+                attempt += 1
+                continue
+            self._callback(self.on_reconnect, disconnected_at, get_timestamp())
+            return True
+
+    def _close_socket(self):
+        # the connection is already lost, release its socket without a close handshake
+        try:
+            self.ws.shutdown()
+        except Exception:
+            pass
+
+    def _resubscribe(self):
+        streams = list(self.subscriptions)
+        for start in range(0, len(streams), _RESUBSCRIBE_CHUNK):
+            end = start + _RESUBSCRIBE_CHUNK
+            self.ws.send(
+                json.dumps(
+                    {
+                        "method": "SUBSCRIBE",
+                        "params": streams[start:end],
+                        "id": get_timestamp(),
+                    }
+                )
+            )
 
     def close(self):
+        self._closing.set()
         if not self.ws.connected:
             self.logger.warning("Websocket already closed")
         else:
             self.ws.send_close()
 
+    def _handle_message(self, data):
+        if self.parse_events:
+            # decoded from the frame bytes, once for all the handlers
+            try:
+                data = parse_event(data)
+            except (ValueError, KeyError, TypeError) as e:
+                self.logger.error("Failed to parse message {!r}: {}".format(data, e))
+                return
+        self._callback(self.on_message, data)
+
     def _callback(self, callback, *args):
         if callback:
             try:
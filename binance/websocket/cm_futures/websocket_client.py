@@ -1,5 +1,6 @@
 from typing import Optional
 
+from binance.websocket.async_websocket_client import AsyncWebsocketClient
 from binance.websocket.websocket_client import BinanceWebsocketClient
 
 
@@ -15,6 +16,12 @@ class CMFuturesWebsocketClient(BinanceWebsocketClient):
         on_pong=None,
         is_combined=False,
         proxies: Optional[dict] = None,
+        on_reconnect=None,
+        reconnect=True,
+        reconnect_backoff=1,
+        max_reconnect_backoff=60,
+        message_queue=None,
+        parse_events=False,
     ):
         if is_combined:
             stream_url = stream_url + "/stream"
@@ -29,6 +36,12 @@ class CMFuturesWebsocketClient(BinanceWebsocketClient):
             on_ping=on_ping,
             on_pong=on_pong,
             proxies=proxies,
+            on_reconnect=on_reconnect,
+            reconnect=reconnect,
+            reconnect_backoff=reconnect_backoff,
+            max_reconnect_backoff=max_reconnect_backoff,
+            message_queue=message_queue,
+            parse_events=parse_events,
         )
 
     def agg_trade(self, symbol: str, id=None, action=None, **kwargs):
@@ -45,7 +58,9 @@ class CMFuturesWebsocketClient(BinanceWebsocketClient):
         """
         stream_name = "{}@aggTrade".format(symbol.lower())
 
-        self.send_message_to_server(stream_name, action=action, id=id)
+        self.send_message_to_server(
+            stream_name, action=action, id=id, handler=kwargs.get("handler")
+        )
 
     def index_price(self, pair: str, id=None, speed=1, action=None, **kwargs):
         """Index Price Streams
@@ -61,7 +76,9 @@ class CMFuturesWebsocketClient(BinanceWebsocketClient):
         else:
             stream_name = "{}@indexPrice".format(pair.lower())
 
-        self.send_message_to_server(stream_name, action=action, id=id)
+        self.send_message_to_server(
+            stream_name, action=action, id=id, handler=kwargs.get("handler")
+        )
 
     def mark_price(self, symbol: str, speed=1, id=None, action=None, **kwargs):
         """Mark Price Streams
@@ -77,7 +94,9 @@ class CMFuturesWebsocketClient(BinanceWebsocketClient):
         else:
             stream_name = "{}@markPrice".format(symbol.lower())
 
-        self.send_message_to_server(stream_name, action=action, id=id)
+        self.send_message_to_server(
+            stream_name, action=action, id=id, handler=kwargs.get("handler")
+        )
 
     def pair_mark_price(self, pair: str, speed=1, id=None, action=None, **kwargs):
         """Mark Price of All Symbols of a Pair
@@ -93,7 +112,9 @@ class CMFuturesWebsocketClient(BinanceWebsocketClient):
         else:
             stream_name = "{}@markPrice".format(pair.lower())
 
-        self.send_message_to_server(stream_name, action=action, id=id)
+        self.send_message_to_server(
+            stream_name, action=action, id=id, handler=kwargs.get("handler")
+        )
 
     def kline(self, symbol: str, interval: str, id=None, action=None, **kwargs):
         """Kline/Candlestick Streams
@@ -127,7 +148,9 @@ class CMFuturesWebsocketClient(BinanceWebsocketClient):
         """
         stream_name = "{}@kline_{}".format(symbol.lower(), interval)
 
-        self.send_message_to_server(stream_name, action=action, id=id)
+        self.send_message_to_server(
+            stream_name, action=action, id=id, handler=kwargs.get("handler")
+        )
 
     def continuous_kline(
         self,
@@ -171,7 +194,9 @@ class CMFuturesWebsocketClient(BinanceWebsocketClient):
             pair.lower(), contractType, interval
         )
 
-        self.send_message_to_server(stream_name, action=action, id=id)
+        self.send_message_to_server(
+            stream_name, action=action, id=id, handler=kwargs.get("handler")
+        )
 
     def index_kline(self, pair: str, interval: str, id=None, action=None, **kwargs):
         """Kline/Candlestick chart intervals Streams
@@ -203,7 +228,9 @@ class CMFuturesWebsocketClient(BinanceWebsocketClient):
         """
         stream_name = "{}@indexPriceKline_{}".format(pair.lower(), interval)
 
-        self.send_message_to_server(stream_name, action=action, id=id)
+        self.send_message_to_server(
+            stream_name, action=action, id=id, handler=kwargs.get("handler")
+        )
 
     def mark_kline(self, symbol: str, interval: str, id=None, action=None, **kwargs):
         """Kline/Candlestick chart intervals Streams
@@ -235,7 +262,9 @@ class CMFuturesWebsocketClient(BinanceWebsocketClient):
         """
         stream_name = "{}@markPriceKline_{}".format(symbol.lower(), interval)
 
-        self.send_message_to_server(stream_name, action=action, id=id)
+        self.send_message_to_server(
+            stream_name, action=action, id=id, handler=kwargs.get("handler")
+        )
 
     def mini_ticker(self, symbol=None, id=None, action=None, **kwargs):
         """Individual symbol or all symbols mini ticker
@@ -257,7 +286,9 @@ class CMFuturesWebsocketClient(BinanceWebsocketClient):
         else:
             stream_name = "{}@miniTicker".format(symbol.lower())
 
-        self.send_message_to_server(stream_name, action=action, id=id)
+        self.send_message_to_server(
+            stream_name, action=action, id=id, handler=kwargs.get("handler")
+        )
 
     def ticker(self, symbol=None, id=None, action=None, **kwargs):
         """Individual symbol or all symbols ticker
@@ -278,7 +309,9 @@ class CMFuturesWebsocketClient(BinanceWebsocketClient):
             stream_name = "!ticker@arr"
         else:
             stream_name = "{}@ticker".format(symbol.lower())
-        self.send_message_to_server(stream_name, action=action, id=id)
+        self.send_message_to_server(
+            stream_name, action=action, id=id, handler=kwargs.get("handler")
+        )
 
     def book_ticker(self, symbol, id=None, action=None, **kwargs):
         """Individual symbol or all book ticker
@@ -297,7 +330,9 @@ class CMFuturesWebsocketClient(BinanceWebsocketClient):
             stream_name = "!bookTicker"
         else:
             stream_name = "{}@bookTicker".format(symbol.lower())
-        self.send_message_to_server(stream_name, action=action, id=id)
+        self.send_message_to_server(
+            stream_name, action=action, id=id, handler=kwargs.get("handler")
+        )
 
     def diff_book_depth(self, symbol: str, speed=100, id=None, action=None, **kwargs):
         """Diff. Depth Stream
@@ -311,7 +346,10 @@ class CMFuturesWebsocketClient(BinanceWebsocketClient):
         """
 
         self.send_message_to_server(
-            "{}@depth@{}ms".format(symbol.lower(), speed), action=action, id=id
+            "{}@depth@{}ms".format(symbol.lower(), speed),
+            action=action,
+            id=id,
+            handler=kwargs.get("handler"),
         )
 
     def partial_book_depth(
@@ -328,7 +366,10 @@ class CMFuturesWebsocketClient(BinanceWebsocketClient):
         Update Speed: 250ms, 500ms or 100ms
         """
         self.send_message_to_server(
-            "{}@depth{}@{}ms".format(symbol.lower(), level, speed), id=id, action=action
+            "{}@depth{}@{}ms".format(symbol.lower(), level, speed),
+            id=id,
+            action=action,
+            handler=kwargs.get("handler"),
         )
 
     def liquidation_order(self, symbol: str, id=None, action=None, **kwargs):
@@ -348,8 +389,24 @@ class CMFuturesWebsocketClient(BinanceWebsocketClient):
             stream_name = "!forceOrder@arr"
         else:
             stream_name = "{}@forceOrder".format(symbol.lower())
-        self.send_message_to_server(stream_name, id=id, action=action)
+        self.send_message_to_server(
+            stream_name, id=id, action=action, handler=kwargs.get("handler")
+        )
 
     def user_data(self, listen_key: str, id=None, action=None, **kwargs):
         """Listen to user data by using the provided listen_key"""
-        self.send_message_to_server(listen_key, action=action, id=id)
+        self.send_message_to_server(
+            listen_key, action=action, id=id, handler=kwargs.get("handler")
+        )
+
+
+class AsyncCMFuturesWebsocketClient(AsyncWebsocketClient):
+    """asyncio counterpart of ``CMFuturesWebsocketClient``, see ``AsyncWebsocketClient``
+
+    e.g. async for message in client.stream(client.agg_trade("btcusdt")): ...
+    """
+
+    stream_client_class = CMFuturesWebsocketClient
+
+    def __init__(self, stream_url="wss://dstream.binance.com", **kwargs):
+        super().__init__(stream_url, **kwargs)
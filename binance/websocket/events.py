@@ -0,0 +1,369 @@
+from binance.lib.utils import json_loads
+
+_STREAM_PREFIX = '{"stream":"'
+_STREAM_PREFIX_BYTES = _STREAM_PREFIX.encode()
+
+
+def _levels(levels):
+    return [(float(price), float(quantity)) for price, quantity in levels]
+
+
+class Event(object):
+    """Base class of the parsed websocket events
+
+    ``stream`` is the stream name of combined stream messages, None for raw streams.
+    """
+
+    __slots__ = ("event_type", "event_time", "stream")
+
+    def __init__(self, data, stream=None):
+        self.event_type = data.get("e")
+        self.event_time = data.get("E")
+        self.stream = stream
+
+    def __repr__(self):
+        return "{}({})".format(
+            type(self).__name__,
+            ", ".join(
+                "{}={!r}".format(name, getattr(self, name))
+                for cls in reversed(type(self).__mro__)
+                for name in getattr(cls, "__slots__", ())
+            ),
+        )
+
+
+class AggTrade(Event):
+    __slots__ = (
+        "symbol",
+        "agg_trade_id",
+        "price",
+        "quantity",
+        "first_trade_id",
+        "last_trade_id",
+        "trade_time",
+        "is_buyer_maker",
+    )
+
+    def __init__(self, data, stream=None):
+        super().__init__(data, stream)
+        self.symbol = data["s"]
+        self.agg_trade_id = data["a"]
+        self.price = float(data["p"])
+        self.quantity = float(data["q"])
+        self.first_trade_id = data["f"]
+        self.last_trade_id = data["l"]
+        self.trade_time = data["T"]
+        self.is_buyer_maker = data["m"]
+
+
+class MarkPrice(Event):
+    __slots__ = (
+        "symbol",
+        "mark_price",
+        "index_price",
+        "estimated_settle_price",
+        "funding_rate",
+        "next_funding_time",
+    )
+
+    def __init__(self, data, stream=None):
+        super().__init__(data, stream)
+        self.symbol = data["s"]
+        self.mark_price = float(data["p"])
+        self.index_price = float(data["i"]) if "i" in data else None
+        self.estimated_settle_price = float(data["P"])
+        self.funding_rate = float(data["r"]) if data.get("r") else None
+        self.next_funding_time = data.get("T")
+
+
+class Kline(Event):
+    """``kline`` and ``continuous_kline`` events; ``symbol`` is the pair of the latter"""
+
+    __slots__ = (
+        "symbol",
+        "interval",
+        "contract_type",
+        "open_time",
+        "close_time",
+        "open",
+        "high",
+        "low",
+        "close",
+        "volume",
+        "quote_volume",
+        "trades",
+        "taker_buy_volume",
+        "taker_buy_quote_volume",
+        "is_closed",
+    )
+
+    def __init__(self, data, stream=None):
+        super().__init__(data, stream)
+        k = data["k"]
+        self.symbol = data.get("s") or data.get("ps")
+        self.interval = k["i"]
+        self.contract_type = data.get("ct")
+        self.open_time = k["t"]
+        self.close_time = k["T"]
+        self.open = float(k["o"])
+        self.high = float(k["h"])
+        self.low = float(k["l"])
+        self.close = float(k["c"])
+        self.volume = float(k["v"])
+        self.quote_volume = float(k["q"])
+        self.trades = k["n"]
+        self.taker_buy_volume = float(k["V"])
+        self.taker_buy_quote_volume = float(k["Q"])
+        self.is_closed = k["x"]
+
+
+class DepthUpdate(Event):
+    """diff and partial depth events, ``bids``/``asks`` being lists of (price, quantity)"""
+
+    __slots__ = (
+        "symbol",
+        "transaction_time",
+        "first_update_id",
+        "final_update_id",
+        "previous_final_update_id",
+        "bids",
+        "asks",
+    )
+
+    def __init__(self, data, stream=None):
+        super().__init__(data, stream)
+        self.symbol = data["s"]
+        self.transaction_time = data.get("T")
+        self.first_update_id = data["U"]
+        self.final_update_id = data["u"]
+        self.previous_final_update_id = data.get("pu")
+        self.bids = _levels(data["b"])
+        self.asks = _levels(data["a"])
+
+
+class BookTicker(Event):
+    __slots__ = (
+        "symbol",
+        "update_id",
+        "transaction_time",
+        "bid_price",
+        "bid_quantity",
+        "ask_price",
+        "ask_quantity",
+    )
+
+    def __init__(self, data, stream=None):
+        super().__init__(data, stream)
+        self.symbol = data["s"]
+        self.update_id = data["u"]
+        self.transaction_time = data.get("T")
+        self.bid_price = float(data["b"])
+        self.bid_quantity = float(data["B"])
+        self.ask_price = float(data["a"])
+        self.ask_quantity = float(data["A"])
+
+
+class ForceOrder(Event):
+    __slots__ = (
+        "symbol",
+        "side",
+        "order_type",
+        "time_in_force",
+        "quantity",
+        "price",
+        "average_price",
+        "status",
+        "last_filled_quantity",
+        "filled_quantity",
+        "trade_time",
+    )
+
+    def __init__(self, data, stream=None):
+        super().__init__(data, stream)
+        o = data["o"]
+        self.symbol = o["s"]
+        self.side = o["S"]
+        self.order_type = o["o"]
+        self.time_in_force = o["f"]
+        self.quantity = float(o["q"])
+        self.price = float(o["p"])
+        self.average_price = float(o["ap"])
+        self.status = o["X"]
+        self.last_filled_quantity = float(o["l"])
+        self.filled_quantity = float(o["z"])
+        self.trade_time = o["T"]
+
+
+class Balance(object):
+    __slots__ = ("asset", "wallet_balance", "cross_wallet_balance", "balance_change")
+
+    def __init__(self, data):
+        self.asset = data["a"]
+        self.wallet_balance = float(data["wb"])
+        self.cross_wallet_balance = float(data["cw"])
+        self.balance_change = float(data["bc"]) if "bc" in data else None
+
+    def __repr__(self):
+        return "Balance({}, {})".format(self.asset, self.wallet_balance)
+
+
+class Position(object):
+    __slots__ = (
+        "symbol",
+        "position_amount",
+        "entry_price",
+        "accumulated_realized",
+        "unrealized_pnl",
+        "margin_type",
+        "isolated_wallet",
+        "position_side",
+    )
+
+    def __init__(self, data):
+        self.symbol = data["s"]
+        self.position_amount = float(data["pa"])
+        self.entry_price = float(data["ep"])
+        self.accumulated_realized = float(data["cr"])
+        self.unrealized_pnl = float(data["up"])
+        self.margin_type = data["mt"]
+        self.isolated_wallet = float(data["iw"])
+        self.position_side = data["ps"]
+
+    def __repr__(self):
+        return "Position({}, {}, {})".format(
+            self.symbol, self.position_side, self.position_amount
+        )
+
+
+class AccountUpdate(Event):
+    __slots__ = ("transaction_time", "reason", "balances", "positions")
+
+    def __init__(self, data, stream=None):
+        super().__init__(data, stream)
+        a = data["a"]
+        self.transaction_time = data.get("T")
+        self.reason = a["m"]
+        self.balances = [Balance(b) for b in a.get("B", ())]
+        self.positions = [Position(p) for p in a.get("P", ())]
+
+
+class OrderTradeUpdate(Event):
+    __slots__ = (
+        "transaction_time",
+        "symbol",
+        "client_order_id",
+        "side",
+        "order_type",
+        "time_in_force",
+        "quantity",
+        "price",
+        "average_price",
+        "stop_price",
+        "execution_type",
+        "status",
+        "order_id",
+        "last_filled_quantity",
+        "filled_quantity",
+        "last_filled_price",
+        "commission_asset",
+        "commission",
+        "trade_time",
+        "trade_id",
+        "is_maker",
+        "reduce_only",
+        "position_side",
+        "realized_profit",
+    )
+
+    def __init__(self, data, stream=None):
+        super().__init__(data, stream)
+        o = data["o"]
+        self.transaction_time = data.get("T")
+        self.symbol = o["s"]
+        self.client_order_id = o["c"]
+        self.side = o["S"]
+        self.order_type = o["o"]
+        self.time_in_force = o["f"]
+        self.quantity = float(o["q"])
+        self.price = float(o["p"])
+        self.average_price = float(o["ap"])
+        self.stop_price = float(o["sp"])
+        self.execution_type = o["x"]
+        self.status = o["X"]
+        self.order_id = o["i"]
+        self.last_filled_quantity = float(o["l"])
+        self.filled_quantity = float(o["z"])
+        self.last_filled_price = float(o["L"])
+        self.commission_asset = o.get("N")
+        self.commission = float(o["n"]) if "n" in o else 0.0
+        self.trade_time = o["T"]
+        self.trade_id = o["t"]
+        self.is_maker = o["m"]
+        self.reduce_only = o["R"]
+        self.position_side = o["ps"]
+        self.realized_profit = float(o["rp"]) if "rp" in o else 0.0
+
+
+EVENT_TYPES = {
+    "aggTrade": AggTrade,
+    "markPriceUpdate": MarkPrice,
+    "kline": Kline,
+    "continuous_kline": Kline,
+    "depthUpdate": DepthUpdate,
+    "bookTicker": BookTicker,
+    "forceOrder": ForceOrder,
+    "ACCOUNT_UPDATE": AccountUpdate,
+    "ORDER_TRADE_UPDATE": OrderTradeUpdate,
+}
+
+
+def to_event(data, stream=None):
+    """the event object of a decoded message, the message itself if its type is not parsed"""
+
+    if isinstance(data, list):
+        return [to_event(item, stream) for item in data]
+    cls = EVENT_TYPES.get(data.get("e"))
+    if cls is None:
+        return data
+    return cls(data, stream)
+
+
+def parse_event(message):
+    """decode a websocket message (bytes or text), unwrap the combined stream envelope and
+    return an event object, a list of them for array streams (e.g. ``!markPrice@arr``), or
+    the decoded message when it isn't a parsed event type (e.g. subscription responses)
+    """
+
+    data = json_loads(message)
+    if isinstance(data, dict) and "stream" in data and "data" in data:
+        event = to_event(data["data"], data["stream"])
+        # keep the envelope of unparsed messages, for their stream name
+        return data if event is data["data"] else event
+    return to_event(data)
+
+
+def stream_name(message):
+    """the stream name of a combined stream message: text or bytes (read without decoding
+    the JSON), event, list of events of an array stream or decoded message. None for raw
+    stream messages"""
+
+    if isinstance(message, Event):
+        return message.stream
+    if isinstance(message, list):
+        # array streams, e.g. !markPrice@arr, parsed into a list of events
+        return stream_name(message[0]) if message else None
+    if isinstance(message, bytes):
+        prefix, quote = _STREAM_PREFIX_BYTES, b'"'
+    elif isinstance(message, str):
+        prefix, quote = _STREAM_PREFIX, '"'
+    elif isinstance(message, dict):
+        return message.get("stream")
+    else:
+        return None
+    if message.startswith(prefix):
+        start = len(prefix)
+        end = message.find(quote, start)
+        if end != -1:
+            name = message[start:end]
+            return name.decode() if quote == b'"' else name
+    return None
@@ -0,0 +1,126 @@
+import logging
+import threading
+from collections import deque
+
+from binance.error import ParameterArgumentError
+from binance.websocket.events import stream_name
+
+
+class MessageQueue(object):
+    """Bounded queue between the websocket reader and a pool of callback threads
+
+    The reader only enqueues messages, so a slow ``on_message`` does not delay the socket
+    reads. ``overflow`` decides what happens to the messages the workers don't keep up with:
+
+    - "block": when the queue is full, the reader waits for room; nothing is lost but the
+      connection may fall behind
+    - "drop_oldest": when the queue is full, the oldest queued message is dropped
+    - "conflate": at any queue size, a message still queued for its stream is replaced by the
+      new one, so only the latest message of each stream is handled (for mark price, book
+      ticker, ... streams). The stream is read from the combined stream envelope; messages of
+      raw streams are queued, and dropped when the queue is full, as with "drop_oldest"
+
+    ``dropped`` and ``conflated`` count the messages lost either way. With more than one
+    worker, messages may be handled out of order.
+
+    Keyword Args:
+        maxsize (int, optional): the max number of queued messages. By default, it's 10000
+        workers (int, optional): the number of callback threads. By default, it's 1
+        overflow (str, optional): "block", "drop_oldest" or "conflate". By default, it's "block"
+    """
+
+    BLOCK = "block"
+    DROP_OLDEST = "drop_oldest"
+    CONFLATE = "conflate"
+
+    def __init__(self, maxsize=10000, workers=1, overflow=BLOCK, logger=None):
+        if overflow not in (self.BLOCK, self.DROP_OLDEST, self.CONFLATE):
+            raise ParameterArgumentError(
+                "overflow must be one of block, drop_oldest or conflate"
+            )
+        if not logger:
+            logger = logging.getLogger(__name__)
+        self.logger = logger
+        self.maxsize = maxsize
+        self.workers = workers
+        self.overflow = overflow
+        self.dropped = 0
+        self.conflated = 0
+        # (handler, stream, message) entries; with "conflate" the message of a stream is in _latest
+        self._entries = deque()
+        self._latest = {}
+        self._condition = threading.Condition()
+        self._handlers = []
+        self._threads = []
+
+    def qsize(self):
+        return len(self._entries)
+
+    def start(self, handler):
+        """start the workers, calling ``handler(message)``. A queue may serve several connections"""
+
+        with self._condition:
+            self._handlers.append(handler)
+            if self._threads:
+                return
+            for _ in range(self.workers):
+                thread = threading.Thread(target=self._work, daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+    def stop(self, handler):
+        """stop the workers once the queued messages are handled and no connection is left"""
+
+        with self._condition:
+            if handler in self._handlers:
+                self._handlers.remove(handler)
+            self._condition.notify_all()
+
+    def put(self, handler, message):
+        """queue ``message`` to be handled by ``handler``, see ``start``"""
+
+        stream = stream_name(message) if self.overflow == self.CONFLATE else None
+        with self._condition:
+            if stream is not None:
+                key = (handler, stream)
+                if key in self._latest:
+                    self._latest[key] = message
+                    self.conflated += 1
+                    return
+            while len(self._entries) >= self.maxsize:
+                if self.overflow == self.BLOCK:
+                    self._condition.wait()
+                    continue
+                dropped_handler, dropped_stream, _ = self._entries.popleft()
+                if dropped_stream is not None:
+                    del self._latest[(dropped_handler, dropped_stream)]
+                self.dropped += 1
+            if stream is not None:
+                self._latest[(handler, stream)] = message
+                message = None
+            self._entries.append((handler, stream, message))
+            self._condition.notify_all()
+
+    def _get(self):
+        with self._condition:
+            while not self._entries:
+                if not self._handlers:
+                    self._threads.remove(threading.current_thread())
+                    return None
+                self._condition.wait()
+            handler, stream, message = self._entries.popleft()
+            if stream is not None:
+                message = self._latest.pop((handler, stream))
+            self._condition.notify_all()
+            return handler, message
+
+    def _work(self):
+        while True:
+            entry = self._get()
+            if entry is None:
+                break
+            handler, message = entry
+            try:
+                handler(message)
+            except Exception as e:
+                self.logger.error("Error from message handler: {}".format(e))
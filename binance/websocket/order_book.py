@@ -0,0 +1,298 @@
+import logging
+import threading
+import time
+from bisect import bisect_left, bisect_right, insort
+from concurrent.futures import ThreadPoolExecutor
+
+from binance.lib.utils import json_loads
+from binance.websocket.um_futures.websocket_client import UMFuturesWebsocketClient
+
+
+def _set_level(prices, quantities, price, quantity):
+    if quantity == 0.0:
+        if quantities.pop(price, None) is not None:
+            del prices[bisect_left(prices, price)]
+    else:
+        if price not in quantities:
+            insort(prices, price)
+        quantities[price] = quantity
+
+
+class OrderBook(object):
+    """Local order book of one symbol, built from a depth snapshot and diff depth events
+
+    Price levels are kept in sorted lists (ascending for both sides) plus a price -> quantity
+    dict: the best bid/ask and the quantity at a price are O(1), range queries O(log n).
+    ``apply`` follows the sequencing rules of the futures diff depth stream (U/u/pu).
+    """
+
+    __slots__ = (
+        "symbol",
+        "last_update_id",
+        "event_time",
+        "_awaiting_first",
+        "_bid_prices",
+        "_bid_quantities",
+        "_ask_prices",
+        "_ask_quantities",
+    )
+
+    def __init__(self, symbol):
+        self.symbol = symbol
+        self.last_update_id = None
+        self.event_time = None
+        self._awaiting_first = True
+        self._bid_prices = []
+        self._bid_quantities = {}
+        self._ask_prices = []
+        self._ask_quantities = {}
+
+    @property
+    def synced(self):
+        return self.last_update_id is not None
+
+    def reset(self):
+        self.last_update_id = None
+        self._bid_prices, self._bid_quantities = [], {}
+        self._ask_prices, self._ask_quantities = [], {}
+
+    def load_snapshot(self, snapshot):
+        """load a ``depth()`` response"""
+
+        bids = {float(p): float(q) for p, q in snapshot["bids"]}
+        asks = {float(p): float(q) for p, q in snapshot["asks"]}
+        self._bid_prices, self._bid_quantities = sorted(bids), bids
+        self._ask_prices, self._ask_quantities = sorted(asks), asks
+        self.last_update_id = snapshot["lastUpdateId"]
+        self.event_time = snapshot.get("E")
+        self._awaiting_first = True
+
+    def apply(self, event):
+        """apply a ``depthUpdate`` event, return False if it shows a gap and a resync is needed"""
+
+        if self.last_update_id is None:
+            return False
+        if event["u"] < self.last_update_id:
+            # older than the snapshot
+            return True
+        if self._awaiting_first:
+            if event["U"] > self.last_update_id:
+                return False
+            self._awaiting_first = False
+        elif event["pu"] != self.last_update_id:
+            return False
+
+        for price, quantity in event["b"]:
+            _set_level(
+                self._bid_prices, self._bid_quantities, float(price), float(quantity)
+            )
+        for price, quantity in event["a"]:
+            _set_level(
+                self._ask_prices, self._ask_quantities, float(price), float(quantity)
+            )
+        self.last_update_id = event["u"]
+        self.event_time = event.get("E")
+        return True
+
+    def best_bid(self):
+        """(price, quantity) of the best bid, None if the side is empty"""
+
+        if not self._bid_prices:
+            return None
+        price = self._bid_prices[-1]
+        return price, self._bid_quantities[price]
+
+    def best_ask(self):
+        if not self._ask_prices:
+            return None
+        price = self._ask_prices[0]
+        return price, self._ask_quantities[price]
+
+    def mid_price(self):
+        if not self._bid_prices or not self._ask_prices:
+            return None
+        return (self._bid_prices[-1] + self._ask_prices[0]) / 2
+
+    def bid_quantity(self, price):
+        return self._bid_quantities.get(price, 0.0)
+
+    def ask_quantity(self, price):
+        return self._ask_quantities.get(price, 0.0)
+
+    def bids(self, limit=None):
+        """[(price, quantity)] best first"""
+
+        prices = self._bid_prices[-limit:] if limit else self._bid_prices
+        return [(p, self._bid_quantities[p]) for p in reversed(prices)]
+
+    def asks(self, limit=None):
+        prices = self._ask_prices[:limit] if limit else self._ask_prices
+        return [(p, self._ask_quantities[p]) for p in prices]
+
+    def bids_above(self, price):
+        """bids priced at or above ``price``, best first"""
+
+        start = bisect_left(self._bid_prices, price)
+        prices = self._bid_prices[start:]
+        return [(p, self._bid_quantities[p]) for p in reversed(prices)]
+
+    def asks_below(self, price):
+        """asks priced at or below ``price``, best first"""
+
+        prices = self._ask_prices[: bisect_right(self._ask_prices, price)]
+        return [(p, self._ask_quantities[p]) for p in prices]
+
+
+class OrderBookManager(object):
+    """Maintains local order books from the diff depth stream, resynced from REST snapshots
+
+    The manager owns a combined stream connection of ``websocket_client_class``. Events of a
+    symbol are buffered while its ``depth()`` snapshot is fetched in a worker thread, then
+    replayed on top of it. On a sequence gap or a reconnection the book is resynced the same way.
+
+    Args:
+        rest_client (UMFutures or CMFutures): the client fetching the depth snapshots
+    Keyword Args:
+        websocket_client_class (class, optional): ``UMFuturesWebsocketClient`` or ``CMFuturesWebsocketClient``. By default, it's ``UMFuturesWebsocketClient``
+        speed (int, optional): update speed of the diff depth stream in ms. By default, it's 100
+        snapshot_limit (int, optional): depth of the REST snapshots. By default, it's 1000
+        on_update (callable, optional): called with the ``OrderBook`` after each applied event, from the websocket thread
+        on_resync (callable, optional): called with the symbol when a gap is detected, before resyncing
+    """
+
+    def __init__(
+        self,
+        rest_client,
+        websocket_client_class=UMFuturesWebsocketClient,
+        speed=100,
+        snapshot_limit=1000,
+        on_update=None,
+        on_resync=None,
+        logger=None,
+        **websocket_kwargs
+    ):
+        if not logger:
+            logger = logging.getLogger(__name__)
+        self.logger = logger
+        self.rest_client = rest_client
+        self.speed = speed
+        self.snapshot_limit = snapshot_limit
+        self.on_update = on_update
+        self.on_resync = on_resync
+        self.books = {}
+        self._buffers = {}
+        self._locks = {}
+        self._executor = ThreadPoolExecutor(max_workers=4)
+        self.websocket_client = websocket_client_class(
+            on_message=self._on_message,
+            on_reconnect=self._on_reconnect,
+            is_combined=True,
+            **websocket_kwargs
+        )
+
+    def __getitem__(self, symbol):
+        return self.books[symbol.upper()]
+
+    def get(self, symbol):
+        return self.books.get(symbol.upper())
+
+    def add(self, symbol):
+        symbol = symbol.upper()
+        if symbol in self.books:
+            return self.books[symbol]
+        book = OrderBook(symbol)
+        self._locks[symbol] = threading.Lock()
+        self._buffers[symbol] = []
+        self.books[symbol] = book
+        self.websocket_client.diff_book_depth(symbol, speed=self.speed)
+        self._executor.submit(self._load_snapshot, symbol)
+        return book
+
+    def remove(self, symbol):
+        symbol = symbol.upper()
+        if self.books.pop(symbol, None) is not None:
+            self.websocket_client.diff_book_depth(
+                symbol, speed=self.speed, action="UNSUBSCRIBE"
+            )
+            self._buffers.pop(symbol, None)
+            self._locks.pop(symbol, None)
+
+    def stop(self):
+        self.websocket_client.stop()
+        self._executor.shutdown(wait=False)
+
+    def resync(self, symbol):
+        """drop the book of ``symbol`` and rebuild it from a new snapshot"""
+
+        symbol = symbol.upper()
+        lock = self._locks.get(symbol)
+        if lock is None:
+            return
+        with lock:
+            self._start_resync(symbol)
+
+    def _start_resync(self, symbol):
+        if self.on_resync:
+            self.on_resync(symbol)
+        self.books[symbol].reset()
+        self._buffers[symbol] = []
+        self._executor.submit(self._load_snapshot, symbol)
+
+    def _load_snapshot(self, symbol):
+        while symbol in self.books:
+            try:
+                snapshot = self.rest_client.depth(symbol, limit=self.snapshot_limit)
+                break
+            except Exception as e:
+                self.logger.error(
+                    "Failed to load {} depth snapshot: {}".format(symbol, e)
+                )
+                time.sleep(1)
+        else:
+            return
+        if "lastUpdateId" not in snapshot:
+            snapshot = snapshot["data"]
+
+        lock = self._locks.get(symbol)
+        if lock is None:
+            return
+        with lock:
+            book = self.books[symbol]
+            book.load_snapshot(snapshot)
+            buffered, self._buffers[symbol] = self._buffers[symbol], None
+            for event in buffered:
+                if not book.apply(event):
+                    self.logger.warning(
+                        "{} snapshot is too old, resyncing".format(symbol)
+                    )
+                    self._start_resync(symbol)
+                    return
+
+    def _on_reconnect(self, _, disconnected_at, reconnected_at):
+        for symbol in list(self.books):
+            self.resync(symbol)
+
+    def _on_message(self, _, message):
+        message = json_loads(message)
+        event = message.get("data")
+        if event is None or event.get("e") != "depthUpdate":
+            return
+        self.process_event(event)
+
+    def process_event(self, event):
+        symbol = event["s"]
+        lock = self._locks.get(symbol)
+        if lock is None:
+            return
+        with lock:
+            buffer = self._buffers.get(symbol)
+            if buffer is not None:
+                buffer.append(event)
+                return
+            book = self.books[symbol]
+            if not book.apply(event):
+                self.logger.warning("{} diff depth gap, resyncing".format(symbol))
+                self._start_resync(symbol)
+                return
+        if self.on_update:
+            self.on_update(book)
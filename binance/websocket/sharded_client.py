@@ -0,0 +1,174 @@
+import math
+import threading
+from types import MethodType
+
+from binance.lib.utils import get_timestamp
+from binance.websocket.um_futures.websocket_client import UMFuturesWebsocketClient
+
+
+class ShardedWebsocketClient(object):
+    """Spreads stream subscriptions across several websocket connections
+
+    Each connection holds at most ``streams_per_connection`` streams; a new one is opened when
+    all are full. Streams subscribed together are sent in one SUBSCRIBE message per connection,
+    keeping under the limit of incoming messages per connection. Empty connections are closed,
+    and a connection holding more than its share after a reconnect hands the excess over to the
+    others. All the connections share the same callbacks.
+
+    The stream methods of ``websocket_client_class`` (``agg_trade``, ``diff_book_depth``, ...)
+    are available on this client.
+
+    Keyword Args:
+        websocket_client_class (class, optional): ``UMFuturesWebsocketClient`` or ``CMFuturesWebsocketClient``. By default, it's ``UMFuturesWebsocketClient``
+        streams_per_connection (int, optional): the max number of streams per connection. By default, it's 200
+        on_message (callable, optional): called with the socket manager and the message, from the thread of its connection
+        on_reconnect (callable, optional): called with the socket manager and the disconnection window, see ``BinanceSocketManager``
+    Other keyword arguments are passed to ``websocket_client_class``; connections are always combined streams.
+    """
+
+    ACTION_SUBSCRIBE = "SUBSCRIBE"
+    ACTION_UNSUBSCRIBE = "UNSUBSCRIBE"
+
+    def __init__(
+        self,
+        websocket_client_class=UMFuturesWebsocketClient,
+        streams_per_connection=200,
+        on_message=None,
+        on_reconnect=None,
+        **websocket_kwargs
+    ):
+        self.websocket_client_class = websocket_client_class
+        self.streams_per_connection = streams_per_connection
+        self.on_message = on_message
+        self.on_reconnect = on_reconnect
+        self.websocket_kwargs = websocket_kwargs
+        self.connections = []
+        self._streams = {}
+        self._load = {}
+        self._lock = threading.RLock()
+
+    def __getattr__(self, name):
+        # reuse the stream name builders, which end with self.send_message_to_server
+        method = getattr(self.websocket_client_class, name, None)
+        if name.startswith("_") or not callable(method):
+            raise AttributeError(name)
+        return MethodType(method, self)
+
+    @property
+    def streams(self):
+        return list(self._streams)
+
+    def send_message_to_server(self, message, action=None, id=None, handler=None):
+        if action != self.ACTION_UNSUBSCRIBE:
+            return self.subscribe(message, id=id, handler=handler)
+        return self.unsubscribe(message, id=id)
+
+    def subscribe(self, stream, id=None, handler=None):
+        """see ``BinanceWebsocketClient.subscribe``"""
+
+        if isinstance(stream, str):
+            stream = [stream]
+        with self._lock:
+            batches = {}
+            for name in stream:
+                if name in self._streams:
+                    continue
+                connection = self._connection_with_room()
+                self._streams[name] = connection
+                self._load[connection] += 1
+                batches.setdefault(connection, []).append(name)
+            for connection, names in batches.items():
+                connection.subscribe(names, id=id or get_timestamp(), handler=handler)
+
+    def unsubscribe(self, stream, id=None):
+        if isinstance(stream, str):
+            stream = [stream]
+        closed = []
+        with self._lock:
+            batches = {}
+            for name in stream:
+                connection = self._streams.pop(name, None)
+                if connection is not None:
+                    self._load[connection] -= 1
+                    batches.setdefault(connection, []).append(name)
+            for connection, names in batches.items():
+                if self._load[connection] == 0:
+                    self.connections.remove(connection)
+                    del self._load[connection]
+                    closed.append(connection)
+                else:
+                    connection.unsubscribe(names, id=id or get_timestamp())
+        # outside the lock, which the socket threads take in _on_reconnect
+        for connection in closed:
+            self._close(connection)
+
+    def rebalance(self):
+        """move streams from the connections above their share to the others
+
+        A moved stream is subscribed on its new connection before being unsubscribed from the
+        old one, so no message is missed, but a few may be received twice.
+        """
+
+        with self._lock:
+            if not self.connections:
+                return
+            share = math.ceil(len(self._streams) / len(self.connections))
+            moves = []
+            for connection in self.connections:
+                if self._load[connection] > share:
+                    moved = [n for n, c in self._streams.items() if c is connection]
+                    moved = moved[share:]
+                    self._load[connection] -= len(moved)
+                    moves.extend(
+                        (name, connection._handlers.get(name), connection)
+                        for name in moved
+                    )
+            subscriptions = {}
+            unsubscriptions = {}
+            for name, handler, source in moves:
+                connection = min(
+                    (c for c in self.connections if c is not source),
+                    key=self._load.get,
+                )
+                self._streams[name] = connection
+                self._load[connection] += 1
+                subscriptions.setdefault((connection, handler), []).append(name)
+                unsubscriptions.setdefault(source, []).append(name)
+            for (connection, handler), names in subscriptions.items():
+                connection.subscribe(names, id=get_timestamp(), handler=handler)
+            for connection, names in unsubscriptions.items():
+                connection.unsubscribe(names, id=get_timestamp())
+
+    def stop(self):
+        with self._lock:
+            closed, self.connections = self.connections, []
+            self._streams = {}
+            self._load = {}
+        for connection in closed:
+            self._close(connection)
+
+    def _connection_with_room(self):
+        for connection in self.connections:
+            if self._load[connection] < self.streams_per_connection:
+                return connection
+        connection = self.websocket_client_class(
+            on_message=self.on_message,
+            on_reconnect=self._on_reconnect,
+            is_combined=True,
+            **self.websocket_kwargs
+        )
+        self.connections.append(connection)
+        self._load[connection] = 0
+        return connection
+
+    def _close(self, connection):
+        if threading.current_thread() is connection.socket_manager:
+            # called from one of its callbacks, the thread can't join itself
+            connection.socket_manager.close()
+        else:
+            connection.stop()
+
+    def _on_reconnect(self, socket_manager, disconnected_at, reconnected_at):
+        if self.on_reconnect:
+            self.on_reconnect(socket_manager, disconnected_at, reconnected_at)
+        self.rebalance()
@@ -0,0 +1,196 @@
+import itertools
+import json
+import logging
+import threading
+from concurrent.futures import Future, InvalidStateError
+from decimal import Decimal
+from urllib.parse import urlencode
+
+from binance.error import ClientError, ParameterArgumentError, ServerError
+from binance.lib.utils import cleanNoneValue, json_loads
+from binance.websocket.binance_socket_manager import BinanceSocketManager
+
+# REST request of the shared endpoint functions -> WebSocket API method
+WEBSOCKET_API_METHODS = {
+    ("POST", "/fapi/v1/order"): "order.place",
+    ("PUT", "/fapi/v1/order"): "order.modify",
+    ("DELETE", "/fapi/v1/order"): "order.cancel",
+    ("GET", "/fapi/v1/order"): "order.status",
+    ("GET", "/fapi/v3/positionRisk"): "account.position",
+    ("GET", "/fapi/v3/account"): "account.status",
+    ("GET", "/fapi/v3/balance"): "account.balance",
+}
+
+
+def _param(value):
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (float, Decimal)):
+        return str(value)
+    return value
+
+
+def _settle(future, result=None, error=None):
+    # a future cancelled by the caller (e.g. on an asyncio.wait_for timeout) is left as is
+    try:
+        if error is None:
+            future.set_result(result)
+        else:
+            future.set_exception(error)
+    except InvalidStateError:
+        pass
+
+
+class UMFuturesWebsocketAPIClient(object):
+    """USD-M Futures WebSocket API client, placing and querying orders over one connection
+
+    ``new_order``, ``modify_order``, ``cancel_order``, ``query_order``, ``get_position_risk``,
+    ``account`` and ``balance`` are the endpoint functions of ``UMFutures``, with the same
+    parameters and validation, sent as ``order.place``, ``order.modify``, ``order.cancel``,
+    ``order.status``, ``account.position``, ``account.status`` and ``account.balance``
+    requests. They return a ``concurrent.futures.Future`` resolved with the ``result`` of the
+    response, or failed with ``ClientError``/``ServerError``; ``asyncio.wrap_future`` makes it
+    awaitable. Cancelling a future only stops waiting for it, the request may still be
+    processed. Requests are signed with the key, secret or private key and the server time
+    offset of ``client``.
+
+    When the connection is lost, the requests waiting for a response fail with
+    ``ConnectionError``: they may or may not have been processed. The connection is reopened
+    in the background.
+
+    Args:
+        client (UMFutures): the client holding the API key and signing the requests
+    Keyword Args:
+        stream_url (str, optional): the WebSocket API url. By default, it's wss://ws-fapi.binance.com/ws-fapi/v1
+        proxies (obj, optional): Dictionary mapping protocol to the URL of the proxy. e.g. {'http': 'http://1.2.3.4:8080'}
+    """
+
+    def __init__(
+        self,
+        client,
+        stream_url="wss://ws-fapi.binance.com/ws-fapi/v1",
+        logger=None,
+        proxies=None,
+    ):
+        if not logger:
+            logger = logging.getLogger(__name__)
+        self.logger = logger
+        self.client = client
+        self.rate_limits = None
+        self._ids = itertools.count(1)
+        self._pending = {}
+        self._lock = threading.Lock()
+        self.socket_manager = BinanceSocketManager(
+            stream_url,
+            on_message=self._on_message,
+            on_close=self._on_close,
+            on_error=self._on_error,
+            logger=logger,
+            proxies=proxies,
+        )
+        self.socket_manager.start()
+
+    # the REST endpoint functions, their sign_request() goes through the websocket
+    from binance.um_futures.account import new_order
+    from binance.um_futures.account import modify_order
+    from binance.um_futures.account import cancel_order
+    from binance.um_futures.account import query_order
+    from binance.um_futures.account import get_position_risk
+    from binance.um_futures.account import account
+    from binance.um_futures.account import balance
+
+    def sign_request(self, http_method, url_path, payload=None, special=False):
+        method = WEBSOCKET_API_METHODS.get((http_method, url_path))
+        if method is None:
+            raise ParameterArgumentError(
+                "{} {} has no WebSocket API method".format(http_method, url_path)
+            )
+        return self.send_request(method, payload)
+
+    def send_request(self, method, params=None, signed=True):
+        """send a WebSocket API request, return a ``Future`` of its result"""
+
+        params = {k: _param(v) for k, v in cleanNoneValue(params or {}).items()}
+        if signed:
+            params["apiKey"] = self.client.key
+            params["timestamp"] = self.client._get_timestamp()
+            signature = self.client._get_sign(urlencode(sorted(params.items())))
+            # RSA and Ed25519 signatures are base64 bytes
+            if isinstance(signature, bytes):
+                signature = signature.decode("utf-8")
+            params["signature"] = signature
+        request_id = str(next(self._ids))
+        future = Future()
+        with self._lock:
+            self._pending[request_id] = future
+        if not self.socket_manager.ws.connected:
+            self._fail(request_id, ConnectionError("websocket is disconnected"))
+            return future
+        try:
+            self.socket_manager.send_message(
+                json.dumps({"id": request_id, "method": method, "params": params})
+            )
+        except Exception as e:
+            self._fail(request_id, e)
+        return future
+
+    def stop(self):
+        self.socket_manager.close()
+        self.socket_manager.join()
+        self._fail_pending(ConnectionError("websocket closed"))
+
+    def _fail(self, request_id, error):
+        with self._lock:
+            future = self._pending.pop(request_id, None)
+        if future is not None:
+            _settle(future, error=error)
+
+    def _fail_pending(self, error):
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        for future in pending.values():
+            _settle(future, error=error)
+
+    def _on_close(self, _):
+        self._fail_pending(
+            ConnectionError("websocket closed before the response was received")
+        )
+
+    # the callbacks of this client don't raise, on_error is only called on a lost connection
+    def _on_error(self, _, error):
+        self._fail_pending(
+            ConnectionError(
+                "websocket connection lost before the response was received: {}".format(
+                    error
+                )
+            )
+        )
+
+    def _on_message(self, _, message):
+        try:
+            response = json_loads(message)
+            request_id = response.get("id")
+        except (ValueError, AttributeError) as e:
+            self.logger.error(
+                "Invalid WebSocket API response {!r}: {}".format(message, e)
+            )
+            return
+        with self._lock:
+            future = self._pending.pop(request_id, None)
+        if future is None:
+            return
+        if response.get("rateLimits"):
+            self.rate_limits = response["rateLimits"]
+        status = response.get("status")
+        if status == 200:
+            _settle(future, response.get("result"))
+        elif isinstance(status, int) and status >= 500:
+            _settle(
+                future, error=ServerError(status, json.dumps(response.get("error")))
+            )
+        else:
+            error = response.get("error") or {}
+            _settle(
+                future,
+                error=ClientError(status, error.get("code"), error.get("msg"), None),
+            )
@@ -1,5 +1,6 @@
 from typing import Optional
 
+from binance.websocket.async_websocket_client import AsyncWebsocketClient
 from binance.websocket.websocket_client import BinanceWebsocketClient
 
 
@@ -15,6 +16,12 @@ class UMFuturesWebsocketClient(BinanceWebsocketClient):
         on_pong=None,
         is_combined=False,
         proxies: Optional[dict] = None,
+        on_reconnect=None,
+        reconnect=True,
+        reconnect_backoff=1,
+        max_reconnect_backoff=60,
+        message_queue=None,
+        parse_events=False,
     ):
         if is_combined:
             stream_url = stream_url + "/stream"
@@ -29,6 +36,12 @@ class UMFuturesWebsocketClient(BinanceWebsocketClient):
             on_ping=on_ping,
             on_pong=on_pong,
             proxies=proxies,
+            on_reconnect=on_reconnect,
+            reconnect=reconnect,
+            reconnect_backoff=reconnect_backoff,
+            max_reconnect_backoff=max_reconnect_backoff,
+            message_queue=message_queue,
+            parse_events=parse_events,
         )
 
     def agg_trade(self, symbol: str, id=None, action=None, **kwargs):
@@ -45,7 +58,9 @@ class UMFuturesWebsocketClient(BinanceWebsocketClient):
         """
         stream_name = "{}@aggTrade".format(symbol.lower())
 
-        self.send_message_to_server(stream_name, action=action, id=id)
+        self.send_message_to_server(
+            stream_name, action=action, id=id, handler=kwargs.get("handler")
+        )
 
     def mark_price(self, symbol: str, speed: int, id=None, action=None, **kwargs):
         """Mark Price Streams
@@ -60,7 +75,9 @@ class UMFuturesWebsocketClient(BinanceWebsocketClient):
         """
         stream_name = "{}@markPrice@{}s".format(symbol.lower(), speed)
 
-        self.send_message_to_server(stream_name, action=action, id=id)
+        self.send_message_to_server(
+            stream_name, action=action, id=id, handler=kwargs.get("handler")
+        )
 
     def mark_price_all_market(self, speed=1, id=None, action=None, **kwargs):
         """Mark Price Stream for All market
@@ -76,7 +93,9 @@ class UMFuturesWebsocketClient(BinanceWebsocketClient):
         else:
             stream_name = "!markPrice@arr"
 
-        self.send_message_to_server(stream_name, action=action, id=id)
+        self.send_message_to_server(
+            stream_name, action=action, id=id, handler=kwargs.get("handler")
+        )
 
     def kline(self, symbol: str, interval: str, id=None, action=None, **kwargs):
         """Kline/Candlestick Streams
@@ -110,7 +129,9 @@ class UMFuturesWebsocketClient(BinanceWebsocketClient):
         """
         stream_name = "{}@kline_{}".format(symbol.lower(), interval)
 
-        self.send_message_to_server(stream_name, action=action, id=id)
+        self.send_message_to_server(
+            stream_name, action=action, id=id, handler=kwargs.get("handler")
+        )
 
     def continuous_kline(
         self,
@@ -154,7 +175,9 @@ class UMFuturesWebsocketClient(BinanceWebsocketClient):
             pair.lower(), contractType, interval
         )
 
-        self.send_message_to_server(stream_name, action=action, id=id)
+        self.send_message_to_server(
+            stream_name, action=action, id=id, handler=kwargs.get("handler")
+        )
 
     def mini_ticker(self, symbol=None, id=None, action=None, **kwargs):
         """Individual symbol or all symbols mini ticker
@@ -176,7 +199,9 @@ class UMFuturesWebsocketClient(BinanceWebsocketClient):
         else:
             stream_name = "{}@miniTicker".format(symbol.lower())
 
-        self.send_message_to_server(stream_name, action=action, id=id)
+        self.send_message_to_server(
+            stream_name, action=action, id=id, handler=kwargs.get("handler")
+        )
 
     def ticker(self, symbol=None, id=None, action=None, **kwargs):
         """Individual symbol or all symbols ticker
@@ -197,7 +222,9 @@ class UMFuturesWebsocketClient(BinanceWebsocketClient):
             stream_name = "!ticker@arr"
         else:
             stream_name = "{}@ticker".format(symbol.lower())
-        self.send_message_to_server(stream_name, action=action, id=id)
+        self.send_message_to_server(
+            stream_name, action=action, id=id, handler=kwargs.get("handler")
+        )
 
     def book_ticker(self, symbol, id=None, action=None, **kwargs):
         """Individual symbol or all book ticker
@@ -216,7 +243,9 @@ class UMFuturesWebsocketClient(BinanceWebsocketClient):
             stream_name = "!bookTicker"
         else:
             stream_name = "{}@bookTicker".format(symbol.lower())
-        self.send_message_to_server(stream_name, action=action, id=id)
+        self.send_message_to_server(
+            stream_name, action=action, id=id, handler=kwargs.get("handler")
+        )
 
     def diff_book_depth(self, symbol: str, speed=100, id=None, action=None, **kwargs):
         """Diff. Depth Stream
@@ -230,7 +259,10 @@ class UMFuturesWebsocketClient(BinanceWebsocketClient):
         """
 
         self.send_message_to_server(
-            "{}@depth@{}ms".format(symbol.lower(), speed), action=action, id=id
+            "{}@depth@{}ms".format(symbol.lower(), speed),
+            action=action,
+            id=id,
+            handler=kwargs.get("handler"),
         )
 
     def partial_book_depth(
@@ -247,7 +279,10 @@ class UMFuturesWebsocketClient(BinanceWebsocketClient):
         Update Speed: 250ms, 500ms or 100ms
         """
         self.send_message_to_server(
-            "{}@depth{}@{}ms".format(symbol.lower(), level, speed), id=id, action=action
+            "{}@depth{}@{}ms".format(symbol.lower(), level, speed),
+            id=id,
+            action=action,
+            handler=kwargs.get("handler"),
         )
 
     def liquidation_order(self, symbol: str, id=None, action=None, **kwargs):
@@ -268,7 +303,9 @@ class UMFuturesWebsocketClient(BinanceWebsocketClient):
             stream_name = "!forceOrder@arr"
         else:
             stream_name = "{}@forceOrder".format(symbol.lower())
-        self.send_message_to_server(stream_name, id=id, action=action)
+        self.send_message_to_server(
+            stream_name, id=id, action=action, handler=kwargs.get("handler")
+        )
 
     def composite_index(self, symbol: str, id=None, action=None, **kwargs):
         """Composite Index Info Stream
@@ -282,9 +319,26 @@ class UMFuturesWebsocketClient(BinanceWebsocketClient):
         """
 
         self.send_message_to_server(
-            "{}@compositeIndex".format(symbol.lower()), id=id, action=action
+            "{}@compositeIndex".format(symbol.lower()),
+            id=id,
+            action=action,
+            handler=kwargs.get("handler"),
         )
 
     def user_data(self, listen_key: str, id=None, action=None, **kwargs):
         """Listen to user data by using the provided listen_key"""
-        self.send_message_to_server(listen_key, action=action, id=id)
+        self.send_message_to_server(
+            listen_key, action=action, id=id, handler=kwargs.get("handler")
+        )
+
+
+class AsyncUMFuturesWebsocketClient(AsyncWebsocketClient):
+    """asyncio counterpart of ``UMFuturesWebsocketClient``, see ``AsyncWebsocketClient``
+
+    e.g. async for message in client.stream(client.agg_trade("btcusdt")): ...
+    """
+
+    stream_client_class = UMFuturesWebsocketClient
+
+    def __init__(self, stream_url="wss://fstream.binance.com", **kwargs):
+        super().__init__(stream_url, **kwargs)
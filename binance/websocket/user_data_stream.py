@@ -0,0 +1,145 @@
+import logging
+import threading
+
+from binance.error import ClientError
+from binance.websocket.um_futures.websocket_client import UMFuturesWebsocketClient
+
+
+def _listen_key(response):
+    if "listenKey" not in response and "data" in response:
+        response = response["data"]
+    return response["listenKey"]
+
+
+class UserDataStream(object):
+    """Keeps a user data stream alive and hands its events over, parsed
+
+    A listen key is created with ``new_listen_key()`` and renewed every ``keepalive_interval``
+    seconds by a daemon thread. When the key expires (``listenKeyExpired`` event, or a failed
+    renewal) a new one is created and subscribed in place of the old one. It is also renewed
+    right after a reconnection of the websocket, which may have outlasted it.
+
+    Events are ``AccountUpdate`` and ``OrderTradeUpdate`` objects (see
+    ``binance.websocket.events``); the other event types (``MARGIN_CALL``,
+    ``ACCOUNT_CONFIG_UPDATE``, ...) are passed as decoded dicts. Listeners are called from the
+    websocket thread.
+
+    Args:
+        rest_client (UMFutures or CMFutures): a client with an API key, managing the listen key
+    Keyword Args:
+        on_event (callable, optional): called with each event
+        on_reconnect (callable, optional): called with the socket manager and the disconnection window, events may have been missed in between
+        websocket_client_class (class, optional): ``UMFuturesWebsocketClient`` or ``CMFuturesWebsocketClient``. By default, it's ``UMFuturesWebsocketClient``
+        keepalive_interval (int, optional): seconds between two renewals of the listen key, valid 60 minutes. By default, it's 1800
+    Other keyword arguments are passed to ``websocket_client_class``.
+    """
+
+    def __init__(
+        self,
+        rest_client,
+        on_event=None,
+        on_reconnect=None,
+        websocket_client_class=UMFuturesWebsocketClient,
+        keepalive_interval=1800,
+        logger=None,
+        **websocket_kwargs
+    ):
+        if not logger:
+            logger = logging.getLogger(__name__)
+        self.logger = logger
+        self.rest_client = rest_client
+        self.on_reconnect = on_reconnect
+        self.keepalive_interval = keepalive_interval
+        self._listeners = [on_event] if on_event else []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+
+        self.listen_key = _listen_key(rest_client.new_listen_key())
+        self.websocket_client = websocket_client_class(
+            on_message=self._on_message,
+            on_reconnect=self._on_reconnect,
+            parse_events=True,
+            **websocket_kwargs
+        )
+        self.websocket_client.user_data(self.listen_key)
+        threading.Thread(
+            target=self._keepalive_loop, args=(self._stop,), daemon=True
+        ).start()
+
+    def add_listener(self, callback):
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def stop(self):
+        self._stop.set()
+        self.websocket_client.stop()
+        try:
+            self.rest_client.close_listen_key(self.listen_key)
+        except Exception as e:
+            self.logger.warning("Failed to close listen key: {}".format(e))
+
+    def renew(self):
+        """extend the validity of the listen key, replacing it if it has expired"""
+
+        with self._lock:
+            try:
+                self.rest_client.renew_listen_key(self.listen_key)
+            except ClientError as e:
+                self.logger.warning(
+                    "Failed to renew listen key ({}), creating a new one".format(
+                        e.error_message
+                    )
+                )
+                self._replace_listen_key()
+
+    def _replace_listen_key(self):
+        listen_key = _listen_key(self.rest_client.new_listen_key())
+        if listen_key == self.listen_key:
+            return
+        self.websocket_client.user_data(self.listen_key, action="UNSUBSCRIBE")
+        self.listen_key = listen_key
+        self.websocket_client.user_data(listen_key)
+
+    def _keepalive_loop(self, stop):
+        while not stop.wait(self.keepalive_interval):
+            try:
+                self.renew()
+            except Exception as e:
+                self.logger.error("Failed to keep the listen key alive: {}".format(e))
+
+    def _on_reconnect(self, socket_manager, disconnected_at, reconnected_at):
+        threading.Thread(target=self._renew_quietly, daemon=True).start()
+        if self.on_reconnect:
+            self.on_reconnect(socket_manager, disconnected_at, reconnected_at)
+
+    def _renew_quietly(self):
+        try:
+            self.renew()
+        except Exception as e:
+            self.logger.error("Failed to renew listen key: {}".format(e))
+
+    def _on_message(self, _, event):
+        if isinstance(event, dict):
+            if event.get("e") == "listenKeyExpired":
+                self.logger.warning("Listen key expired, creating a new one")
+                # not from the websocket thread, the subscription goes through it
+                threading.Thread(target=self._on_expired, daemon=True).start()
+                return
+            if "result" in event and "id" in event:
+                # subscription response
+                return
+        for listener in list(self._listeners):
+            try:
+                listener(event)
+            except Exception as e:
+                self.logger.error("Error from listener {}: {}".format(listener, e))
+
+    def _on_expired(self):
+        try:
+            with self._lock:
+                self._replace_listen_key()
+        except Exception as e:
+            self.logger.error("Failed to replace expired listen key: {}".format(e))
@@ -5,6 +5,7 @@ import logging
 
 from binance.lib.utils import get_timestamp
 from binance.websocket.binance_socket_manager import BinanceSocketManager
+from binance.websocket.events import stream_name
 
 
 class BinanceWebsocketClient:
@@ -22,13 +23,22 @@ class BinanceWebsocketClient:
         on_pong=None,
         logger=None,
         proxies: Optional[dict] = None,
+        on_reconnect=None,
+        reconnect=True,
+        reconnect_backoff=1,
+        max_reconnect_backoff=60,
+        message_queue=None,
+        parse_events=False,
     ):
         if not logger:
             logger = logging.getLogger(__name__)
         self.logger = logger
+        # messages of the streams subscribed with a handler go to it, the others to on_message
+        self.on_message = on_message
+        self._handlers = {}
         self.socket_manager = self._initialize_socket(
             stream_url,
-            on_message,
+            self._route,
             on_open,
             on_close,
             on_error,
@@ -36,6 +46,12 @@ class BinanceWebsocketClient:
             on_pong,
             logger,
             proxies,
+            on_reconnect,
+            reconnect,
+            reconnect_backoff,
+            max_reconnect_backoff,
+            message_queue,
+            parse_events,
         )
 
         # start the thread
@@ -53,6 +69,12 @@ class BinanceWebsocketClient:
         on_pong,
         logger,
         proxies,
+        on_reconnect=None,
+        reconnect=True,
+        reconnect_backoff=1,
+        max_reconnect_backoff=60,
+        message_queue=None,
+        parse_events=False,
     ):
         return BinanceSocketManager(
             stream_url,
@@ -64,6 +86,12 @@ class BinanceWebsocketClient:
             on_pong=on_pong,
             logger=logger,
             proxies=proxies,
+            on_reconnect=on_reconnect,
+            reconnect=reconnect,
+            reconnect_backoff=reconnect_backoff,
+            max_reconnect_backoff=max_reconnect_backoff,
+            message_queue=message_queue,
+            parse_events=parse_events,
         )
 
     def _single_stream(self, stream):
@@ -77,29 +105,43 @@ class BinanceWebsocketClient:
     def send(self, message: dict):
         self.socket_manager.send_message(json.dumps(message))
 
-    def send_message_to_server(self, message, action=None, id=None):
+    def send_message_to_server(self, message, action=None, id=None, handler=None):
         if not id:
             id = get_timestamp()
 
         if action != self.ACTION_UNSUBSCRIBE:
-            return self.subscribe(message, id=id)
+            return self.subscribe(message, id=id, handler=handler)
         return self.unsubscribe(message, id=id)
 
-    def subscribe(self, stream, id=None):
+    def subscribe(self, stream, id=None, handler=None):
+        """subscribe to stream(s); with a handler, their messages are routed to it instead of
+        ``on_message``, which requires combined streams (``is_combined=True``)"""
+
         if not id:
             id = get_timestamp()
         if self._single_stream(stream):
             stream = [stream]
-        json_msg = json.dumps({"method": "SUBSCRIBE", "params": stream, "id": id})
-        self.socket_manager.send_message(json_msg)
+        if handler is not None:
+            for name in stream:
+                self._handlers[name] = handler
+        self.socket_manager.send_subscription("SUBSCRIBE", stream, id)
 
     def unsubscribe(self, stream, id=None):
         if not id:
             id = get_timestamp()
         if self._single_stream(stream):
             stream = [stream]
-        json_msg = json.dumps({"method": "UNSUBSCRIBE", "params": stream, "id": id})
-        self.socket_manager.send_message(json_msg)
+        self.socket_manager.send_subscription("UNSUBSCRIBE", stream, id)
+        for name in stream:
+            self._handlers.pop(name, None)
+
+    def _route(self, socket_manager, message):
+        handler = self._handlers.get(stream_name(message)) if self._handlers else None
+        if handler is None:
+            handler = self.on_message
+            if handler is None:
+                return
+        handler(socket_manager, message)
 
     def ping(self):
         self.logger.debug("Sending ping to Binance WebSocket Server")
@@ -0,0 +1,21 @@
+#!/usr/bin/env python
+import asyncio
+import logging
+from binance.um_futures import AsyncUMFutures
+from binance.lib.utils import config_logging
+
+config_logging(logging, logging.DEBUG)
+
+symbols = ["BTCUSDT", "ETHUSDT", "BNBUSDT"]
+
+
+async def main():
+    async with AsyncUMFutures() as um_futures_client:
+        prices = await asyncio.gather(
+            *[um_futures_client.mark_price(symbol) for symbol in symbols]
+        )
+        for price in prices:
+            logging.info(price)
+
+
+asyncio.run(main())
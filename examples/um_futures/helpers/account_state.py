@@ -0,0 +1,42 @@
+#!/usr/bin/env python
+
+import time
+import logging
+from binance.um_futures import UMFutures
+from binance.account_state import AccountState
+from binance.lib.utils import config_logging
+from binance.websocket.user_data_stream import UserDataStream
+
+config_logging(logging, logging.INFO)
+
+# HMAC authentication with API key and secret
+key = ""
+secret = ""
+
+
+def on_divergence(kind, key, local_value, rest_value):
+    logging.warning(
+        "{} {} was {} locally, {} on the exchange".format(
+            kind, key, local_value, rest_value
+        )
+    )
+
+
+client = UMFutures(key=key, secret=secret)
+stream = UserDataStream(client, on_reconnect=lambda *args: state.reconcile())
+state = AccountState(
+    client, user_data_stream=stream, reconcile_interval=300, on_divergence=on_divergence
+)
+
+for _ in range(6):
+    logging.info(
+        "BTCUSDT position {}, USDT balance {}, open orders {}".format(
+            state.position_amount("BTCUSDT"),
+            state.balance("USDT"),
+            state.open_orders("BTCUSDT"),
+        )
+    )
+    time.sleep(10)
+
+state.stop()
+stream.stop()
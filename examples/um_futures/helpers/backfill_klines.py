@@ -0,0 +1,23 @@
+#!/usr/bin/env python
+import logging
+from binance.um_futures import UMFutures
+from binance.kline_backfill import backfill_klines
+from binance.lib.rate_limiter import RateLimiter
+from binance.lib.utils import config_logging
+
+config_logging(logging, logging.INFO)
+
+um_futures_client = UMFutures(rate_limiter=RateLimiter(), pool_maxsize=8)
+
+# all the 1m klines of January 2024
+klines = backfill_klines(
+    um_futures_client.klines,
+    "BTCUSDT",
+    "1m",
+    start_time=1704067200000,
+    end_time=1706745600000,
+    max_workers=8,
+)
+logging.info(
+    "{} klines, last close {}".format(len(klines["close"]), klines["close"][-1])
+)
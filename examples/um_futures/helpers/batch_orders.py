@@ -0,0 +1,37 @@
+#!/usr/bin/env python
+import logging
+from binance.um_futures import UMFutures
+from binance.batch_orders import cancel_orders, place_orders
+from binance.lib.rate_limiter import RateLimiter
+from binance.lib.utils import config_logging
+
+config_logging(logging, logging.INFO)
+
+key = ""
+secret = ""
+
+um_futures_client = UMFutures(
+    key=key, secret=secret, rate_limiter=RateLimiter(), pool_maxsize=20
+)
+
+# a grid of 100 buy orders, sent as 20 concurrent batches of 5
+orders = [
+    {
+        "symbol": "BTCUSDT",
+        "side": "BUY",
+        "type": "LIMIT",
+        "quantity": "0.002",
+        "timeInForce": "GTC",
+        "price": str(50000 - 10 * level),
+    }
+    for level in range(100)
+]
+results = place_orders(um_futures_client, orders, max_workers=20)
+for order, result in zip(orders, results):
+    if isinstance(result, Exception):
+        logging.error("{} failed: {!r}".format(order["price"], result))
+
+order_ids = [
+    result["orderId"] for result in results if not isinstance(result, Exception)
+]
+logging.info(cancel_orders(um_futures_client, "BTCUSDT", order_ids=order_ids))
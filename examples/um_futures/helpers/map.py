@@ -0,0 +1,32 @@
+#!/usr/bin/env python
+import logging
+from binance.um_futures import UMFutures
+from binance.lib.rate_limiter import RateLimiter
+from binance.lib.utils import config_logging
+
+config_logging(logging, logging.INFO)
+
+symbols = ["BTCUSDT", "ETHUSDT", "BNBUSDT", "SOLUSDT", "XRPUSDT"]
+
+um_futures_client = UMFutures(rate_limiter=RateLimiter(), pool_maxsize=8)
+
+# one all-symbols request instead of five
+for symbol, mark_price in zip(
+    symbols,
+    um_futures_client.map(
+        um_futures_client.mark_price, [{"symbol": symbol} for symbol in symbols]
+    ),
+):
+    logging.info("{} {}".format(symbol, mark_price["markPrice"]))
+
+# five concurrent requests
+klines = um_futures_client.map(
+    um_futures_client.klines,
+    [{"symbol": symbol, "interval": "1h", "limit": 24} for symbol in symbols],
+    max_concurrency=8,
+)
+for symbol, result in zip(symbols, klines):
+    if isinstance(result, Exception):
+        logging.error("{}: {!r}".format(symbol, result))
+    else:
+        logging.info("{} {} klines".format(symbol, len(result)))
@@ -0,0 +1,25 @@
+#!/usr/bin/env python
+import logging
+import time
+from binance.um_futures import UMFutures
+from binance.lib.utils import config_logging
+from binance.market_snapshot import MarketSnapshot
+
+config_logging(logging, logging.INFO)
+
+um_futures_client = UMFutures()
+
+# 4 requests every 5 seconds, whatever the number of symbols
+snapshot = MarketSnapshot(um_futures_client, refresh_interval=5)
+
+for _ in range(3):
+    for symbol in ("BTCUSDT", "ETHUSDT", "BNBUSDT"):
+        bid, ask = snapshot.bid_ask(symbol)
+        logging.info(
+            "{} mark {} bid {} ask {}".format(
+                symbol, snapshot.mark_price(symbol), bid, ask
+            )
+        )
+    time.sleep(5)
+
+snapshot.stop()
@@ -0,0 +1,30 @@
+#!/usr/bin/env python
+import logging
+from binance.um_futures import UMFutures
+from binance.lib.utils import config_logging
+from binance.replace_order import replace_order
+
+config_logging(logging, logging.INFO)
+
+key = ""
+secret = ""
+
+um_futures_client = UMFutures(key=key, secret=secret)
+
+# move a stop loss: the old stop is cancelled once the new one is placed
+result = replace_order(
+    um_futures_client,
+    "BTCUSDT",
+    {
+        "side": "SELL",
+        "type": "STOP_MARKET",
+        "stopPrice": 59000,
+        "quantity": 0.01,
+        "reduceOnly": "true",
+    },
+    orderId=12345,
+)
+if result.ok:
+    logging.info("new stop {}".format(result.order["orderId"]))
+else:
+    logging.error(result)
@@ -0,0 +1,21 @@
+#!/usr/bin/env python
+import logging
+from binance.um_futures import UMFutures
+from binance.symbol_registry import SymbolRegistry
+from binance.lib.utils import config_logging
+from binance.error import ParameterArgumentError
+
+config_logging(logging, logging.DEBUG)
+
+um_futures_client = UMFutures()
+registry = SymbolRegistry(um_futures_client, refresh_interval=3600)
+
+btcusdt = registry["BTCUSDT"]
+price = btcusdt.round_price(67012.3456)
+quantity = btcusdt.round_qty(0.0123456)
+logging.info("price: {}, quantity: {}".format(price, quantity))
+
+try:
+    registry.validate_order("BTCUSDT", quantity, price)
+except ParameterArgumentError as error:
+    logging.error(error)
@@ -0,0 +1,32 @@
+#!/usr/bin/env python
+
+import asyncio
+import logging
+from binance.lib.utils import config_logging
+from binance.websocket.um_futures.websocket_client import (
+    AsyncUMFuturesWebsocketClient,
+)
+
+config_logging(logging, logging.INFO)
+
+symbols = ["btcusdt", "ethusdt", "bnbusdt"]
+
+
+async def collect(client, symbol, count=10):
+    received = 0
+    async for message in client.stream(
+        client.agg_trade(symbol), client.book_ticker(symbol)
+    ):
+        logging.info(message)
+        received += 1
+        if received == count:
+            break
+
+
+async def main():
+    # one connection per symbol, all on this event loop
+    async with AsyncUMFuturesWebsocketClient() as client:
+        await asyncio.gather(*[collect(client, symbol) for symbol in symbols])
+
+
+asyncio.run(main())
@@ -0,0 +1,30 @@
+#!/usr/bin/env python
+
+import time
+import logging
+from binance.lib.utils import config_logging
+from binance.um_futures import UMFutures
+from binance.websocket.order_book import OrderBookManager
+
+config_logging(logging, logging.INFO)
+
+
+def on_resync(symbol):
+    logging.info("{} order book out of sync, loading a new snapshot".format(symbol))
+
+
+books = OrderBookManager(UMFutures(), on_resync=on_resync)
+books.add("BTCUSDT")
+
+for _ in range(10):
+    time.sleep(1)
+    book = books["BTCUSDT"]
+    if book.synced:
+        logging.info(
+            "best bid {} best ask {} top 5 asks {}".format(
+                book.best_bid(), book.best_ask(), book.asks(5)
+            )
+        )
+
+logging.debug("closing ws connection")
+books.stop()
@@ -0,0 +1,35 @@
+#!/usr/bin/env python
+
+import time
+import logging
+from binance.lib.utils import config_logging
+from binance.um_futures import UMFutures
+from binance.websocket.sharded_client import ShardedWebsocketClient
+
+config_logging(logging, logging.INFO)
+
+
+def message_handler(_, message):
+    logging.debug(message)
+
+
+symbols = [
+    s["symbol"]
+    for s in UMFutures().exchange_info()["symbols"]
+    if s["status"] == "TRADING"
+]
+
+my_client = ShardedWebsocketClient(
+    on_message=message_handler, streams_per_connection=100
+)
+my_client.subscribe(["{}@depth@100ms".format(symbol.lower()) for symbol in symbols])
+logging.info(
+    "{} streams over {} connections".format(
+        len(my_client.streams), len(my_client.connections)
+    )
+)
+
+time.sleep(10)
+
+logging.debug("closing ws connections")
+my_client.stop()
@@ -0,0 +1,32 @@
+#!/usr/bin/env python
+
+import time
+import logging
+from binance.lib.utils import config_logging
+from binance.um_futures import UMFutures
+from binance.websocket.events import AccountUpdate, OrderTradeUpdate
+from binance.websocket.user_data_stream import UserDataStream
+
+config_logging(logging, logging.INFO)
+
+api_key = ""
+
+
+def on_event(event):
+    if isinstance(event, OrderTradeUpdate):
+        logging.info(
+            "{} order {} {}, filled {}".format(
+                event.symbol, event.client_order_id, event.status, event.filled_quantity
+            )
+        )
+    elif isinstance(event, AccountUpdate):
+        for position in event.positions:
+            logging.info(position)
+
+
+stream = UserDataStream(UMFutures(key=api_key), on_event=on_event)
+
+time.sleep(60)
+
+logging.debug("closing user data stream")
+stream.stop()
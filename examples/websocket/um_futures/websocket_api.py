@@ -0,0 +1,38 @@
+#!/usr/bin/env python
+
+import logging
+from binance.error import ClientError
+from binance.lib.utils import config_logging
+from binance.um_futures import UMFutures
+from binance.websocket.um_futures.websocket_api import UMFuturesWebsocketAPIClient
+
+config_logging(logging, logging.INFO)
+
+api_key = ""
+api_secret = ""
+
+api = UMFuturesWebsocketAPIClient(UMFutures(key=api_key, secret=api_secret))
+
+try:
+    order = api.new_order(
+        symbol="BTCUSDT",
+        side="BUY",
+        type="LIMIT",
+        quantity=0.002,
+        timeInForce="GTC",
+        price=50000,
+    ).result(timeout=5)
+    logging.info(order)
+    logging.info(
+        api.cancel_order(symbol="BTCUSDT", orderId=order["orderId"]).result(timeout=5)
+    )
+    logging.info(api.get_position_risk(symbol="BTCUSDT").result(timeout=5))
+except ClientError as error:
+    logging.error(
+        "Found error. status: {}, error code: {}, error message: {}".format(
+            error.status_code, error.error_code, error.error_message
+        )
+    )
+
+logging.debug("closing ws connection")
+api.stop()
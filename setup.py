@@ -36,6 +36,7 @@ setup(
     url=URL,
     keywords=["Binance futures", "Public API"],
     install_requires=[req for req in requirements],
+    extras_require={"async": ["aiohttp>=3.8.0"], "speedups": ["orjson>=3.6.0"]},
     packages=find_packages(exclude=("tests",)),
     classifiers=[
         "Intended Audience :: Developers",
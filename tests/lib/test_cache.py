@@ -0,0 +1,123 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import pytest
+
+from binance.lib.cache import ResponseCache
+
+path = "/fapi/v1/exchangeInfo"
+
+
+class Loader(object):
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, value="response"):
+        self.calls += 1
+        return value
+
+
+def test_key_ignores_volatile_params():
+    cache = ResponseCache()
+
+    assert cache.key(path, {"b": 2, "a": 1, "timestamp": 1, "signature": "s"}) == (
+        cache.key(path, {"a": 1, "b": 2, "recvWindow": 5000, "c": None})
+    )
+
+
+def test_uncached_paths_are_always_loaded():
+    cache, load = ResponseCache(), Loader()
+
+    cache.get_or_load("/fapi/v1/depth", {}, load)
+    cache.get_or_load("/fapi/v1/depth", {}, load)
+
+    assert load.calls == 2
+
+
+def test_concurrent_requests_are_coalesced():
+    cache, calls = ResponseCache(), []
+    loading, release = threading.Event(), threading.Event()
+
+    def load():
+        calls.append(1)
+        loading.set()
+        release.wait(5)
+        return "response"
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = [executor.submit(cache.get_or_load, path, {}, load) for _ in range(8)]
+        loading.wait(5)
+        # let the other callers find the pending request
+        time.sleep(0.1)
+        release.set()
+
+    assert [result.result() for result in results] == ["response"] * 8
+    assert len(calls) == 1
+
+
+def test_failed_load_is_raised_to_all_waiters_and_not_cached():
+    cache, load = ResponseCache(), Loader()
+    release = threading.Event()
+
+    def fail():
+        release.wait(5)
+        raise ConnectionError()
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = [executor.submit(cache.get_or_load, path, {}, fail) for _ in range(4)]
+        release.set()
+    for result in results:
+        with pytest.raises(ConnectionError):
+            result.result()
+
+    assert cache.get_or_load(path, {}, load) == "response"
+    assert load.calls == 1
+
+
+def test_async_concurrent_requests_are_coalesced():
+    cache, calls = ResponseCache(), []
+
+    async def load():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "response"
+
+    async def main():
+        return await asyncio.gather(
+            *[cache.async_get_or_load(path, {}, load) for _ in range(8)]
+        )
+
+    assert asyncio.run(main()) == ["response"] * 8
+    assert len(calls) == 1
+
+
+def test_responses_expire_after_their_ttl():
+    cache, load = ResponseCache(ttl={path: 10}), Loader()
+    clock = mock.Mock()
+    with mock.patch("binance.lib.cache.time", clock):
+        clock.monotonic.return_value = 100
+        cache.get_or_load(path, {}, load)
+        clock.monotonic.return_value = 109
+        cache.get_or_load(path, {}, load)
+        assert load.calls == 1
+
+        clock.monotonic.return_value = 110
+        cache.get_or_load(path, {}, load)
+        assert load.calls == 2
+
+
+def test_least_recently_used_response_is_evicted():
+    cache, load = ResponseCache(maxsize=2), Loader()
+    cache.get_or_load(path, {"symbol": "A"}, load)
+    cache.get_or_load(path, {"symbol": "B"}, load)
+    cache.get_or_load(path, {"symbol": "A"}, load)
+
+    cache.get_or_load(path, {"symbol": "C"}, load)
+    cache.get_or_load(path, {"symbol": "A"}, load)
+    assert load.calls == 3
+
+    cache.get_or_load(path, {"symbol": "B"}, load)
+    assert load.calls == 4
@@ -0,0 +1,54 @@
+import pytest
+
+from binance.error import RateLimitError
+from binance.lib.rate_limiter import RateLimiter
+
+
+def test_weight_table():
+    limiter = RateLimiter()
+
+    assert limiter.weight("/fapi/v1/depth", {"limit": 1000}) == 20
+    assert limiter.weight("/fapi/v1/ticker/24hr", {}) == 40
+    assert limiter.weight("/fapi/v1/ticker/24hr", {"symbol": "BTCUSDT"}) == 1
+    assert limiter.weight("/fapi/v1/order", {}, "POST") == 0
+    assert limiter.weight("/fapi/v1/order", {}, "DELETE") == 1
+    assert limiter.weight("/fapi/v1/unknown") == 1
+
+
+def test_used_weight_header_syncs_the_bucket():
+    limiter = RateLimiter(weight_limit=100, max_delay=0)
+    limiter.acquire("GET", "/fapi/v1/time")
+
+    limiter.update(200, {"X-MBX-USED-WEIGHT-1M": "100"})
+
+    with pytest.raises(RateLimitError):
+        limiter.acquire("GET", "/fapi/v1/time")
+
+
+def test_header_below_local_usage_keeps_the_local_count():
+    limiter = RateLimiter(weight_limit=100, max_delay=0)
+    limiter.acquire("GET", "/fapi/v1/ticker/24hr")
+    limiter.acquire("GET", "/fapi/v1/ticker/24hr")
+
+    limiter.update(200, {"X-MBX-USED-WEIGHT-1M": "1"})
+
+    with pytest.raises(RateLimitError):
+        limiter.acquire("GET", "/fapi/v1/ticker/24hr")
+
+
+def test_order_count_header_syncs_the_order_buckets():
+    limiter = RateLimiter(order_limit_10s=10, max_delay=0)
+
+    limiter.update(200, {"X-MBX-ORDER-COUNT-10S": "10"})
+
+    assert limiter.acquire("GET", "/fapi/v1/order") == 0
+    with pytest.raises(RateLimitError):
+        limiter.acquire("POST", "/fapi/v1/order")
+
+
+def test_retry_after_pauses_all_requests():
+    limiter = RateLimiter()
+
+    limiter.update(429, {"Retry-After": "3"})
+
+    assert 2.9 < limiter.acquire("GET", "/fapi/v1/time") <= 3
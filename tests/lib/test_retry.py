@@ -0,0 +1,81 @@
+import asyncio
+
+import requests
+from urllib3.exceptions import MaxRetryError, NewConnectionError
+
+from binance.error import ClientError, ServerError
+from binance.lib.retry import RetryPolicy
+
+
+def connection_refused():
+    reason = NewConnectionError(None, "Connection refused")
+    return requests.exceptions.ConnectionError(MaxRetryError(None, "/", reason))
+
+
+def test_rejected_errors_are_retried_for_any_method():
+    policy = RetryPolicy(backoff_factor=0)
+    for error in (
+        ClientError(429, -1003, "Too many requests", {}),
+        ClientError(418, -1003, "Banned", {}),
+        ClientError(400, -1021, "Timestamp outside recvWindow", {}),
+        requests.exceptions.ConnectTimeout(),
+        connection_refused(),
+    ):
+        assert policy.get_delay("POST", error, 0, 0) == 0
+
+
+def test_unknown_outcome_is_only_retried_for_idempotent_methods():
+    policy = RetryPolicy(backoff_factor=0)
+    for error in (
+        ServerError(503, "Service Unavailable"),
+        requests.exceptions.ConnectionError("Connection reset by peer"),
+        requests.exceptions.ReadTimeout(),
+        asyncio.TimeoutError(),
+    ):
+        assert policy.get_delay("GET", error, 0, 0) == 0
+        assert policy.get_delay("POST", error, 0, 0) is None
+        assert policy.get_delay("POST", error, 0, 0, idempotent=True) == 0
+
+
+def test_other_errors_are_not_retried():
+    policy = RetryPolicy()
+    for error in (
+        ClientError(400, -1121, "Invalid symbol.", {}),
+        ServerError(501, "Not Implemented"),
+        ValueError(),
+    ):
+        assert policy.get_delay("GET", error, 0, 0) is None
+
+
+def test_retry_after_is_waited():
+    policy = RetryPolicy(backoff_factor=0)
+    error = ClientError(429, -1003, "Too many requests", {"Retry-After": "2"})
+
+    assert policy.get_delay("GET", error, 0, 0) == 2
+
+
+def test_retries_and_total_timeout_are_bounded():
+    policy = RetryPolicy(max_retries=2, backoff_factor=0, total_timeout=5)
+    error = ServerError(503, "Service Unavailable")
+    rejected = ClientError(429, -1003, "Too many requests", {"Retry-After": "2"})
+
+    assert policy.get_delay("GET", error, 1, 0) == 0
+    assert policy.get_delay("GET", error, 2, 0) is None
+    assert policy.get_delay("GET", rejected, 0, 4) is None
+
+
+def test_order_resolution_classification():
+    policy = RetryPolicy()
+    duplicate = ClientError(400, -4116, "ClientOrderId is duplicated.", {})
+
+    assert policy.should_resolve_order(ServerError(503, "Service Unavailable"), 0)
+    assert policy.should_resolve_order(requests.exceptions.ReadTimeout(), 0)
+    assert not policy.should_resolve_order(connection_refused(), 0)
+    assert not policy.should_resolve_order(requests.exceptions.ConnectTimeout(), 0)
+    assert not policy.should_resolve_order(duplicate, 0)
+    assert policy.should_resolve_order(duplicate, 1)
+    assert policy.is_order_placement("POST", "/fapi/v1/order")
+    assert not policy.is_order_placement("DELETE", "/fapi/v1/order")
+    assert not RetryPolicy(resolve_orders=False).is_order_placement(
+        "POST", "/fapi/v1/order"
+    )
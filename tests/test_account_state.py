@@ -0,0 +1,93 @@
+from types import SimpleNamespace
+from unittest import mock
+
+from binance.account_state import AccountState
+
+open_order = {
+    "symbol": "BTCUSDT",
+    "orderId": 1,
+    "clientOrderId": "abc",
+    "side": "BUY",
+    "type": "LIMIT",
+    "price": "100",
+    "origQty": "1",
+    "executedQty": "0",
+    "status": "NEW",
+}
+
+
+def order_update(client_order_id, status):
+    return SimpleNamespace(
+        event_type="ORDER_TRADE_UPDATE",
+        client_order_id=client_order_id,
+        status=status,
+    )
+
+
+def rest_client(orders):
+    client = mock.Mock()
+    client.account.return_value = {"assets": [{"asset": "USDT", "walletBalance": "10"}]}
+    client.get_position_risk.return_value = []
+    client.get_orders.side_effect = orders
+    return client
+
+
+def test_events_during_seeding_are_kept():
+    user_data_stream = mock.Mock()
+
+    def orders():
+        # filled while the snapshot is being fetched
+        (listener,) = user_data_stream.add_listener.call_args.args
+        listener(order_update("abc", "FILLED"))
+        return [open_order]
+
+    state = AccountState(
+        rest_client(orders), user_data_stream=user_data_stream, reconcile_interval=None
+    )
+
+    assert state.get_order("abc") is None
+    assert state.balance("USDT") == 10.0
+
+
+def test_reconcile_reports_and_fixes_divergences():
+    client = rest_client(lambda: [open_order])
+    divergences = []
+    state = AccountState(
+        client,
+        reconcile_interval=None,
+        on_divergence=lambda *divergence: divergences.append(divergence),
+    )
+    state.apply(order_update("abc", "CANCELED"))
+    client.account.return_value = {"assets": [{"asset": "USDT", "walletBalance": "12"}]}
+
+    state.reconcile()
+
+    assert divergences == [
+        ("balance", "USDT", 10.0, 12.0),
+        ("order", "abc", None, ("NEW", 0.0)),
+    ]
+    assert state.balance("USDT") == 12.0
+    assert state.get_order("abc").status == "NEW"
+
+
+def test_event_times_are_only_kept_while_fetching():
+    user_data_stream = mock.Mock()
+
+    def orders():
+        listener(order_update("abc", "FILLED"))
+        assert ("order", "abc") in state._updated
+        return []
+
+    state = AccountState(
+        rest_client(lambda: []),
+        user_data_stream=user_data_stream,
+        reconcile_interval=None,
+    )
+    (listener,) = user_data_stream.add_listener.call_args.args
+    for i in range(100):
+        listener(order_update(str(i), "CANCELED"))
+    assert state._updated == {}
+
+    state.client.get_orders.side_effect = orders
+    state.reconcile()
+    assert state._updated == {}
@@ -0,0 +1,91 @@
+import asyncio
+from unittest import mock
+
+from binance.error import ClientError, ServerError
+from binance.replace_order import (
+    _can_modify,
+    _fall_back,
+    async_replace_order,
+    replace_order,
+)
+
+stop = {"side": "SELL", "type": "STOP_MARKET", "stopPrice": 59000, "quantity": 1}
+limit = {
+    "side": "BUY",
+    "type": "LIMIT",
+    "quantity": 1,
+    "price": 100,
+    "timeInForce": "GTC",
+}
+would_trigger = ClientError(400, -2021, "Order would immediately trigger.", None)
+
+
+def test_can_modify():
+    assert _can_modify(limit)
+    assert not _can_modify(stop)
+    assert not _can_modify({"side": "BUY", "type": "LIMIT", "price": 100})
+    assert not _can_modify(dict(limit, reduceOnly="true"))
+
+
+def test_fall_back():
+    assert _fall_back(ClientError(400, -4028, "Price is invalid.", None))
+    assert not _fall_back(ClientError(400, -2013, "Order does not exist.", None))
+    assert not _fall_back(ServerError(503, "Service Unavailable"))
+
+
+def test_limit_order_is_modified():
+    client = mock.Mock()
+    client.modify_order.return_value = {"orderId": 1}
+
+    result = replace_order(client, "BTCUSDT", limit, orderId=1)
+
+    assert result.modified and result.ok
+    client.modify_order.assert_called_once_with(
+        "BTCUSDT", orderId=1, origClientOrderId=None, side="BUY", quantity=1, price=100
+    )
+    client.new_order.assert_not_called()
+
+
+def test_refused_modification_falls_back_to_a_new_order():
+    client = mock.Mock()
+    client.modify_order.side_effect = ClientError(400, -4028, "Price is invalid.", None)
+    client.new_order.return_value = {"orderId": 2}
+    client.cancel_order.return_value = {"orderId": 1}
+
+    result = replace_order(client, "BTCUSDT", limit, orderId=1)
+
+    assert not result.modified and result.ok
+    assert result.order == {"orderId": 2}
+
+
+def test_old_order_is_cancelled_after_the_new_one_is_placed():
+    client = mock.Mock()
+    client.new_order.return_value = {"orderId": 2}
+    client.cancel_order.return_value = {"orderId": 1}
+
+    result = replace_order(client, "BTCUSDT", stop, orderId=1)
+
+    assert result.ok
+    assert [call[0] for call in client.method_calls] == ["new_order", "cancel_order"]
+
+
+def test_rejected_placement_keeps_the_old_order():
+    client = mock.Mock()
+    client.new_order.side_effect = would_trigger
+
+    result = replace_order(client, "BTCUSDT", stop, orderId=1)
+
+    assert result.order_error is would_trigger
+    assert result.cancelled is None and result.cancel_error is None
+    client.cancel_order.assert_not_called()
+
+
+def test_async_rejected_placement_keeps_the_old_order():
+    client = mock.Mock()
+    client.new_order = mock.AsyncMock(side_effect=would_trigger)
+    client.cancel_order = mock.AsyncMock()
+
+    result = asyncio.run(async_replace_order(client, "BTCUSDT", stop, orderId=1))
+
+    assert result.order_error is would_trigger
+    client.cancel_order.assert_not_called()
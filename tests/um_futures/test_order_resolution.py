@@ -0,0 +1,104 @@
+import re
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+import responses
+
+from binance.error import ClientError, ServerError
+from binance.lib.retry import RetryPolicy
+from binance.um_futures import UMFutures
+
+order_url = re.compile(r".*/fapi/v1/order\?.*")
+order = {"orderId": 1, "clientOrderId": "abc", "status": "NEW"}
+unknown_order = {"code": -2013, "msg": "Order does not exist."}
+duplicate_order = {"code": -4116, "msg": "ClientOrderId is duplicated."}
+
+
+def client():
+    return UMFutures(
+        key="key", secret="secret", retry_policy=RetryPolicy(backoff_factor=0)
+    )
+
+
+def new_order(client):
+    return client.new_order(
+        symbol="BTCUSDT",
+        side="BUY",
+        type="LIMIT",
+        quantity=1,
+        price=100,
+        timeInForce="GTC",
+    )
+
+
+def sent(method):
+    return [
+        parse_qs(urlparse(call.request.url).query)
+        for call in responses.calls
+        if call.request.method == method
+    ]
+
+
+@responses.activate
+def test_placed_order_is_returned_after_an_unknown_outcome():
+    responses.add(responses.POST, order_url, json={}, status=503)
+    responses.add(responses.GET, order_url, json=order)
+
+    assert new_order(client()) == order
+
+    placed, looked_up = sent("POST"), sent("GET")
+    assert len(placed) == 1
+    assert looked_up[0]["origClientOrderId"] == placed[0]["newClientOrderId"]
+
+
+@responses.activate
+def test_missing_order_is_sent_again_with_the_same_id():
+    responses.add(responses.POST, order_url, json={}, status=503)
+    responses.add(responses.GET, order_url, json=unknown_order, status=400)
+    responses.add(responses.POST, order_url, json=order)
+
+    assert new_order(client()) == order
+
+    first, retry = sent("POST")
+    assert first["newClientOrderId"] == retry["newClientOrderId"]
+
+
+@responses.activate
+def test_duplicate_id_on_retry_returns_the_placed_order():
+    responses.add(responses.POST, order_url, json={}, status=503)
+    responses.add(responses.GET, order_url, json=unknown_order, status=400)
+    responses.add(responses.POST, order_url, json=duplicate_order, status=400)
+    responses.add(responses.GET, order_url, json=order)
+
+    assert new_order(client()) == order
+    assert len(sent("POST")) == 2
+    assert len(sent("GET")) == 2
+
+
+@responses.activate
+def test_failed_lookup_raises_the_original_error():
+    responses.add(responses.POST, order_url, json={}, status=503)
+    responses.add(
+        responses.GET,
+        order_url,
+        json={"code": -2015, "msg": "Invalid API-key, IP, or permissions for action."},
+        status=401,
+    )
+
+    with pytest.raises(ServerError):
+        new_order(client())
+    assert len(sent("POST")) == 1
+
+
+@responses.activate
+def test_rejected_placement_is_not_looked_up():
+    responses.add(
+        responses.POST,
+        order_url,
+        json={"code": -2019, "msg": "Margin is insufficient."},
+        status=400,
+    )
+
+    with pytest.raises(ClientError):
+        new_order(client())
+    assert not sent("GET")
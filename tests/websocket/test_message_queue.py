@@ -0,0 +1,113 @@
+import json
+import threading
+
+import pytest
+
+from binance.error import ParameterArgumentError
+from binance.websocket.message_queue import MessageQueue
+
+
+def message(stream, value):
+    return json.dumps(
+        {"stream": stream, "data": {"value": value}}, separators=(",", ":")
+    )
+
+
+def handle_all(queue, handler):
+    """start the workers on the queued messages and wait until they are handled"""
+
+    threads = []
+    queue.start(handler)
+    threads.extend(queue._threads)
+    queue.stop(handler)
+    for thread in threads:
+        thread.join(5)
+
+
+def test_unknown_overflow_is_refused():
+    with pytest.raises(ParameterArgumentError):
+        MessageQueue(overflow="drop_newest")
+
+
+def test_drop_oldest():
+    queue = MessageQueue(maxsize=2, overflow="drop_oldest")
+    handled = []
+
+    for value in range(3):
+        queue.put(handled.append, value)
+    handle_all(queue, handled.append)
+
+    assert handled == [1, 2]
+    assert queue.dropped == 1
+
+
+def test_conflate_keeps_the_latest_message_of_each_stream():
+    queue = MessageQueue(overflow="conflate")
+    handled = []
+
+    queue.put(handled.append, message("btcusdt@markPrice", 1))
+    queue.put(handled.append, message("ethusdt@markPrice", 1))
+    queue.put(handled.append, message("btcusdt@markPrice", 2))
+    queue.put(handled.append, "raw")
+    queue.put(handled.append, "raw")
+
+    assert queue.qsize() == 4
+    assert queue.conflated == 1
+    handle_all(queue, handled.append)
+    assert handled == [
+        message("btcusdt@markPrice", 2),
+        message("ethusdt@markPrice", 1),
+        "raw",
+        "raw",
+    ]
+
+
+def test_conflate_on_a_full_queue_drops_nothing():
+    queue = MessageQueue(maxsize=2, overflow="conflate")
+    handled = []
+
+    queue.put(handled.append, message("btcusdt@markPrice", 1))
+    queue.put(handled.append, message("ethusdt@markPrice", 1))
+    queue.put(handled.append, message("ethusdt@markPrice", 2))
+    queue.put(handled.append, message("bnbusdt@markPrice", 1))
+    handle_all(queue, handled.append)
+
+    assert queue.conflated == 1
+    assert queue.dropped == 1
+    assert handled == [message("ethusdt@markPrice", 2), message("bnbusdt@markPrice", 1)]
+
+
+def test_block_waits_for_room():
+    queue = MessageQueue(maxsize=1)
+    handled = []
+    queue.put(handled.append, 1)
+    writer = threading.Thread(target=queue.put, args=(handled.append, 2))
+    writer.start()
+
+    writer.join(0.1)
+    assert writer.is_alive()
+
+    queue.start(handled.append)
+    writer.join(5)
+    threads = list(queue._threads)
+    queue.stop(handled.append)
+    for thread in threads:
+        thread.join(5)
+    assert handled == [1, 2]
+    assert queue.dropped == 0
+
+
+def test_handler_errors_do_not_stop_the_workers():
+    queue = MessageQueue()
+    handled = []
+
+    def handler(value):
+        if value == 1:
+            raise ValueError()
+        handled.append(value)
+
+    queue.put(handler, 1)
+    queue.put(handler, 2)
+    handle_all(queue, handler)
+
+    assert handled == [2]
@@ -0,0 +1,84 @@
+from binance.websocket.order_book import OrderBook
+
+snapshot = {
+    "lastUpdateId": 100,
+    "bids": [["99.0", "1.0"], ["98.0", "2.0"]],
+    "asks": [["101.0", "1.5"], ["102.0", "3.0"]],
+}
+
+
+def depth_update(first, last, previous, bids=(), asks=()):
+    return {
+        "e": "depthUpdate",
+        "E": last,
+        "s": "BTCUSDT",
+        "U": first,
+        "u": last,
+        "pu": previous,
+        "b": list(bids),
+        "a": list(asks),
+    }
+
+
+def loaded_book():
+    book = OrderBook("BTCUSDT")
+    book.load_snapshot(snapshot)
+    return book
+
+
+def test_events_before_the_snapshot_are_refused():
+    book = OrderBook("BTCUSDT")
+
+    assert not book.synced
+    assert not book.apply(depth_update(90, 95, 89))
+
+
+def test_events_older_than_the_snapshot_are_skipped():
+    book = loaded_book()
+
+    assert book.apply(depth_update(90, 99, 89, bids=[["99.0", "0"]]))
+    assert book.best_bid() == (99.0, 1.0)
+    assert book.last_update_id == 100
+
+
+def test_first_event_must_straddle_the_snapshot():
+    assert not loaded_book().apply(depth_update(101, 105, 100))
+
+    book = loaded_book()
+    assert book.apply(depth_update(98, 105, 97, bids=[["99.5", "4.0"]]))
+    assert book.last_update_id == 105
+    assert book.best_bid() == (99.5, 4.0)
+
+
+def test_following_events_are_chained_by_pu():
+    book = loaded_book()
+    book.apply(depth_update(98, 105, 97))
+
+    assert book.apply(depth_update(106, 110, 105, asks=[["101.0", "0"]]))
+    assert book.best_ask() == (102.0, 3.0)
+    assert not book.apply(depth_update(115, 120, 112))
+    assert book.last_update_id == 110
+
+
+def test_levels():
+    book = loaded_book()
+    book.apply(
+        depth_update(
+            98, 105, 97, bids=[["98.0", "0"], ["97.0", "5.0"]], asks=[["100.5", "1"]]
+        )
+    )
+
+    assert book.bids() == [(99.0, 1.0), (97.0, 5.0)]
+    assert book.asks(limit=2) == [(100.5, 1.0), (101.0, 1.5)]
+    assert book.bids_above(98.0) == [(99.0, 1.0)]
+    assert book.asks_below(101.0) == [(100.5, 1.0), (101.0, 1.5)]
+    assert book.mid_price() == 99.75
+
+
+def test_reset_unsyncs_the_book():
+    book = loaded_book()
+    book.reset()
+
+    assert not book.synced
+    assert book.best_bid() is None
+    assert not book.apply(depth_update(98, 105, 97))
@@ -0,0 +1,72 @@
+from binance.websocket.sharded_client import ShardedWebsocketClient
+
+calls = []
+
+
+class FakeWebsocketClient(object):
+    def __init__(self, on_message=None, on_reconnect=None, is_combined=False):
+        self._handlers = {}
+        self.socket_manager = None
+
+    def subscribe(self, stream, id=None, handler=None):
+        calls.append(("subscribe", self, list(stream)))
+        for name in stream:
+            self._handlers[name] = handler
+
+    def unsubscribe(self, stream, id=None):
+        calls.append(("unsubscribe", self, list(stream)))
+        for name in stream:
+            self._handlers.pop(name, None)
+
+    def stop(self):
+        calls.append(("stop", self, []))
+
+
+def sharded_client():
+    del calls[:]
+    return ShardedWebsocketClient(
+        websocket_client_class=FakeWebsocketClient, streams_per_connection=3
+    )
+
+
+def test_streams_fill_the_connections_in_turn():
+    client = sharded_client()
+
+    client.subscribe(["a@trade", "b@trade", "c@trade", "d@trade"])
+
+    first, second = client.connections
+    assert [name for name, c in client._streams.items() if c is first] == [
+        "a@trade",
+        "b@trade",
+        "c@trade",
+    ]
+    assert client._streams["d@trade"] is second
+
+
+def test_empty_connections_are_closed():
+    client = sharded_client()
+    client.subscribe(["a@trade", "b@trade", "c@trade", "d@trade"])
+    first, second = client.connections
+
+    client.unsubscribe("d@trade")
+
+    assert client.connections == [first]
+    assert calls[-1] == ("stop", second, [])
+
+
+def test_rebalance_subscribes_before_unsubscribing():
+    client = sharded_client()
+    handler = object()
+    client.subscribe(["a@trade", "b@trade", "c@trade"], handler=handler)
+    client.subscribe("d@trade")
+    first, second = client.connections
+    del calls[:]
+
+    client.rebalance()
+
+    assert calls == [
+        ("subscribe", second, ["c@trade"]),
+        ("unsubscribe", first, ["c@trade"]),
+    ]
+    assert client._streams["c@trade"] is second
+    assert second._handlers["c@trade"] is handler
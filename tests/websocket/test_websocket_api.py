@@ -0,0 +1,85 @@
+import json
+from unittest import mock
+
+import pytest
+from Crypto.PublicKey import ECC, RSA
+
+from binance.um_futures import UMFutures
+from binance.websocket.um_futures.websocket_api import UMFuturesWebsocketAPIClient
+
+
+def websocket_api(client):
+    with mock.patch(
+        "binance.websocket.um_futures.websocket_api.BinanceSocketManager"
+    ) as socket_manager:
+        socket_manager.return_value.ws.connected = True
+        return UMFuturesWebsocketAPIClient(client)
+
+
+def sent_requests(api):
+    return [
+        json.loads(call.args[0])
+        for call in api.socket_manager.send_message.call_args_list
+    ]
+
+
+@pytest.mark.parametrize(
+    "client",
+    [
+        UMFutures(key="key", secret="secret"),
+        UMFutures(key="key", private_key=RSA.generate(2048).export_key()),
+        UMFutures(
+            key="key",
+            private_key=ECC.generate(curve="ed25519").export_key(format="PEM"),
+        ),
+    ],
+    ids=["hmac", "rsa", "ed25519"],
+)
+def test_requests_are_signed(client):
+    api = websocket_api(client)
+
+    future = api.new_order(symbol="BTCUSDT", side="BUY", type="MARKET", quantity=1)
+
+    assert not future.done()
+    (request,) = sent_requests(api)
+    assert request["method"] == "order.place"
+    assert isinstance(request["params"]["signature"], str)
+    assert request["params"]["apiKey"] == "key"
+
+
+def test_responses_resolve_their_request():
+    api = websocket_api(UMFutures(key="key", secret="secret"))
+    placed = api.new_order(symbol="BTCUSDT", side="BUY", type="MARKET", quantity=1)
+    rejected = api.cancel_order(symbol="BTCUSDT", orderId=1)
+    placed_id, rejected_id = [request["id"] for request in sent_requests(api)]
+
+    api._on_message(
+        None,
+        json.dumps(
+            {
+                "id": rejected_id,
+                "status": 400,
+                "error": {"code": -2011, "msg": "Unknown order sent."},
+            }
+        ),
+    )
+    api._on_message(
+        None, json.dumps({"id": placed_id, "status": 200, "result": {"orderId": 2}})
+    )
+
+    assert placed.result() == {"orderId": 2}
+    assert rejected.exception().error_code == -2011
+
+
+def test_cancelled_request_leaves_the_others_pending():
+    api = websocket_api(UMFutures(key="key", secret="secret"))
+    cancelled = api.new_order(symbol="BTCUSDT", side="BUY", type="MARKET", quantity=1)
+    pending = api.new_order(symbol="ETHUSDT", side="BUY", type="MARKET", quantity=1)
+    cancelled_id = sent_requests(api)[0]["id"]
+
+    assert cancelled.cancel()
+    api._on_message(None, json.dumps({"id": cancelled_id, "status": 200, "result": {}}))
+
+    assert not pending.done()
+    api._on_error(None, ConnectionResetError())
+    assert isinstance(pending.exception(), ConnectionError)